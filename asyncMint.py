@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+from web3 import Web3, AsyncWeb3
+from eth_account import Account
+from concurrent.futures import ThreadPoolExecutor
+import asyncio, functools, time
+
+from mintCommon import (
+    SEA_DROP_ADDR, MULTIMINT_ADDR, MULTIMINT_V2_ADDR, SUPPORTED_CHAIN_IDS,
+    get_contract, MULTI_FRAGMENTS, to_checksum, parse_gwei_input, gwei_from_wei,
+)
+from nonceManager import NONCES
+from receiptTracker import get_tracker
+from replacementManager import send_with_replacement
+from rpcPool import MultiRPCProvider, AsyncMultiRPCProvider
+from feeEngine import FeeEngine
+from multicallPreflight import wallet_matrix, MULTICALL3_ADDR
+from hdWallet import prompt_wallet_keys
+
+# Concurrent multi-wallet mint engine --------------------------------------------
+# One process, one shared AsyncWeb3 (one pooled aiohttp session), many wallets.
+# Every wallet runs build -> estimate_gas -> sign -> send_raw_transaction -> receipt
+# at the same time, limited by a semaphore. The blocking send stage (raw tx fanned out
+# to every RPC, receipt wait, same-nonce fee bump when stuck) runs on an executor sized
+# to the concurrency, so it never caps the wallets in flight below it.
+
+DEFAULT_CONCURRENCY = 50
+RECEIPT_TIMEOUT = 600
+
+
+async def _mint_wallet(w3, sync_w3, executor, multi_contract, acct, nft_addr, total, value, chain_id, fee_engine,
+                       sem, balance=None, journal=None, kind="mint"):
+    """
+    Run the full mint pipeline for one wallet.
+    fee_engine: fees read when the tx is built (cache kept fresh by the receipt tracker's blocks).
+    balance: already known from the aggregated preflight (None -> read it here).
+    journal: optional MintJournal, gets the hash sent, the receipt and (kind "mint", V1) the decoded mint.
+    Returns a result dict (never raises) so one bad wallet can't stop the others.
+    """
+    result = {
+        "address": acct.address,
+        "status": "pending",
+        "tx_hash": None,
+        "gas_used": None,
+        "error": None,
+        "seconds": 0.0,
+    }
+    async with sem:
+        t0 = time.perf_counter()
+        try:
+            bal = balance if balance is not None else await w3.eth.get_balance(acct.address)
+            if bal < value:
+                result["status"] = "skipped"
+                result["error"] = "Not Enought Native Balance"
+                return result
+
+            loop = asyncio.get_running_loop()
+            func = multi_contract.functions.mintMulti(total, nft_addr)
+            estimated_gas = await func.estimate_gas({"from": acct.address, "value": value})
+            fees = await loop.run_in_executor(executor, fee_engine.fees)
+
+            # all fields filled -> build_transaction makes no RPC call (placeholder nonce, real one below)
+            tx = await func.build_transaction({
+                "chainId": chain_id,
+                "from": acct.address,
+                "value": value,
+                "gas": int(estimated_gas * 1.2),
+                **fees,
+                "nonce": 0,
+            })
+            # nonce taken once the tx is built; given back if anything fails before the send
+            nonce = tx["nonce"] = await NONCES.async_next_nonce(w3, acct.address, chain_id)
+
+            def on_sent(tx_hash, fees):
+                if result["tx_hash"] is None:
+                    print(f"[{acct.address}] Sent Tx : ", tx_hash)
+                result["tx_hash"] = tx_hash
+                if journal is not None:
+                    journal.record_sent(chain_id, acct.address, nonce, tx_hash, kind, nft_addr, total, fees)
+
+            # sign, send, receipt through the shared tracker, stuck -> bumped on the same nonce; blocking,
+            # so off the event loop (web3's sync and async session caches share one lock)
+            res = await loop.run_in_executor(executor, functools.partial(
+                send_with_replacement, sync_w3, acct, tx, fee_engine, timeout=RECEIPT_TIMEOUT, on_sent=on_sent,
+                kind="mint"))
+            receipt = res["receipt"]
+            result["tx_hash"] = res["landed_hash"]
+            result["gas_used"] = receipt.gasUsed
+            result["status"] = "success" if receipt.status == 1 else "reverted"
+            if journal is not None:
+                journal.record_receipt(result["tx_hash"], receipt)
+                if kind == "mint" and receipt.status == 1:
+                    from mintJournal import record_mint_receipt
+                    record_mint_receipt(journal, chain_id, acct.address, receipt, multi_contract.address)
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = str(e)
+        finally:
+            result["seconds"] = time.perf_counter() - t0
+    return result
+
+
+async def run_mint_engine(rpc, private_keys, nft_addr, total, concurrency=DEFAULT_CONCURRENCY,
+                          multimint_addr=MULTIMINT_ADDR, gas_price=None, expect_chain_id=None,
+                          sea_addr=SEA_DROP_ADDR, multicall_addr=MULTICALL3_ADDR, journal=None):
+    """
+    Mint `total` NFTs from `nft_addr` for every key in `private_keys` concurrently.
+    gas_price: fixed legacy wei, or None for EIP-1559 fees from the fee engine (read per wallet at build time).
+    expect_chain_id: refuse to mint when the RPC answers with another chain (campaign files).
+    sea_addr / multicall_addr: only differ on a local test chain (bench/bench_e2e.py).
+    journal: optional MintJournal (V1 mints are decoded into it, so multiMint menu 6 can withdraw them).
+    Returns a list of per-wallet result dicts in the same order as `private_keys`.
+    """
+    # rpc may list several URLs: probe them; every async read goes to the best-ranked one at
+    # that moment (same scores / ejections as the sync pool), raw txs are fanned out to all
+    pool = MultiRPCProvider(rpc, timeout=60)
+    if not any(r["ok"] for r in pool.probe()):
+        raise ConnectionError("Unable To Connect To Any RPC")
+    sync_w3 = Web3(pool)
+    w3 = AsyncWeb3(AsyncMultiRPCProvider(pool))
+    # one block-driven receipt tracker for every wallet instead of one poll loop per tx
+    tracker = get_tracker(sync_w3)
+    sem = asyncio.Semaphore(max(1, int(concurrency)))
+    executor = ThreadPoolExecutor(max_workers=max(1, int(concurrency)), thread_name_prefix="mint-send")
+    try:
+        chain_id = await w3.eth.chain_id
+        if chain_id not in SUPPORTED_CHAIN_IDS:
+            raise ValueError(f"Chain Not Supported : {chain_id}")
+        if expect_chain_id is not None and chain_id != int(expect_chain_id):
+            raise ValueError(f"RPC Chain Mismatch : Expected {expect_chain_id}, Got {chain_id}")
+
+        nft_addr = to_checksum(nft_addr)
+        multi_contract = get_contract(w3, multimint_addr, *MULTI_FRAGMENTS)
+        accounts = [Account.from_key(pk) for pk in private_keys]
+
+        # drop price + every wallet balance in a few Multicall3 eth_calls instead of one request per wallet
+        matrix = await asyncio.to_thread(wallet_matrix, sync_w3, [a.address for a in accounts], [nft_addr], total,
+                                         sea_addr, multimint_addr, multicall_addr=multicall_addr)
+        if matrix.drops.get(nft_addr) is None:
+            raise ValueError("Failed Read Price From SeaDrop")
+        value = matrix.cost(nft_addr)
+        able = sum(1 for a in accounts if matrix.can_afford(a.address, nft_addr))
+        print(f"Preflight : {able}/{len(accounts)} Wallet(s) Can Pay {value / 1e18:g} | "
+              f"{matrix.sub_calls} Reads In {matrix.rpc_requests} Request(s) ({matrix.seconds * 1000:.0f} ms)")
+        fee_engine = FeeEngine(sync_w3, chain_id, gas_price)
+        # base fee from every block the tracker fetches anyway: no fee RPC per wallet
+        tracker.add_block_listener(fee_engine.observe_block)
+        fees = await asyncio.get_running_loop().run_in_executor(executor, fee_engine.fees)
+        print(f"Using Gas Price : {fee_engine.describe(fees)}")
+
+        # V2 withdraws in the mint tx itself: nothing to decode or resume for it
+        kind = "mint_v2" if multi_contract.address == MULTIMINT_V2_ADDR else "mint"
+        tasks = [
+            _mint_wallet(w3, sync_w3, executor, multi_contract, acct, nft_addr, total, value, chain_id, fee_engine,
+                         sem, matrix.balances.get(acct.address), journal, kind)
+            for acct in accounts
+        ]
+        results = await asyncio.gather(*tasks)
+        for r in results:
+            r["mint_count"] = matrix.mint_counts.get((r["address"], nft_addr))
+        return results
+    finally:
+        tracker.stop()
+        executor.shutdown(wait=False)
+        await w3.provider.disconnect()
+
+
+def print_result_table(results):
+    # Before: child mints the wallet had already deployed through MultiMint for this NFT (preflight)
+    print(f"{'Address':<44} {'Status':<9} {'Before':>6} {'Gas Used':>10} {'Secs':>7}  Tx / Error")
+    for r in results:
+        gas = "" if r["gas_used"] is None else str(r["gas_used"])
+        before = "-" if r.get("mint_count") is None else str(r["mint_count"])
+        detail = r["tx_hash"] or ""
+        if r["error"]:
+            detail = f"{detail} {r['error']}".strip()
+        print(f"{r['address']:<44} {r['status']:<9} {before:>6} {gas:>10} {r['seconds']:>7.2f}  {detail}")
+    ok = sum(1 for r in results if r["status"] == "success")
+    print(f"Success : {ok}/{len(results)}")
+
+
+# MAIN -----------------------------------------------------------------------
+def main():
+    try:
+        print('Auto SeaDrop MultiMint Multi Wallet By ADFMIDN Team')
+        print('')
+        rpc = input("Input RPC URL (Comma Separated For Multi RPC) : ").strip()
+        if not rpc:
+            print("RPC URL Required!")
+            return
+        keys = prompt_wallet_keys()
+        if not keys:
+            print("No Private Keys Found! Exiting...")
+            return
+        print("Loaded Wallets : ", len(keys))
+
+        version = input("MultiMint Contract (1 = V1 Manual Withdraw / 2 = V2 Auto Withdraw) [2] : ").strip() or "2"
+        multimint = MULTIMINT_ADDR if version == "1" else MULTIMINT_V2_ADDR
+
+        gas_inp = input("Input Custom GWEI/Gas Price ( 0.01/1/10/100 ) Or Leave Blank [Default] : ")
+        gas_price = parse_gwei_input(gas_inp)
+        if gas_price is not None:
+            print(f"Using Gas Price : {gwei_from_wei(gas_price)}")
+
+        nft_addr = to_checksum(input("Input NFT Contract Address : ").strip())
+        total = int(input("Total Mint NFT Per Wallet : ").strip())
+        conc_inp = input(f"Concurrency [{DEFAULT_CONCURRENCY}] : ").strip()
+        concurrency = int(conc_inp) if conc_inp else DEFAULT_CONCURRENCY
+
+        from mintJournal import get_journal
+        t0 = time.perf_counter()
+        results = asyncio.run(run_mint_engine(rpc, keys, nft_addr, total, concurrency, multimint, gas_price,
+                                              journal=get_journal()))
+        print_result_table(results)
+        print(f"Elapsed : {time.perf_counter() - t0:.2f}s")
+    except Exception as e:
+        print("Fatal Error : ", e)
+
+
+if __name__ == "__main__":
+    main()
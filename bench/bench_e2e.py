@@ -0,0 +1,203 @@
+"""
+End-to-end mint benchmark against a local chain (anvil, or eth-tester/py-evm) with the
+mock SeaDrop / MultiMint / NFT / Multicall3 from bench/mocks.
+  python bench/bench_e2e.py [--rounds 5] [--units 2] [--wallets 1,10,100] [--backend auto|anvil|eth-tester] [-v]
+Single wallet rounds go through the same calls as multiMint menu 1 (preflight ->
+mintLoop.mint_until_landed -> parse_mint_receipt -> withdraw_tokens); throughput runs asyncMint with
+1 / 10 / 100 wallets. Reports time-to-first-broadcast, RPC calls per mint, receipt-decode
+time, withdraw latency and throughput; appended to bench/results/e2e.jsonl.
+"""
+import os, sys, io, json, time, asyncio, argparse, subprocess, statistics, contextlib
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(ROOT, "bench", "results", "e2e.jsonl")
+
+from eth_account import Account
+
+from local_chain import LocalChain
+
+DECODE_ROUNDS = 200
+VERBOSE = False
+
+
+@contextlib.contextmanager
+def quiet():
+    """The scripts print every tx; keep the bench output to the summary unless -v."""
+    if VERBOSE:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+with quiet():
+    import mintCommon
+    import multiMint
+    import mintLoop
+    import asyncMint
+    from rpcPool import connect_multi
+    from preflight import run_preflight, TIMER
+    from feeEngine import FeeEngine
+    from nonceManager import NONCES
+    from retryPolicy import RpcCounter, install_rpc_counter
+    from receiptTracker import get_tracker
+    from mintCommon import get_contract, SEA_FRAGMENTS, MULTI_FRAGMENTS
+
+
+def pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] if values else None
+
+
+def summarize(values, digits=4):
+    values = [v for v in values if v is not None]
+    if not values:
+        return None
+    return {"median": round(statistics.median(values), digits), "p95": round(pct(values, 0.95), digits),
+            "min": round(min(values), digits), "max": round(max(values), digits)}
+
+
+def single_mint_round(chain, w3, addrs, units) -> dict:
+    """One wallet, multiMint menu 1 path, every step timed and RPC-counted."""
+    acct = Account.create()
+    chain.fund([acct.address])
+    chain_id = w3.eth.chain_id
+    sea = get_contract(w3, addrs["sea"], *SEA_FRAGMENTS)
+    multi = get_contract(w3, addrs["multi"], *MULTI_FRAGMENTS)
+    TIMER.marks.clear()
+
+    rpc0 = RpcCounter.total
+    t_inputs = time.perf_counter()
+    snap = run_preflight(w3, sea, acct.address, addrs["nft"])
+    NONCES.seed(chain_id, acct.address, snap.nonce)
+    fee_engine = FeeEngine(w3, chain_id)
+    fee_engine.prime(snap.fee_history, snap.base_fee, snap.gas_price)
+    value = snap.drop.mint_price * units
+
+    def on_sent(tx_hash, nonce, fees):
+        TIMER.mark("first_broadcast")
+
+    receipt = mintLoop.mint_until_landed(w3, acct, multi.functions.mintMulti(units, addrs["nft"]), value,
+                                         chain_id, fee_engine, on_sent=on_sent)
+    t_landed = time.perf_counter()
+    rpc_mint = RpcCounter.total - rpc0
+
+    t0 = time.perf_counter()
+    for _ in range(DECODE_ROUNDS):
+        nft, children, token_ids = multiMint.parse_mint_receipt(w3, receipt, addrs["multi"])
+    decode_s = (time.perf_counter() - t0) / DECODE_ROUNDS
+
+    rpc1 = RpcCounter.total
+    t0 = time.perf_counter()
+    rows = multiMint.withdraw_tokens(w3, acct, multi, chain_id, nft, token_ids, snap.block_gas_limit, fee_engine)
+    withdraw_s = time.perf_counter() - t0
+    return {
+        "status": receipt.status,
+        "first_broadcast_s": TIMER.marks["first_broadcast"] - t_inputs,
+        "mint_landed_s": t_landed - t_inputs,
+        "rpc_per_mint": rpc_mint,
+        "logs": len(receipt.logs),
+        "decode_s": decode_s,
+        "withdraw_s": withdraw_s,
+        "withdraw_ok": sum(len(r["withdrawn"]) for r in rows) == len(token_ids) == units,
+        "rpc_per_withdraw": RpcCounter.total - rpc1,
+    }
+
+
+def throughput_run(chain, addrs, wallets, units) -> dict:
+    keys = [Account.create() for _ in range(wallets)]
+    chain.fund([a.address for a in keys])
+    t0 = time.perf_counter()
+    results = asyncio.run(asyncMint.run_mint_engine(
+        chain.url, [a.key.hex() for a in keys], addrs["nft"], units, concurrency=wallets,
+        multimint_addr=addrs["multi"], sea_addr=addrs["sea"], multicall_addr=addrs["multicall"]))
+    secs = time.perf_counter() - t0
+    ok = [r for r in results if r["status"] == "success"]
+    return {
+        "wallets": wallets,
+        "success": len(ok),
+        "seconds": round(secs, 4),
+        "tx_per_s": round(len(ok) / secs, 3),
+        "nft_per_s": round(len(ok) * units / secs, 3),
+        "wallet_latency_s": summarize([r["seconds"] for r in ok]),
+        "errors": sorted({r["error"] for r in results if r["error"]})[:5],
+    }
+
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def main():
+    global VERBOSE
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rounds", type=int, default=5)
+    ap.add_argument("--units", type=int, default=2)
+    ap.add_argument("--wallets", default="1,10,100")
+    ap.add_argument("--backend", default="auto", choices=("auto", "anvil", "eth-tester"))
+    ap.add_argument("-v", action="store_true", help="show the scripts' own output")
+    args = ap.parse_args()
+    VERBOSE = args.v
+
+    chain = LocalChain(args.backend)
+    chain.start()
+    try:
+        addrs = chain.deploy_mocks()
+        with quiet():
+            w3, _ = connect_multi(chain.url)
+        install_rpc_counter(w3)
+        chain_id = w3.eth.chain_id
+        # local chain id is not a real network: allow it for this process only
+        mintCommon.SUPPORTED_CHAIN_IDS.add(chain_id)
+        print(f"Backend : {chain.backend} | chainId {chain_id} | {args.units} Unit(s) Per Mint")
+
+        rounds = []
+        for i in range(args.rounds):
+            with quiet():
+                r = single_mint_round(chain, w3, addrs, args.units)
+            rounds.append(r)
+            print(f"Round {i + 1} : first broadcast {r['first_broadcast_s'] * 1000:.1f}ms | landed "
+                  f"{r['mint_landed_s']:.2f}s | {r['rpc_per_mint']} RPC | decode {r['decode_s'] * 1e6:.1f}us | "
+                  f"withdraw {r['withdraw_s']:.2f}s ({r['rpc_per_withdraw']} RPC){'' if r['withdraw_ok'] else ' FAILED'}")
+        get_tracker(w3).stop()
+
+        throughput = []
+        for n in [int(x) for x in args.wallets.split(",") if x.strip()]:
+            with quiet():
+                t = throughput_run(chain, addrs, n, args.units)
+            throughput.append(t)
+            lat = t["wallet_latency_s"] or {}
+            print(f"{n:>4} Wallet(s) : {t['success']}/{n} OK in {t['seconds']:.2f}s | {t['tx_per_s']:.2f} tx/s | "
+                  f"{t['nft_per_s']:.2f} NFT/s | wallet p50 {lat.get('median', '-')}s p95 {lat.get('p95', '-')}s")
+    finally:
+        chain.stop()
+
+    ok = [r for r in rounds if r["status"] == 1]
+    result = {
+        "time": int(time.time()), "rev": git_rev(), "python": sys.version.split()[0], "backend": chain.backend,
+        "units": args.units, "rounds": args.rounds,
+        "single": {
+            "success": len(ok),
+            "first_broadcast_s": summarize([r["first_broadcast_s"] for r in rounds]),
+            "mint_landed_s": summarize([r["mint_landed_s"] for r in rounds]),
+            "rpc_per_mint": summarize([r["rpc_per_mint"] for r in ok], 1),
+            "decode_us": summarize([r["decode_s"] * 1e6 for r in rounds], 2),
+            "withdraw_s": summarize([r["withdraw_s"] for r in rounds]),
+            "rpc_per_withdraw": summarize([r["rpc_per_withdraw"] for r in rounds], 1),
+        },
+        "throughput": throughput,
+    }
+    os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+    with open(RESULTS, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result) + "\n")
+    print("Saved : ", os.path.relpath(RESULTS, ROOT))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Micro-benchmark: parse_mint_receipt on a synthetic 5,000-log mint receipt.
+  python bench/bench_receipt_decode.py [n_logs] [rounds]
+Compares the previous get_event_data implementation (copied below as baseline)
+with the topic0-keyed decoder in receiptDecoder.
+"""
+import os, sys, time, random
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3._utils.events import get_event_data
+from hexbytes import HexBytes
+
+from receiptDecoder import parse_mint_receipt_fast, MINT_DEPLOYED_TOPIC, TRANSFER_TOPIC
+from mintCommon import abi_for, MULTIMINT_ADDR
+
+
+def baseline_parse_mint_receipt(w3, receipt, multimint_addr_checksum):
+    # parse_mint_receipt before the fast decoder (same decode path, trimmed event ABIs)
+    mm_contract = w3.eth.contract(abi=abi_for("MintDeployed"))
+    transfer_contract = w3.eth.contract(abi=abi_for("Transfer"))
+    mint_ev_abi = mm_contract.events.MintDeployed._get_event_abi()
+    transfer_ev_abi = transfer_contract.events.Transfer._get_event_abi()
+    child_addrs = []
+    nft_addr = None
+    for log in receipt.logs:
+        try:
+            log_addr = Web3.to_checksum_address(log.address)
+        except Exception:
+            continue
+        if log_addr.lower() != multimint_addr_checksum.lower():
+            continue
+        try:
+            ev = get_event_data(w3.codec, mint_ev_abi, log)
+            args = ev["args"]
+            if "mintContract" in args:
+                child_addrs.append(Web3.to_checksum_address(args["mintContract"]))
+            if nft_addr is None and "nftAddress" in args:
+                nft_addr = Web3.to_checksum_address(args["nftAddress"])
+        except Exception:
+            continue
+    token_ids = []
+    if child_addrs:
+        child_set = {a.lower() for a in child_addrs}
+        for log in receipt.logs:
+            try:
+                ev = get_event_data(w3.codec, transfer_ev_abi, log)
+                to_addr = Web3.to_checksum_address(ev["args"]["to"])
+                if to_addr.lower() in child_set:
+                    token_ids.append(int(ev["args"]["tokenId"]))
+            except Exception:
+                continue
+    return nft_addr, child_addrs, token_ids
+
+
+def _word(b: bytes) -> HexBytes:
+    return HexBytes(b.rjust(32, b"\x00"))
+
+
+def _log_meta(i):
+    return {"logIndex": i, "transactionIndex": 0, "transactionHash": HexBytes(b"\x11" * 32),
+            "blockHash": HexBytes(b"\x22" * 32), "blockNumber": 1}
+
+
+def synthetic_receipt(n_logs=5000, seed=1):
+    """
+    Mint receipt shape: per child -> Transfer(0 -> child, tokenId) from the NFT,
+    then MintDeployed(deployer, nft, child) from the multimint contract.
+    """
+    rnd = random.Random(seed)
+    deployer = bytes(rnd.getrandbits(8) for _ in range(20))
+    nft = bytes(rnd.getrandbits(8) for _ in range(20))
+    nft_cs = Web3.to_checksum_address(nft)
+    logs = []
+    token_id = 1
+    while len(logs) < n_logs:
+        child = bytes(rnd.getrandbits(8) for _ in range(20))
+        logs.append(AttributeDict({
+            "address": nft_cs,
+            "topics": [HexBytes(TRANSFER_TOPIC), _word(b""), _word(child), _word(token_id.to_bytes(32, "big"))],
+            "data": HexBytes(b""),
+            **_log_meta(len(logs)),
+        }))
+        logs.append(AttributeDict({
+            "address": MULTIMINT_ADDR,
+            "topics": [HexBytes(MINT_DEPLOYED_TOPIC), _word(deployer), _word(nft)],
+            "data": _word(child),
+            **_log_meta(len(logs)),
+        }))
+        token_id += 1
+    return AttributeDict({"logs": logs[:n_logs], "status": 1})
+
+
+def bench(fn, rounds):
+    best = None
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        out = fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best, out
+
+
+def main():
+    n_logs = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    w3 = Web3()
+    receipt = synthetic_receipt(n_logs)
+
+    t_old, old = bench(lambda: baseline_parse_mint_receipt(w3, receipt, MULTIMINT_ADDR), rounds)
+    t_new, new = bench(lambda: parse_mint_receipt_fast(receipt, MULTIMINT_ADDR), rounds)
+
+    if old != new:
+        print("MISMATCH : decoders disagree")
+        sys.exit(1)
+    print(f"Logs : {n_logs} | Children : {len(new[1])} | TokenIds : {len(new[2])}")
+    print(f"get_event_data (old) : {t_old * 1000:.1f} ms")
+    print(f"topic0 decoder (new) : {t_new * 1000:.1f} ms")
+    print(f"Speedup : {t_old / t_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
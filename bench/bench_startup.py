@@ -0,0 +1,96 @@
+"""
+Startup benchmark: import time and time-to-first-prompt of the entry scripts.
+  python bench/bench_startup.py [runs]
+Every run is a fresh interpreter (what a Termux user pays on each launch).
+Results are appended to bench/results/startup.jsonl so regressions show up over time.
+"""
+import os, sys, json, time, subprocess, statistics
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+RESULTS = os.path.join(ROOT, "bench", "results", "startup.jsonl")
+
+SCRIPTS = ["multiMint", "multiMintV2", "asyncMint", "dropSniper"]
+FIRST_PROMPT = "Input RPC URL"
+
+
+def import_seconds(module):
+    code = ("import time; t = time.perf_counter(); import web3; w = time.perf_counter(); "
+            f"import {module}; e = time.perf_counter(); print(w - t, e - w)")
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    web3_s, own_s = out.stdout.strip().splitlines()[-1].split()
+    return float(web3_s), float(own_s)
+
+
+def first_prompt_seconds(module):
+    """Launch the script and wait for the first input() prompt on stdout."""
+    t0 = time.perf_counter()
+    p = subprocess.Popen([sys.executable, "-u", f"{module}.py"], cwd=ROOT, stdin=subprocess.PIPE,
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    buf = b""
+    try:
+        while FIRST_PROMPT.encode() not in buf:
+            ch = p.stdout.read(1)
+            if not ch:
+                return None
+            buf += ch
+        return time.perf_counter() - t0
+    finally:
+        p.kill()
+        p.wait()
+
+
+def contract_build_seconds(rounds=200):
+    """First build vs cached lookup for the contract objects the mint loop uses."""
+    sys.path.insert(0, ROOT)
+    from web3 import Web3
+    from mintCommon import get_contract, SEA_DROP_ADDR, MULTIMINT_ADDR, SEA_FRAGMENTS, MULTI_FRAGMENTS
+    w3 = Web3()
+    t0 = time.perf_counter()
+    get_contract(w3, SEA_DROP_ADDR, *SEA_FRAGMENTS)
+    get_contract(w3, MULTIMINT_ADDR, *MULTI_FRAGMENTS)
+    first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        get_contract(w3, SEA_DROP_ADDR, *SEA_FRAGMENTS)
+        get_contract(w3, MULTIMINT_ADDR, *MULTI_FRAGMENTS)
+    cached = (time.perf_counter() - t0) / rounds
+    return first, cached
+
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    result = {"time": int(time.time()), "rev": git_rev(), "python": sys.version.split()[0], "runs": runs, "scripts": {}}
+    print(f"{'Script':<14}{'web3 import':>14}{'own import':>14}{'first prompt':>15}")
+    for mod in SCRIPTS:
+        imports = [import_seconds(mod) for _ in range(runs)]
+        web3_s = statistics.median(i[0] for i in imports)
+        own_s = statistics.median(i[1] for i in imports)
+        row = {"web3_import_s": round(web3_s, 4), "own_import_s": round(own_s, 4)}
+        if mod in ("multiMint", "multiMintV2"):
+            prompts = [s for s in (first_prompt_seconds(mod) for _ in range(runs)) if s is not None]
+            row["first_prompt_s"] = round(statistics.median(prompts), 4) if prompts else None
+        result["scripts"][mod] = row
+        fp = row.get("first_prompt_s")
+        print(f"{mod:<14}{web3_s * 1000:>12.1f}ms{own_s * 1000:>12.1f}ms"
+              f"{(f'{fp * 1000:.1f}ms' if fp is not None else '-'):>15}")
+
+    first, cached = contract_build_seconds()
+    result["contracts"] = {"first_build_s": round(first, 6), "cached_lookup_s": round(cached, 9)}
+    print(f"Contracts : first build {first * 1000:.2f}ms | cached lookup {cached * 1e6:.2f}us")
+
+    os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+    with open(RESULTS, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result) + "\n")
+    print("Saved : ", os.path.relpath(RESULTS, ROOT))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Local stand-in chain for the end-to-end benchmark.
+  - anvil when it is on PATH, otherwise eth-tester/py-evm behind a tiny JSON-RPC server
+    (pip install "eth-tester[py-evm]"); either way the chain is its own process so its
+    CPU time never lands in the numbers of the code under test
+  - mock SeaDrop / MultiMint / NFT / Multicall3 from bench/mocks (Vyper sources, compiled
+    output checked in as mocks/compiled.json so vyper is only needed to rebuild it:
+    python bench/local_chain.py --rebuild)
+"""
+import os, sys, json, time, shutil, socket, threading, subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from web3 import Web3, HTTPProvider
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MOCKS = os.path.join(HERE, "mocks")
+COMPILED = os.path.join(MOCKS, "compiled.json")
+MOCK_NAMES = ["MockSeaDrop", "MockMintChild", "MockMultiMint", "MockNFT", "MockMulticall3"]
+
+# eth-tester wants ints where JSON-RPC sends hex quantities
+_QTY_FIELDS = {"fromBlock", "toBlock", "value", "gas", "gasPrice", "nonce", "maxFeePerGas", "maxPriorityFeePerGas",
+               "chainId"}
+_QTY_BLOCK_METHODS = ("eth_getBlockByNumber", "eth_feeHistory")
+
+
+def build_mocks():
+    import vyper
+    out = {"vyper": vyper.__version__, "contracts": {}}
+    for name in MOCK_NAMES:
+        with open(os.path.join(MOCKS, name + ".vy"), encoding="utf-8") as f:
+            res = vyper.compile_code(f.read(), output_formats=["abi", "bytecode"])
+        out["contracts"][name] = {"abi": res["abi"], "bytecode": res["bytecode"]}
+    with open(COMPILED, "w", encoding="utf-8") as f:
+        json.dump(out, f, separators=(",", ":"))
+    return out["contracts"]
+
+
+def load_mocks() -> dict:
+    with open(COMPILED, encoding="utf-8") as f:
+        return json.load(f)["contracts"]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# eth-tester JSON-RPC server -----------------------------------------------------
+def _to_tester(method, params):
+    out = []
+    for p in params:
+        if isinstance(p, dict):
+            p = {k: (int(v, 16) if k in _QTY_FIELDS and isinstance(v, str) and v.startswith("0x") else v) for k, v in p.items()}
+        elif isinstance(p, str) and p.startswith("0x") and method in _QTY_BLOCK_METHODS and len(p) < 20:
+            p = int(p, 16)
+        out.append(p)
+    return out
+
+
+def _to_json(o):
+    if isinstance(o, bool) or o is None:
+        return o
+    if isinstance(o, int):
+        return hex(o)
+    if isinstance(o, (bytes, bytearray)):
+        return "0x" + bytes(o).hex()
+    if hasattr(o, "items"):
+        return {k: _to_json(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [_to_json(v) for v in o]
+    return o
+
+
+class _TesterServer:
+    def __init__(self, port):
+        from web3 import EthereumTesterProvider
+        self.w3 = Web3(EthereumTesterProvider())
+        # py-evm is not thread safe: one request at a time
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                res = [server.handle(b) for b in body] if isinstance(body, list) else server.handle(body)
+                data = json.dumps(res).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+
+    def handle(self, req):
+        out = {"jsonrpc": "2.0", "id": req.get("id")}
+        with self.lock:
+            try:
+                res = self.w3.manager._make_request(req["method"], _to_tester(req["method"], req.get("params", [])))
+            except Exception as e:
+                out["error"] = {"code": -32000, "message": str(e)}
+                return out
+        if res.get("error") is not None:
+            err = res["error"]
+            out["error"] = dict(err) if hasattr(err, "items") else {"code": -32000, "message": str(err)}
+        else:
+            out["result"] = _to_json(res.get("result"))
+        return out
+
+
+class LocalChain:
+    """start() -> JSON-RPC URL; deploy_mocks() -> addresses of the mock contracts."""
+
+    def __init__(self, backend="auto", port=None):
+        if backend == "auto":
+            backend = "anvil" if shutil.which("anvil") else "eth-tester"
+        self.backend = backend
+        self.port = port or _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self._proc = None
+        self.w3 = None
+        self.contracts = {}
+
+    def start(self):
+        if self.backend == "anvil":
+            cmd = ["anvil", "--port", str(self.port), "--silent"]
+        else:
+            cmd = [sys.executable, os.path.abspath(__file__), "--serve", str(self.port)]
+        self._proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.w3 = Web3(HTTPProvider(self.url, request_kwargs={"timeout": 60}))
+        deadline = time.time() + 30
+        while not self.w3.is_connected():
+            if time.time() > deadline or self._proc.poll() is not None:
+                raise ConnectionError(f"Local Chain Did Not Start : {self.backend}")
+            time.sleep(0.1)
+        self.funder = self.w3.eth.accounts[0]
+        return self.url
+
+    def stop(self):
+        if self._proc is not None:
+            self._proc.terminate()
+            self._proc.wait()
+
+    def deploy(self, name, *args):
+        spec = load_mocks()[name]
+        factory = self.w3.eth.contract(abi=spec["abi"], bytecode=spec["bytecode"])
+        receipt = self.w3.eth.wait_for_transaction_receipt(factory.constructor(*args).transact({"from": self.funder}))
+        c = self.w3.eth.contract(address=receipt.contractAddress, abi=spec["abi"])
+        self.contracts[name] = c
+        return c
+
+    def deploy_mocks(self, price=10**15, max_per_wallet=0) -> dict:
+        """SeaDrop + MultiMint + live public drop on a fresh NFT + Multicall3."""
+        sea = self.deploy("MockSeaDrop")
+        child = self.deploy("MockMintChild")
+        multi = self.deploy("MockMultiMint", child.address, sea.address)
+        nft = self.deploy("MockNFT")
+        multicall = self.deploy("MockMulticall3")
+        now = self.w3.eth.get_block("latest")["timestamp"]
+        tx = sea.functions.updatePublicDrop(nft.address, (price, now - 10, now + 10**7, max_per_wallet, 0, False))
+        self.w3.eth.wait_for_transaction_receipt(tx.transact({"from": self.funder}))
+        return {"sea": sea.address, "multi": multi.address, "nft": nft.address, "multicall": multicall.address}
+
+    def fund(self, addresses, eth=10):
+        """Send `eth` to every address; waits only for the last transfer."""
+        last = None
+        for addr in addresses:
+            last = self.w3.eth.send_transaction({"from": self.funder, "to": addr, "value": eth * 10**18})
+        if last is not None:
+            self.w3.eth.wait_for_transaction_receipt(last)
+
+
+if __name__ == "__main__":
+    if "--serve" in sys.argv:
+        _TesterServer(int(sys.argv[sys.argv.index("--serve") + 1])).httpd.serve_forever()
+    elif "--rebuild" in sys.argv:
+        built = build_mocks()
+        print("Rebuilt : ", ", ".join(built), "->", os.path.relpath(COMPILED))
@@ -0,0 +1,19 @@
+# pragma version ^0.4.0
+# Child mint contract (minimal proxy target) of MockMultiMint.
+interface NFT:
+    def mintTo(to: address) -> uint256: nonpayable
+    def transferFrom(sender: address, to: address, tokenId: uint256): nonpayable
+
+owner: public(address)
+
+@external
+def mint(nft: address) -> uint256:
+    if self.owner == empty(address):
+        self.owner = msg.sender
+    assert msg.sender == self.owner
+    return extcall NFT(nft).mintTo(self)
+
+@external
+def withdraw(nft: address, tokenId: uint256, to: address):
+    assert msg.sender == self.owner
+    extcall NFT(nft).transferFrom(self, to, tokenId)
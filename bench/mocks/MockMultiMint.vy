@@ -0,0 +1,96 @@
+# pragma version ^0.4.0
+# Bench stand-in for MultiMint V1: mintMulti deploys one child per unit, withdrawAllForNft pulls tokens back.
+interface Child:
+    def mint(nft: address) -> uint256: nonpayable
+    def withdraw(nft: address, tokenId: uint256, to: address): nonpayable
+
+interface NFT:
+    def ownerOf(tokenId: uint256) -> address: view
+
+struct PublicDrop:
+    mintPrice: uint80
+    startTime: uint48
+    endTime: uint48
+    maxTotalMintableByWallet: uint16
+    feeBps: uint16
+    restrictFeeRecipients: bool
+
+interface SeaDrop:
+    def getPublicDrop(nftContract: address) -> PublicDrop: view
+
+event MintDeployed:
+    deployer: indexed(address)
+    nftAddress: indexed(address)
+    mintContract: address
+
+event MintWithdrawSuccess:
+    deployer: indexed(address)
+    nftAddress: indexed(address)
+    mintContract: address
+    tokenId: uint256
+
+event MintWithdrawFailed:
+    deployer: indexed(address)
+    nftAddress: indexed(address)
+    mintContract: address
+    tokenId: uint256
+
+event MultiWithdrawSummary:
+    deployer: indexed(address)
+    nftAddress: indexed(address)
+    attempted: uint256
+    succeeded: uint256
+    failed: uint256
+
+MAX_MINTS: constant(uint256) = 2000
+
+childImpl: public(address)
+seaDrop: public(address)
+mints: HashMap[address, HashMap[address, DynArray[address, MAX_MINTS]]]
+
+@deploy
+def __init__(child_impl: address, sea_drop: address):
+    self.childImpl = child_impl
+    self.seaDrop = sea_drop
+
+@external
+@payable
+def mintMulti(total: uint256, nftaddress: address):
+    drop: PublicDrop = staticcall SeaDrop(self.seaDrop).getPublicDrop(nftaddress)
+    assert block.timestamp >= convert(drop.startTime, uint256), "not started"
+    assert block.timestamp <= convert(drop.endTime, uint256), "ended"
+    assert msg.value >= convert(drop.mintPrice, uint256) * total, "bad price"
+    for i: uint256 in range(total, bound=MAX_MINTS):
+        child: address = create_minimal_proxy_to(self.childImpl)
+        extcall Child(child).mint(nftaddress)
+        self.mints[msg.sender][nftaddress].append(child)
+        log MintDeployed(deployer=msg.sender, nftAddress=nftaddress, mintContract=child)
+
+@external
+def withdrawAllForNft(nftAddress: address, tokenIds: DynArray[uint256, MAX_MINTS]):
+    ok: uint256 = 0
+    for tid: uint256 in tokenIds:
+        holder: address = staticcall NFT(nftAddress).ownerOf(tid)
+        found: bool = False
+        for child: address in self.mints[msg.sender][nftAddress]:
+            if holder == child:
+                extcall Child(child).withdraw(nftAddress, tid, msg.sender)
+                found = True
+                break
+        if found:
+            ok += 1
+            log MintWithdrawSuccess(deployer=msg.sender, nftAddress=nftAddress, mintContract=holder, tokenId=tid)
+        else:
+            log MintWithdrawFailed(deployer=msg.sender, nftAddress=nftAddress, mintContract=holder, tokenId=tid)
+    log MultiWithdrawSummary(deployer=msg.sender, nftAddress=nftAddress, attempted=len(tokenIds), succeeded=ok,
+                             failed=len(tokenIds) - ok)
+
+@external
+@view
+def getMints(deployer: address, nftAddress: address) -> DynArray[address, MAX_MINTS]:
+    return self.mints[deployer][nftAddress]
+
+@external
+@view
+def getMintCount(deployer: address, nftAddress: address) -> uint256:
+    return len(self.mints[deployer][nftAddress])
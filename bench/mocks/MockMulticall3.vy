@@ -0,0 +1,36 @@
+# pragma version ^0.4.0
+# Multicall3 subset used by multicallPreflight (aggregate3, getEthBalance, getCurrentBlockTimestamp).
+struct Call3:
+    target: address
+    allowFailure: bool
+    callData: Bytes[100]
+
+struct Result:
+    success: bool
+    returnData: Bytes[256]
+
+@external
+def aggregate3(calls: DynArray[Call3, 1024]) -> DynArray[Result, 1024]:
+    out: DynArray[Result, 1024] = []
+    for c: Call3 in calls:
+        ok: bool = False
+        data: Bytes[256] = b""
+        ok, data = raw_call(c.target, c.callData, max_outsize=256, revert_on_failure=False)
+        assert ok or c.allowFailure, "Multicall3: call failed"
+        out.append(Result(success=ok, returnData=data))
+    return out
+
+@external
+@view
+def getEthBalance(addr: address) -> uint256:
+    return addr.balance
+
+@external
+@view
+def getCurrentBlockTimestamp() -> uint256:
+    return block.timestamp
+
+@external
+@view
+def getBlockNumber() -> uint256:
+    return block.number
@@ -0,0 +1,27 @@
+# pragma version ^0.4.0
+# Bare ERC721-like NFT: mintTo / transferFrom / ownerOf + Transfer events.
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    tokenId: indexed(uint256)
+
+ownerOf: public(HashMap[uint256, address])
+balanceOf: public(HashMap[address, uint256])
+totalSupply: public(uint256)
+
+@external
+def mintTo(to: address) -> uint256:
+    tid: uint256 = self.totalSupply + 1
+    self.totalSupply = tid
+    self.ownerOf[tid] = to
+    self.balanceOf[to] += 1
+    log Transfer(sender=empty(address), receiver=to, tokenId=tid)
+    return tid
+
+@external
+def transferFrom(sender: address, to: address, tokenId: uint256):
+    assert self.ownerOf[tokenId] == sender and msg.sender == sender, "not owner"
+    self.ownerOf[tokenId] = to
+    self.balanceOf[sender] -= 1
+    self.balanceOf[to] += 1
+    log Transfer(sender=sender, receiver=to, tokenId=tokenId)
@@ -0,0 +1,25 @@
+# pragma version ^0.4.0
+# Bench stand-in for SeaDrop: getPublicDrop / updatePublicDrop only.
+struct PublicDrop:
+    mintPrice: uint80
+    startTime: uint48
+    endTime: uint48
+    maxTotalMintableByWallet: uint16
+    feeBps: uint16
+    restrictFeeRecipients: bool
+
+event PublicDropUpdated:
+    nftContract: indexed(address)
+    publicDrop: PublicDrop
+
+drops: HashMap[address, PublicDrop]
+
+@external
+@view
+def getPublicDrop(nftContract: address) -> PublicDrop:
+    return self.drops[nftContract]
+
+@external
+def updatePublicDrop(nftContract: address, publicDrop: PublicDrop):
+    self.drops[nftContract] = publicDrop
+    log PublicDropUpdated(nftContract=nftContract, publicDrop=publicDrop)
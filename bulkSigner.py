@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures, FIRST_COMPLETED
+from eth_account import Account
+import os, time, threading, multiprocessing
+
+from mintCommon import (
+    SEA_DROP_ADDR, MULTIMINT_ADDR, MULTIMINT_V2_ADDR, SUPPORTED_CHAIN_IDS, SYMBOLS,
+    get_contract, MULTI_FRAGMENTS, to_checksum, parse_gwei_input,
+)
+from rpcPool import connect_multi
+from feeEngine import FeeEngine, max_fee_per_gas
+from receiptTracker import get_tracker
+from multicallPreflight import wallet_matrix, pending_nonces, MULTICALL3_ADDR
+from mintMetrics import METRICS
+from retryPolicy import RetryScheduler, classify, is_already_known
+from replacementManager import send_with_replacement, bump_fees, fee_fields, STUCK_BLOCKS, FEE_CAP_MULT, MAX_PIPELINE
+from mintLoop import find_landed
+from hdWallet import prompt_wallet_keys
+from dropWatcher import DropWatcher, DropGate
+import dropSniper
+import asyncMint
+
+# Process-pool bulk signing -------------------------------------------------------
+# secp256k1 signing is CPU bound and holds the GIL, so signing thousands of pre-built
+# mintMulti txs on the main thread stalls every broadcast queued behind it. A spawn
+# pool gets the keys once (initializer), signs tx dicts in chunks and every chunk is
+# handed to the broadcaster the moment it is done, while later chunks are still being
+# signed. Started before the drop, so most mints are signed when it opens and the rest
+# stream out as they finish; until then the PublicDropUpdated watcher can re-sign them
+# or move the start. One wallet's txs go out in nonce order, stuck or underpriced ones
+# are bumped on their own nonce by settle().
+
+CHUNK = 32              # txs per task (smaller chunks -> first raw tx out sooner)
+SEND_THREADS = 16
+RECEIPT_TIMEOUT = 600
+RESEND_CLASSES = ("rate_limited", "network", "timeout")    # same raw tx again; anything else goes to settle()
+
+_ACCOUNTS = {}          # worker process: address -> LocalAccount
+
+
+def _init_worker(keys):
+    global _ACCOUNTS
+    _ACCOUNTS = {a.address: a for a in map(Account.from_key, keys)}
+
+
+def _sign_chunk(chunk):
+    out = []
+    for i, tx in chunk:
+        tx = dict(tx)
+        signed = _ACCOUNTS[tx.pop("from")].sign_transaction(tx)
+        out.append((i, bytes(signed.raw_transaction), "0x" + bytes(signed.hash).hex()))
+    return out
+
+
+class BulkSigner:
+    """
+    Signing pool for a fixed set of keys (workers spawn and load the keys right away).
+      stream(txs)   -> yields (index, raw_tx, tx_hash) as chunks finish (any order)
+      sign_all(txs) -> [(raw_tx, tx_hash)] in tx order
+    Every tx dict needs "from" (the signing wallet) and all signing fields (nonce, gas, fees, chainId).
+    """
+
+    def __init__(self, keys, workers=None):
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        ctx = multiprocessing.get_context("spawn")
+        self._pool = ctx.Pool(self.workers, initializer=_init_worker, initargs=(list(keys),))
+
+    def stream(self, txs, chunk=CHUNK):
+        items = list(enumerate(txs))
+        # at least a few chunks per worker so the pool stays busy until the end
+        size = max(1, min(chunk, -(-len(items) // (self.workers * 4))))
+        for part in self._pool.imap_unordered(_sign_chunk, [items[i:i + size] for i in range(0, len(items), size)]):
+            yield from part
+
+    def sign_all(self, txs, chunk=CHUNK) -> list:
+        out = [None] * len(txs)
+        for i, raw, tx_hash in self.stream(txs, chunk):
+            out[i] = (raw, tx_hash)
+        return out
+
+    def close(self):
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Presigner:
+    """
+    Background signing rounds on one BulkSigner. sign(txs) starts a round (a later round
+    supersedes it: new price / new fees), take() yields (index, raw_tx, tx_hash) of the
+    latest round - everything already signed at once, the rest as the workers finish it.
+    """
+
+    def __init__(self, signer):
+        self.signer = signer
+        self._cond = threading.Condition()
+        self._rounds = []           # [{"signed": {index: item}, "total", "seconds", "error"}]
+
+    def sign(self, txs, label="Signed"):
+        rnd = {"signed": {}, "total": len(txs), "seconds": None, "error": None}
+        txs = [dict(tx) for tx in txs]
+        with self._cond:
+            self._rounds.append(rnd)
+        t0 = time.perf_counter()
+
+        def run():
+            try:
+                for item in self.signer.stream(txs):
+                    with self._cond:
+                        rnd["signed"][item[0]] = item
+                        self._cond.notify_all()
+                rnd["seconds"] = time.perf_counter() - t0
+                print(f"{label} {len(txs)} Txs In {rnd['seconds']:.2f}s ({self.signer.workers} Workers)")
+            except Exception as e:
+                rnd["error"] = e
+            with self._cond:
+                self._cond.notify_all()
+
+        threading.Thread(target=run, name="presign", daemon=True).start()
+
+    def ready(self) -> int:
+        """Txs of the latest round already signed."""
+        with self._cond:
+            return len(self._rounds[-1]["signed"]) if self._rounds else 0
+
+    def take(self):
+        with self._cond:
+            rnd = self._rounds[-1]      # the round is fixed here, not on the first next()
+
+        def items():
+            given = 0
+            while given < rnd["total"]:
+                with self._cond:
+                    self._cond.wait_for(lambda: len(rnd["signed"]) > given or rnd["error"] is not None)
+                    if rnd["error"] is not None and len(rnd["signed"]) <= given:
+                        raise rnd["error"]
+                    batch = list(rnd["signed"].values())[given:]
+                given += len(batch)
+                yield from batch
+
+        return items()
+
+
+def broadcast_stream(w3, signed, gate=None, tracker=None, threads=SEND_THREADS, on_sent=None, txs=None) -> dict:
+    """
+    send_raw_transaction for every (index, raw_tx, tx_hash) of `signed` as it arrives.
+    gate: optional threading.Event, nothing goes out before it is set (signing keeps going).
+    tracker: ReceiptTracker to register each hash with before it is sent.
+    on_sent(index, tx_hash, receipt_future): receipt_future is None without a tracker.
+    txs: the unsigned tx dicts ("from", "nonce"); with them one wallet's txs go out strictly
+    in nonce order (a later nonce is held back until the one before it was sent).
+    Rate limits / network errors resend the same raw tx under the retry policy; other
+    errors (underpriced, nonce, funds) are returned for settle().
+    Returns {index: tx_hash or the exception raised}.
+    """
+    results = {}
+
+    def send(i, raw, tx_hash, before=None):
+        if before is not None:
+            wait_futures([before])
+        if gate is not None:
+            gate.wait()
+        fut = tracker.track(tx_hash, RECEIPT_TIMEOUT) if tracker is not None else None
+        retry = RetryScheduler()
+        while True:
+            try:
+                with METRICS.stage("bulk.send"):
+                    w3.eth.send_raw_transaction(raw)
+                break
+            except Exception as e:
+                if is_already_known(e):
+                    break
+                decision = retry.on_error(e)
+                if decision.abort or decision.cls not in RESEND_CLASSES:
+                    if tracker is not None:
+                        tracker.untrack(tx_hash)
+                    results[i] = e
+                    return
+                retry.wait(decision)
+        results[i] = tx_hash
+        if on_sent is not None:
+            on_sent(i, tx_hash, fut)
+
+    held, expected, last = {}, {}, {}
+    if txs is not None:
+        for tx in txs:
+            w = tx["from"]
+            expected[w] = min(expected.get(w, tx["nonce"]), tx["nonce"])
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for item in signed:
+            if txs is None:
+                pool.submit(send, *item)
+                continue
+            w = txs[item[0]]["from"]
+            held.setdefault(w, {})[txs[item[0]]["nonce"]] = item
+            # release this wallet's txs that are next in nonce order, chained one after the other
+            while expected[w] in held[w]:
+                last[w] = pool.submit(send, *held[w].pop(expected[w]), before=last.get(w))
+                expected[w] += 1
+        # nonce gaps in txs: whatever is left still goes out, lowest nonce first
+        for w, items in held.items():
+            for n in sorted(items):
+                last[w] = pool.submit(send, *items[n], before=last.get(w))
+    return results
+
+
+def settle(w3, txs, sent, futures, accounts, fee_engine, tracker, on_sent=None, on_landed=None) -> dict:
+    """
+    Receipts for what broadcast_stream sent. Txs still unmined after STUCK_BLOCKS, or
+    rejected as underpriced, are re-signed on their nonce with bumped fees
+    (replacementManager.send_with_replacement); a failed replacement looks up the hashes
+    already sent before giving up.
+    on_sent(index, tx_hash, fees) for replacement hashes; on_landed(index, tx_hash, receipt).
+    Returns {index: (tx_hash, receipt) or the exception}.
+    """
+    out = {}
+    pending = {i: fut for i, fut in futures.items() if fut is not None}
+    # everything was sent before this block: not mined STUCK_BLOCKS later -> stuck
+    start = w3.eth.block_number if pending else None
+    deadline = time.time() + RECEIPT_TIMEOUT
+    while pending and time.time() < deadline:
+        head = tracker.head
+        stuck = head is not None and head - start >= STUCK_BLOCKS
+        done, _ = wait_futures(list(pending.values()), timeout=0 if stuck else 1.0, return_when=FIRST_COMPLETED)
+        for i in [i for i, fut in pending.items() if fut in done]:
+            fut = pending.pop(i)
+            try:
+                out[i] = (sent[i], fut.result())
+                if on_landed is not None:
+                    on_landed(i, sent[i], out[i][1])
+            except Exception as e:
+                out[i] = e
+        if stuck:
+            break
+    todo = list(pending)
+    for i, res in sent.items():
+        if isinstance(res, Exception):
+            if classify(res) == "underpriced":
+                todo.append(i)
+            else:
+                out[i] = res
+    if not todo:
+        return out
+    print(f"Replacing {len(todo)} Stuck / Underpriced Tx(s) With Bumped Fees...")
+    cap = int(max_fee_per_gas(fee_fields(txs[todo[0]])) * FEE_CAP_MULT)
+
+    def replace(i):
+        def sent_replacement(tx_hash, fees):
+            if on_sent is not None:
+                on_sent(i, tx_hash, fees)
+
+        tx = dict(txs[i])
+        acct = accounts[tx.pop("from")]
+        hashes = [sent[i]] if isinstance(sent[i], str) else []
+        if not hashes:
+            # never reached the mempool: first send is already a bump
+            old = fee_fields(tx)
+            for k in old:
+                tx.pop(k)
+            tx.update(bump_fees(old, fee_engine.fees(1), cap))
+        try:
+            res = send_with_replacement(w3, acct, tx, fee_engine, fee_cap=cap, timeout=RECEIPT_TIMEOUT, kind="bulk",
+                                        on_sent=sent_replacement, resend=True)
+            return res["landed_hash"], res["receipt"]
+        except Exception as e:
+            hashes += [h for h in getattr(e, "hashes", []) if h not in hashes]
+            receipt = find_landed(w3, hashes) if hashes else None
+            if receipt is None:
+                raise
+            return receipt.transactionHash.to_0x_hex(), receipt
+
+    with ThreadPoolExecutor(max_workers=min(len(todo), MAX_PIPELINE)) as pool:
+        jobs = {i: pool.submit(replace, i) for i in todo}
+        for i, job in jobs.items():
+            try:
+                out[i] = job.result()
+                if on_landed is not None:
+                    on_landed(i, *out[i])
+            except Exception as e:
+                out[i] = e
+    return out
+
+
+def build_mint_txs(multi_contract, wallets, nonces, nft_addr, total, value, chain_id, fees, gas_limit) -> list:
+    """One mintMulti tx dict per wallet; calldata is the same for all, encoded once (no RPC)."""
+    data = multi_contract.encode_abi("mintMulti", [total, nft_addr])
+    return [{
+        "from": w, "to": multi_contract.address, "data": data, "value": value, "gas": int(gas_limit),
+        "nonce": nonces[w], "chainId": chain_id, **fees,
+    } for w in wallets]
+
+
+def affordable_txs(txs, balances) -> list:
+    """Txs whose wallet can pay their value + gas at their max fee (balances from the preflight)."""
+    return [tx for tx in txs
+            if (balances.get(tx["from"]) or 0) >= tx["value"] + tx["gas"] * max_fee_per_gas(fee_fields(tx))]
+
+
+# MAIN -----------------------------------------------------------------------
+def main():
+    signer = None
+    try:
+        print('Auto SeaDrop MultiMint Pre-Signed Multi Wallet By ADFMIDN Team')
+        print('')
+        rpc = input("Input RPC URL (Comma Separated For Multi RPC) : ").strip()
+        if not rpc:
+            print("RPC URL Required!")
+            return
+        keys = prompt_wallet_keys()
+        if not keys:
+            print("No Private Keys Found! Exiting...")
+            return
+        # workers spawn + load keys while the remaining inputs are typed
+        signer = BulkSigner(keys)
+        accounts = {a.address: a for a in map(Account.from_key, keys)}
+        wallets = list(accounts)
+        print(f"Loaded Wallets : {len(wallets)} | Signing Workers : {signer.workers}")
+
+        version = input("MultiMint Contract (1 = V1 Manual Withdraw / 2 = V2 Auto Withdraw) [2] : ").strip() or "2"
+        multimint = MULTIMINT_ADDR if version == "1" else MULTIMINT_V2_ADDR
+        gas_inp = input("Input Custom GWEI/Gas Price ( 0.01/1/10/100 ) Or Leave Blank [Default] : ")
+        nft_addr = to_checksum(input("Input NFT Contract Address : ").strip())
+        total = int(input("Total Mint NFT Per Wallet : ").strip())
+        gas_inp_limit = input(f"Gas Limit [Blank = {dropSniper.DEFAULT_GAS_PER_MINT} x Total] : ").strip()
+        gas_limit = int(gas_inp_limit) if gas_inp_limit else dropSniper.DEFAULT_GAS_PER_MINT * total
+        lead_inp = input("Send Lead Seconds Before startTime [0] : ").strip()
+        lead = float(lead_inp) if lead_inp else 0.0
+
+        w3, _ = connect_multi(rpc)
+        if w3 is None:
+            print("Unable To Connect To RPC. Exiting...")
+            return
+        chain_id = w3.eth.chain_id
+        if chain_id not in SUPPORTED_CHAIN_IDS:
+            print("Chain Not Supported. Supported : ", SUPPORTED_CHAIN_IDS)
+            return
+        native_symbol = SYMBOLS.get(chain_id, "ETH")
+        multi_contract = get_contract(w3, multimint, *MULTI_FRAGMENTS)
+
+        fee_engine = FeeEngine(w3, chain_id, parse_gwei_input(gas_inp))
+        fees = fee_engine.fees()
+        print(f"Using Gas Price : {fee_engine.describe(fees)}")
+        matrix = wallet_matrix(w3, wallets, [nft_addr], total, SEA_DROP_ADDR, multimint, MULTICALL3_ADDR)
+        drop = matrix.drops.get(nft_addr)
+        if drop is None:
+            print("Failed Read Price From SeaDrop")
+            return
+        value = drop.mint_price * total
+        # a tx for every wallet that can pay the gas: a price change re-filters them below
+        reserve = gas_limit * max_fee_per_gas(fees)
+        payers = [w for w in wallets if (matrix.balances.get(w) or 0) >= reserve]
+        nonces = pending_nonces(w3, payers)
+        payers = [w for w in payers if nonces.get(w) is not None]
+        all_txs = build_mint_txs(multi_contract, payers, nonces, nft_addr, total, value, chain_id, fees, gas_limit)
+        txs = affordable_txs(all_txs, matrix.balances)
+        able = [tx["from"] for tx in txs]
+        print(f"Price Per Token : {drop.mint_price / 1e18:g} {native_symbol} | Start : {drop.start_time}")
+        print(f"Wallets Able To Pay Value + Gas : {len(able)}/{len(wallets)}")
+        if not able:
+            return
+
+        # every hash sent and every landed mint (V1: decoded, withdrawable from multiMint menu 6)
+        from mintJournal import get_journal, record_mint_receipt
+        journal = get_journal()
+        kind = "mint" if multimint == MULTIMINT_ADDR else "mint_v2"
+        tracker = get_tracker(w3).start()
+        presigner = Presigner(signer)
+        done, futures, landed = {}, {}, {}
+
+        def on_sent(i, tx_hash, fut):
+            done.setdefault("first_sent", time.time())
+            futures[i] = fut
+            journal.record_sent(chain_id, txs[i]["from"], txs[i]["nonce"], tx_hash, kind, nft_addr, total,
+                                fee_fields(txs[i]))
+
+        def on_replaced(i, tx_hash, fees):
+            journal.record_sent(chain_id, txs[i]["from"], txs[i]["nonce"], tx_hash, kind, nft_addr, total, fees)
+
+        def on_landed(i, tx_hash, receipt):
+            landed.setdefault(i, time.perf_counter())
+            journal.record_receipt(tx_hash, receipt)
+            if kind == "mint" and receipt.status == 1:
+                record_mint_receipt(journal, chain_id, txs[i]["from"], receipt, multimint)
+
+        # signing starts now in the background; the broadcast takes whatever is signed and
+        # streams the rest as it finishes, whether the drop is live already or not
+        presigner.sign(txs, "Pre-Signed" if drop.start_time - lead > time.time() else "Signed")
+        watcher = None
+        if drop.start_time - lead > time.time():
+            # not live yet: hold the txs until startTime and follow PublicDropUpdated from the
+            # preflight block (new price -> wallets re-checked and re-signed with the new value,
+            # new start -> gate moves / opens at once)
+            state = {"drop": drop}
+            gate = DropGate(drop.start_time, lead)
+            lock = threading.Lock()
+
+            def on_update(nft, new, block):
+                nonlocal txs, able
+                print(f"PublicDropUpdated (Block {block}) : Price {new.mint_price / 1e18:g} {native_symbol} | "
+                      f"Start {new.start_time} | End {new.end_time}")
+                with lock:
+                    if new.mint_price != state["drop"].mint_price and not gate.is_set():
+                        for tx in all_txs:
+                            tx["value"] = new.mint_price * total
+                        txs = affordable_txs(all_txs, matrix.balances)
+                        able = [tx["from"] for tx in txs]
+                        print(f"Wallets Able To Pay Value + Gas : {len(able)}/{len(wallets)}")
+                        presigner.sign(txs, "Re-Signed With New Value")
+                    state["drop"] = new
+                gate.update(new.start_time)
+
+            watcher = DropWatcher(w3, SEA_DROP_ADDR, [nft_addr], on_update, from_block=matrix.block_number).start()
+            print(f"Waiting For Drop Start In {drop.start_time - time.time():.0f}s (Watching PublicDropUpdated) ...")
+            gate.wait()
+            with lock:
+                drop = state["drop"]
+                # the base fee moved while waiting: txs signed with the old fees go out mispriced
+                fee_engine.refresh(force=True)
+                new_fees = fee_engine.fees()
+                if new_fees != fees:
+                    print(f"Gas Price Moved : {fee_engine.describe(fees)} -> {fee_engine.describe(new_fees)}")
+                    fees = new_fees
+                    for tx in all_txs:
+                        for k in fee_fields(tx):
+                            tx.pop(k)
+                        tx.update(fees)
+                    txs = affordable_txs(all_txs, matrix.balances)
+                    able = [tx["from"] for tx in txs]
+                    print(f"Wallets Able To Pay Value + Gas : {len(able)}/{len(wallets)}")
+                    presigner.sign(txs, "Re-Signed With New Fees")
+                stream = presigner.take()
+            print(f"Drop Open : {presigner.ready()}/{len(txs)} Txs Signed Ahead")
+        else:
+            stream = presigner.take()
+        t0 = time.perf_counter()
+        sent = broadcast_stream(w3, stream, None, tracker, on_sent=on_sent, txs=txs)
+        if watcher is not None:
+            watcher.stop()
+        if "first_sent" in done:
+            print(f"First Broadcast : {done['first_sent'] - drop.start_time:+.3f}s vs startTime")
+
+        settled = settle(w3, txs, sent, futures, accounts, fee_engine, tracker, on_replaced, on_landed)
+        rows = []
+        for i, w in enumerate(able):
+            res = settled.get(i, sent.get(i))
+            row = {"address": w, "status": "error", "tx_hash": None, "gas_used": None, "error": None, "seconds": 0.0,
+                   "mint_count": matrix.mint_counts.get((w, nft_addr))}
+            if isinstance(res, Exception) or res is None:
+                row["error"] = str(res)
+                row["tx_hash"] = sent.get(i) if isinstance(sent.get(i), str) else None
+            else:
+                row["tx_hash"], receipt = res
+                row["gas_used"] = receipt.gasUsed
+                row["status"] = "success" if receipt.status == 1 else "reverted"
+            row["seconds"] = landed.get(i, time.perf_counter()) - t0
+            rows.append(row)
+        tracker.stop()
+        asyncMint.print_result_table(rows)
+    except Exception as e:
+        print("Fatal Error : ", e)
+    finally:
+        if signer is not None:
+            signer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+import asyncio, json, multiprocessing, os, statistics, sys, time
+
+import asyncMint
+from mintCommon import (
+    MULTIMINT_ADDR, MULTIMINT_V2_ADDR, SUPPORTED_CHAIN_IDS, SYMBOLS, to_checksum, parse_gwei_input, load_private_keys,
+)
+
+# Multi-chain campaign runner -------------------------------------------------------
+# One campaign file, one worker PROCESS per chain: every chain gets its own interpreter,
+# RPC pool, receipt tracker and nonce state (module singletons are per process), and
+# runs the asyncMint engine for its wallets. The parent only collects the per-chain
+# results and prints one combined summary (throughput + latency per chain).
+#
+# Campaign file (JSON):
+# {
+#   "defaults": {"wallets": "keys.txt", "concurrency": 50, "multimint": 2},
+#   "chains": [
+#     {"name": "base", "chain_id": 8453, "rpc": ["https://...", "https://..."], "nft": "0x...", "total": 2},
+#     {"name": "arb", "chain_id": 42161, "rpc": ["https://..."], "nft": "0x...", "total": 1, "wallets": "arb.txt",
+#      "gas_gwei": "0.02"}
+#   ]
+# }
+
+DEFAULT_CAMPAIGN = "campaign.json"
+CHAIN_FIELDS = ("chain_id", "rpc", "nft", "total")
+
+
+def load_campaign(path) -> list:
+    """Campaign file -> list of per-chain job dicts (defaults merged, fields checked)."""
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    defaults = raw.get("defaults", {})
+    jobs = []
+    for i, entry in enumerate(raw.get("chains", [])):
+        job = {"wallets": "keys.txt", "concurrency": None, "multimint": 2, "gas_gwei": None, **defaults, **entry}
+        missing = [k for k in CHAIN_FIELDS if job.get(k) in (None, "", [])]
+        if missing:
+            raise ValueError(f"Campaign Entry {i + 1} Missing : {', '.join(missing)}")
+        job["chain_id"] = int(job["chain_id"])
+        if job["chain_id"] not in SUPPORTED_CHAIN_IDS:
+            raise ValueError(f"Chain Not Supported : {job['chain_id']}")
+        if isinstance(job["rpc"], str):
+            job["rpc"] = [u.strip() for u in job["rpc"].split(",") if u.strip()]
+        job["nft"] = to_checksum(job["nft"])
+        job["total"] = int(job["total"])
+        job.setdefault("name", str(job["chain_id"]))
+        jobs.append(job)
+    if not jobs:
+        raise ValueError("Campaign Has No Chains")
+    names = [j["name"] for j in jobs]
+    if len(set(names)) != len(names):
+        raise ValueError("Campaign Chain Names Must Be Unique")
+    return jobs
+
+
+class _Prefixed:
+    """stdout wrapper: every line a worker prints starts with its chain name."""
+
+    def __init__(self, stream, prefix):
+        self.stream = stream
+        self.prefix = prefix
+        self.line_start = True
+
+    def write(self, text):
+        out = []
+        for part in text.splitlines(keepends=True):
+            if self.line_start:
+                out.append(self.prefix)
+            out.append(part)
+            self.line_start = part.endswith("\n")
+        self.stream.write("".join(out))
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_chain(job) -> dict:
+    """Worker process entry: mint on one chain, return a picklable result summary."""
+    sys.stdout = _Prefixed(sys.stdout, f"[{job['name']}] ")
+    summary = {"name": job["name"], "chain_id": job["chain_id"], "nft": job["nft"], "total": job["total"],
+               "wallets": 0, "results": [], "error": None, "seconds": 0.0}
+    t0 = time.perf_counter()
+    try:
+        keys = load_private_keys(job["wallets"])
+        if not keys:
+            raise ValueError(f"No Private Keys Found In {job['wallets']}")
+        summary["wallets"] = len(keys)
+        multimint = MULTIMINT_ADDR if str(job["multimint"]) == "1" else MULTIMINT_V2_ADDR
+        gas_price = parse_gwei_input(str(job["gas_gwei"])) if job["gas_gwei"] is not None else None
+        concurrency = job["concurrency"] or asyncMint.DEFAULT_CONCURRENCY
+        # one journal connection per chain process (SQLite WAL takes concurrent writers)
+        from mintJournal import get_journal
+        summary["results"] = asyncio.run(asyncMint.run_mint_engine(
+            ",".join(job["rpc"]), keys, job["nft"], job["total"], concurrency, multimint, gas_price,
+            expect_chain_id=job["chain_id"], journal=get_journal()))
+    except Exception as e:
+        summary["error"] = str(e)
+    finally:
+        summary["seconds"] = time.perf_counter() - t0
+        sys.stdout.flush()
+    return summary
+
+
+def chain_stats(summary) -> dict:
+    """Throughput and latency for one chain's results."""
+    results = summary["results"]
+    ok = [r for r in results if r["status"] == "success"]
+    lat = sorted(r["seconds"] for r in ok)
+    secs = summary["seconds"] or 1e-9
+    return {
+        "sent": sum(1 for r in results if r["tx_hash"]),
+        "success": len(ok),
+        "minted": len(ok) * summary["total"],
+        "tx_per_s": len(ok) / secs,
+        "nft_per_s": len(ok) * summary["total"] / secs,
+        "p50_s": statistics.median(lat) if lat else None,
+        "p95_s": lat[min(len(lat) - 1, int(len(lat) * 0.95))] if lat else None,
+        "gas_used": sum(r["gas_used"] or 0 for r in ok),
+    }
+
+
+def run_campaign(jobs, processes=None) -> list:
+    """Every chain in its own process, all at once. Returns the summaries in campaign order."""
+    # spawn: no sockets / nonce caches inherited from the parent
+    ctx = multiprocessing.get_context("spawn")
+    # chunksize=1 / one task per process: chains never queue behind each other in one worker
+    with ctx.Pool(processes or len(jobs), maxtasksperchild=1) as pool:
+        return pool.map(run_chain, jobs, chunksize=1)
+
+
+def print_campaign_report(summaries, seconds=None):
+    print(f"{'Chain':<12}{'ChainId':>8}{'Wallets':>9}{'Sent':>6}{'OK':>6}{'NFTs':>7}{'Tx/s':>8}"
+          f"{'p50':>8}{'p95':>8}{'Secs':>8}  Error")
+    for s in summaries:
+        st = chain_stats(s)
+        p50 = f"{st['p50_s']:.2f}" if st["p50_s"] is not None else "-"
+        p95 = f"{st['p95_s']:.2f}" if st["p95_s"] is not None else "-"
+        print(f"{s['name']:<12}{s['chain_id']:>8}{s['wallets']:>9}{st['sent']:>6}{st['success']:>6}{st['minted']:>7}"
+              f"{st['tx_per_s']:>8.2f}{p50:>8}{p95:>8}{s['seconds']:>8.2f}  {s['error'] or ''}")
+    ok = sum(chain_stats(s)["success"] for s in summaries)
+    wallets = sum(s["wallets"] for s in summaries)
+    line = f"Campaign : {ok}/{wallets} Wallet Mints OK On {len(summaries)} Chain(s)"
+    if seconds is not None:
+        line += f" In {seconds:.2f}s"
+    print(line)
+
+
+# MAIN -----------------------------------------------------------------------
+def main():
+    try:
+        print('Auto SeaDrop MultiMint Multi Chain Campaign By ADFMIDN Team')
+        print('')
+        path = input(f"Input Campaign File [{DEFAULT_CAMPAIGN}] : ").strip() or DEFAULT_CAMPAIGN
+        if not os.path.exists(path):
+            print("Campaign File Not Found! Exiting...")
+            return
+        jobs = load_campaign(path)
+        for job in jobs:
+            print(f"{job['name']} ({job['chain_id']}, {SYMBOLS.get(job['chain_id'], 'ETH')}) : {job['nft']} x "
+                  f"{job['total']} | {len(job['rpc'])} RPC(s) | Wallets : {job['wallets']}")
+        t0 = time.perf_counter()
+        summaries = run_campaign(jobs)
+        print_campaign_report(summaries, time.perf_counter() - t0)
+    except Exception as e:
+        print("Fatal Error : ", e)
+
+
+if __name__ == "__main__":
+    main()
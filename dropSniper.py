@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+from dataclasses import astuple
+from eth_account import Account
+import time, threading
+
+from mintCommon import (
+    SEA_DROP_ADDR, MULTIMINT_ADDR, MULTIMINT_V2_ADDR, SUPPORTED_CHAIN_IDS, SYMBOLS,
+    get_contract, SEA_FRAGMENTS, MULTI_FRAGMENTS, to_checksum, parse_gwei_input,
+)
+from nonceManager import NONCES
+from replacementManager import send_with_replacement, fee_fields
+from rpcPool import connect_multi
+from feeEngine import FeeEngine, max_fee_per_gas, policy_for
+from dropWatcher import DropWatcher, DropGate
+
+# Drop-start sniper ---------------------------------------------------------------
+# Reads startTime/endTime/mintPrice/maxTotalMintableByWallet from getPublicDrop,
+# builds + signs the mintMulti tx before the sale opens (fixed gas limit, local nonce)
+# and at startTime only calls send_raw_transaction. While waiting, PublicDropUpdated
+# logs re-sign the tx with a new price and move the start (dropWatcher). Once sent it is
+# followed like any other mint: receipt tracker, same-nonce fee bump when stuck.
+
+DEFAULT_GAS_PER_MINT = 250_000   # per NFT, mintMulti deploys one child contract per token
+POLL_INTERVAL = 0.25
+
+
+def read_public_drop(sea_contract, nft_addr) -> dict:
+    return _drop_dict(sea_contract.functions.getPublicDrop(nft_addr).call())
+
+
+def _drop_dict(tup) -> dict:
+    return {
+        "mintPrice": int(tup[0]),
+        "startTime": int(tup[1]),
+        "endTime": int(tup[2]),
+        "maxTotalMintableByWallet": int(tup[3]),
+        "feeBps": int(tup[4]),
+        "restrictFeeRecipients": bool(tup[5]),
+    }
+
+
+def presign_mint(w3, multi_contract, acct, nft_addr, total, drop, chain_id, fees, gas_limit):
+    """
+    Build & sign mintMulti ahead of time. No estimate_gas (it reverts before the drop is live),
+    so gas_limit is fixed by the caller. fees: FeeEngine.fees() dict. Returns (tx_dict, signed).
+    """
+    tx = multi_contract.functions.mintMulti(total, nft_addr).build_transaction({
+        "chainId": chain_id,
+        "from": acct.address,
+        "value": drop["mintPrice"] * total,
+        "gas": int(gas_limit),
+        **fees,
+        "nonce": 0,
+    })
+    tx["nonce"] = NONCES.next_nonce(w3, acct.address, chain_id)
+    try:
+        return tx, acct.sign_transaction(tx)
+    except Exception:
+        NONCES.release(chain_id, acct.address, tx["nonce"])
+        raise
+
+
+def find_first_block_at(w3, ts: int, hint_block: int = None, block_time: float = None):
+    """
+    Return the first block with timestamp >= ts (waits for it if it's not mined yet).
+    hint_block: any block known to be >= ts (e.g. the receipt block) to search down from.
+    block_time: expected seconds per block, sizes the first step back (doubled until it
+    passes ts), then a binary search - O(log n) get_block calls however far back ts is.
+    """
+    if hint_block is None:
+        while True:
+            top = w3.eth.get_block("latest")
+            if top.timestamp >= ts:
+                break
+            time.sleep(POLL_INTERVAL)
+    else:
+        top = w3.eth.get_block(int(hint_block))
+    blocks = {top.number: top}
+
+    def block(n):
+        if n not in blocks:
+            blocks[n] = w3.eth.get_block(n)
+        return blocks[n]
+
+    # lower bound: lo below ts, hi at/after it
+    hi = top.number
+    step = max(1, int((top.timestamp - ts) / block_time) + 1) if block_time else 1
+    while True:
+        lo = max(0, hi - step)
+        if block(lo).timestamp < ts:
+            break
+        hi = lo
+        if lo == 0:
+            return block(0)
+        step *= 2
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if block(mid).timestamp >= ts:
+            hi = mid
+        else:
+            lo = mid
+    return block(hi)
+
+
+def snipe(w3, multi_contract, sea_contract, acct, nft_addr, total, chain_id, fee_engine,
+          gas_limit=None, lead: float = 0.0, timeout=600, drop=None, from_block=None, journal=None, kind="mint"):
+    """
+    Full scheduled mint. Returns a report dict with broadcast latency relative to the
+    first block at/after startTime. from_block: block `drop` was read at, drop updates
+    after it are followed until the send. journal: every hash sent and the receipt
+    (kind "mint": the minted tokens too). Raises StuckTransactionError when nothing landed.
+    """
+    if drop is None:
+        from_block = w3.eth.block_number
+        drop = read_public_drop(sea_contract, nft_addr)
+    now = int(time.time())
+    if drop["endTime"] and now > drop["endTime"]:
+        raise ValueError("Public Drop Already Ended")
+    max_wallet = drop["maxTotalMintableByWallet"]
+    if max_wallet and total > max_wallet:
+        # one pre-signed mintMulti can't exceed it; more needs shards / wallets (multiMint menu 1, asyncMint)
+        raise ValueError(f"Total {total} > maxTotalMintableByWallet {max_wallet}")
+    if gas_limit is None:
+        gas_limit = DEFAULT_GAS_PER_MINT * total
+
+    fees = fee_engine.fees()
+    bal = w3.eth.get_balance(acct.address)
+    reserve = gas_limit * max_fee_per_gas(fees)
+    if bal < drop["mintPrice"] * total + reserve:
+        raise ValueError("Not Enought Native Balance For Value + Gas")
+
+    tx, signed = presign_mint(w3, multi_contract, acct, nft_addr, total, drop, chain_id, fees, gas_limit)
+    print(f"Pre-Signed Mint : nonce={tx['nonce']} gas={gas_limit} value={drop['mintPrice'] * total}")
+    if drop["startTime"] - lead > time.time():
+        # not live yet: hold the signed tx until startTime and follow PublicDropUpdated
+        # (new price -> re-signed on the same nonce, new start -> gate moves / opens at once)
+        state = {"drop": drop, "signed": signed}
+        gate = DropGate(drop["startTime"], lead)
+        lock = threading.Lock()
+
+        def on_update(nft, new, block):
+            new = _drop_dict(astuple(new))
+            print(f"PublicDropUpdated (Block {block}) : Price {new['mintPrice'] / 1e18:g} | "
+                  f"Start {new['startTime']} | End {new['endTime']}")
+            with lock:
+                if new["mintPrice"] != state["drop"]["mintPrice"] and not gate.is_set():
+                    tx["value"] = new["mintPrice"] * total
+                    state["signed"] = acct.sign_transaction(tx)
+                    print(f"Re-Signed Mint : nonce={tx['nonce']} value={tx['value']}")
+                state["drop"] = new
+            gate.update(new["startTime"])
+
+        watcher = DropWatcher(w3, sea_contract.address, [nft_addr], on_update, from_block=from_block).start()
+        print(f"Waiting For Drop Start In {drop['startTime'] - now}s (Watching PublicDropUpdated) ...")
+        gate.wait()
+        watcher.stop()
+        with lock:
+            drop, signed = state["drop"], state["signed"]
+            # the base fee moved while waiting: a tx signed with the old fees goes out mispriced
+            fee_engine.refresh(force=True)
+            new_fees = fee_engine.fees()
+            if new_fees != fees:
+                print(f"Gas Price Moved : {fee_engine.describe(fees)} -> {fee_engine.describe(new_fees)}")
+                for k in fee_fields(tx):
+                    tx.pop(k)
+                tx.update(new_fees)
+                reserve = gas_limit * max_fee_per_gas(new_fees)
+                signed = acct.sign_transaction(tx)
+        if bal < tx["value"] + reserve:
+            NONCES.release(chain_id, acct.address, tx["nonce"])
+            raise ValueError("Not Enought Native Balance For Value + Gas")
+
+    sent = []
+
+    def on_sent(tx_hash, fees):
+        sent.append(time.time())
+        if len(sent) == 1:
+            print("Sent Tx : ", tx_hash)
+        if journal is not None:
+            journal.record_sent(chain_id, acct.address, tx["nonce"], tx_hash, kind, nft_addr, total, fees)
+
+    # pre-signed tx first; stuck -> re-signed on the same nonce with bumped fees
+    t_send = time.time()
+    result = send_with_replacement(w3, acct, tx, fee_engine, timeout=timeout, on_sent=on_sent, kind="mint",
+                                   signed=signed)
+    receipt, tx_hash = result["receipt"], result["landed_hash"]
+    if result["replacements"]:
+        print(f"Landed Tx : {tx_hash} ({result['replacements']} Replacement(s) Sent)")
+    if journal is not None:
+        journal.record_receipt(tx_hash, receipt)
+        if kind == "mint" and receipt.status == 1:
+            from mintJournal import record_mint_receipt
+            record_mint_receipt(journal, chain_id, acct.address, receipt, multi_contract.address)
+    first_blk = find_first_block_at(w3, drop["startTime"], receipt.blockNumber, policy_for(chain_id)["block_time"])
+    return {
+        "tx_hash": tx_hash,
+        "status": receipt.status,
+        "total": total,
+        "startTime": drop["startTime"],
+        "first_block": first_blk.number,
+        "first_block_time": first_blk.timestamp,
+        "inclusion_block": receipt.blockNumber,
+        "blocks_after_start": receipt.blockNumber - first_blk.number,
+        "send_rpc_seconds": sent[0] - t_send,
+        # >0: broadcast after the first live block was stamped; <0: we were in the mempool before it
+        "broadcast_latency": t_send - first_blk.timestamp,
+        "receipt": receipt,
+    }
+
+
+def print_snipe_report(report):
+    print("Mint Receipt Status : ", report["status"])
+    print("Start Time : ", report["startTime"])
+    print(f"First Block At/After Start : {report['first_block']} (ts {report['first_block_time']})")
+    print(f"Included In Block : {report['inclusion_block']} (+{report['blocks_after_start']} blocks)")
+    print(f"Broadcast Latency vs First Live Block : {report['broadcast_latency']:+.3f}s")
+    print(f"send_raw_transaction RPC Time : {report['send_rpc_seconds']:.3f}s")
+
+
+# MAIN -----------------------------------------------------------------------
+def main():
+    try:
+        print('Auto SeaDrop MultiMint Sniper By ADFMIDN Team')
+        print('')
+        rpc = input("Input RPC URL (Comma Separated For Multi RPC) : ").strip()
+        if not rpc:
+            print("RPC URL Required!")
+            return
+        w3, _ = connect_multi(rpc)
+        if w3 is None:
+            print("Unable To Connect To RPC. Exiting...")
+            return
+        chain_id = w3.eth.chain_id
+        print("chainId =", chain_id)
+        if chain_id not in SUPPORTED_CHAIN_IDS:
+            print("Chain Not Supported. Supported : ", SUPPORTED_CHAIN_IDS)
+            return
+        native_symbol = SYMBOLS.get(chain_id, "ETH")
+
+        version = input("MultiMint Contract (1 = V1 Manual Withdraw / 2 = V2 Auto Withdraw) [2] : ").strip() or "2"
+        multimint = MULTIMINT_ADDR if version == "1" else MULTIMINT_V2_ADDR
+        sea_contract = get_contract(w3, SEA_DROP_ADDR, *SEA_FRAGMENTS)
+        multi_contract = get_contract(w3, multimint, *MULTI_FRAGMENTS)
+
+        acct = Account.from_key(input("Input Private Key EVM : ").strip())
+        print("Using Address : ", acct.address)
+
+        gas_inp = input("Input Custom GWEI/Gas Price ( 0.01/1/10/100 ) Or Leave Blank [Default] : ")
+        fee_engine = FeeEngine(w3, chain_id, parse_gwei_input(gas_inp))
+        fees = fee_engine.fees()
+        print(f"Using Gas Price : {fee_engine.describe(fees)}")
+
+        nft_addr = to_checksum(input("Input NFT Contract Address : ").strip())
+        total = int(input("Total Mint NFT : ").strip())
+        gas_inp = input(f"Gas Limit [Blank = {DEFAULT_GAS_PER_MINT} x Total] : ").strip()
+        gas_limit = int(gas_inp) if gas_inp else None
+        lead_inp = input("Send Lead Seconds Before startTime [0] : ").strip()
+        lead = float(lead_inp) if lead_inp else 0.0
+
+        from_block = w3.eth.block_number
+        drop = read_public_drop(sea_contract, nft_addr)
+        print(f"Price Per Token : {drop['mintPrice'] / 1e18:g} {native_symbol}")
+        print(f"Start : {drop['startTime']} End : {drop['endTime']} Max Per Wallet : {drop['maxTotalMintableByWallet']}")
+
+        from mintJournal import get_journal
+        kind = "mint" if multimint == MULTIMINT_ADDR else "mint_v2"
+        report = snipe(w3, multi_contract, sea_contract, acct, nft_addr, total, chain_id, fee_engine, gas_limit, lead,
+                       drop=drop, from_block=from_block, journal=get_journal(), kind=kind)
+        print_snipe_report(report)
+    except Exception as e:
+        print("Fatal Error : ", e)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+from web3 import Web3
+from eth_abi import decode
+import time, threading
+
+from preflight import DropConfig
+from receiptDecoder import as_bytes
+
+# PublicDropUpdated watcher ---------------------------------------------------------
+# Follows SeaDrop PublicDropUpdated logs for a set of NFTs instead of re-reading
+# getPublicDrop / retrying estimate_gas. Every poll is ONE JSON-RPC batch
+# [eth_blockNumber, eth_getLogs(cursor+1 .. latest)] with all NFTs in one topic OR-list,
+# so the RPC load is the same for 1 or 500 contracts; the new PublicDrop is decoded from
+# the log data locally. DropGate holds pre-signed mints until startTime and follows
+# start time changes.
+
+PUBLIC_DROP_UPDATED_TOPIC = bytes(Web3.keccak(text="PublicDropUpdated(address,(uint80,uint48,uint48,uint16,uint16,bool))"))
+DROP_TYPES = ["(uint80,uint48,uint48,uint16,uint16,bool)"]
+POLL_INTERVAL = 0.5         # below the block time of most supported chains -> seen within one block
+
+
+def _topic_addr(addr) -> str:
+    return "0x" + "00" * 12 + Web3.to_checksum_address(addr)[2:].lower()
+
+
+def _hex(b: bytes) -> str:
+    return "0x" + bytes(b).hex()
+
+
+def _qty(x) -> int:
+    return int(x, 16) if isinstance(x, str) else int(x)
+
+
+def decode_drop_log(log):
+    """PublicDropUpdated log (dict from eth_getLogs) -> (nft checksum address, DropConfig)."""
+    nft = Web3.to_checksum_address(as_bytes(log["topics"][1])[-20:])
+    return nft, DropConfig.from_tuple(decode(DROP_TYPES, as_bytes(log["data"]))[0])
+
+
+class DropWatcher:
+    """
+    on_update(nft, drop: DropConfig, block_number) for every PublicDropUpdated of `nfts`,
+    called from the watcher thread in log order. from_block: block the drop was last read
+    at (e.g. the preflight block), so updates mined since then are not missed.
+    """
+
+    def __init__(self, w3, sea_addr, nfts, on_update, poll_interval=POLL_INTERVAL, from_block=None):
+        self.w3 = w3
+        self.sea_addr = Web3.to_checksum_address(sea_addr)
+        self.nfts = [Web3.to_checksum_address(n) for n in nfts]
+        self.on_update = on_update
+        self.poll_interval = poll_interval
+        self.cursor = from_block    # last block already scanned
+        self.polls = 0
+        self.rpc_requests = 0
+        self.updates = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _filter(self, from_block, to_block="latest") -> dict:
+        return {"address": self.sea_addr, "topics": [_hex(PUBLIC_DROP_UPDATED_TOPIC), [_topic_addr(n) for n in self.nfts]],
+                "fromBlock": hex(from_block), "toBlock": to_block if isinstance(to_block, str) else hex(to_block)}
+
+    def start(self):
+        if self._thread is not None:
+            return self
+        if self.cursor is None:
+            self.rpc_requests += 1
+            self.cursor = self.w3.eth.block_number
+        self._thread = threading.Thread(target=self._run, name="drop-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def poll_once(self) -> int:
+        """Scan cursor+1 .. head; returns the number of updates delivered."""
+        self.polls += 1
+        head, logs = self._head_and_logs(self.cursor + 1)
+        if head <= self.cursor:
+            return 0
+        # logs past `head` (mined between the two calls) are read again next poll
+        logs = sorted((l for l in logs if _qty(l["blockNumber"]) <= head and not l.get("removed")),
+                      key=lambda l: (_qty(l["blockNumber"]), _qty(l["logIndex"])))
+        self.cursor = head
+        for log in logs:
+            try:
+                nft, drop = decode_drop_log(log)
+            except Exception:
+                continue
+            self.updates += 1
+            self.on_update(nft, drop, _qty(log["blockNumber"]))
+        return len(logs)
+
+    def _head_and_logs(self, from_block):
+        requests = [("eth_blockNumber", []), ("eth_getLogs", [self._filter(from_block)])]
+        self.rpc_requests += 1
+        try:
+            resp = self.w3.provider.make_batch_request(requests)
+            if isinstance(resp, list) and len(resp) == 2:
+                head_r, logs_r = sorted(resp, key=lambda r: r.get("id", 0))
+                if head_r.get("error") is None:
+                    head = _qty(head_r["result"])
+                    # no new block yet: fromBlock > latest is an error on some nodes
+                    if head < from_block:
+                        return head, []
+                    if logs_r.get("error") is None:
+                        return head, logs_r["result"] or []
+        except Exception:
+            pass
+        # no batch support (or an error in it): same two reads one after the other
+        self.rpc_requests += 2
+        head = self.w3.eth.block_number
+        if head < from_block:
+            return head, []
+        return head, self.w3.eth.get_logs(self._filter(from_block, head))
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception:
+                # transient RPC error: keep the cursor, retry next tick
+                pass
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+
+class DropGate:
+    """
+    Event-like gate that opens at start_time - lead (local clock). update() moves the
+    start; a start time already in the past opens it at once.
+    """
+
+    def __init__(self, start_time, lead=0.0):
+        self.start_time = int(start_time)
+        self.lead = lead
+        self._cond = threading.Condition()
+        self._open = False
+        threading.Thread(target=self._run, name="drop-gate", daemon=True).start()
+
+    def _run(self):
+        with self._cond:
+            while not self._open:
+                remaining = self.start_time - self.lead - time.time()
+                if remaining <= 0:
+                    self._open = True
+                    self._cond.notify_all()
+                    return
+                self._cond.wait(min(remaining, 1.0))
+
+    def update(self, start_time):
+        with self._cond:
+            self.start_time = int(start_time)
+            self._cond.notify_all()
+
+    def set(self):
+        with self._cond:
+            self._open = True
+            self._cond.notify_all()
+
+    def is_set(self) -> bool:
+        return self._open
+
+    def wait(self, timeout=None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._open, timeout)
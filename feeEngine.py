@@ -0,0 +1,210 @@
+import threading, time
+
+# EIP-1559 fee engine ---------------------------------------------------------------
+# Builds type-2 fee fields (maxFeePerGas / maxPriorityFeePerGas) from a cached,
+# incrementally updated eth_feeHistory window. fees(attempt) is pure computation on
+# the cache, so every send and every replacement gets fees without a round-trip.
+# Blocks the receipt tracker already fetched are fed in through observe_block(), so
+# the base fee follows the chain for free while txs are in flight; eth_feeHistory is
+# only read to prime the cache, or when no block came in for STALE_SECONDS (tracker
+# idle), and then only for the new blocks.
+# Chains without a base fee fall back to legacy gasPrice.
+
+GWEI = 1_000_000_000
+REWARD_PERCENTILES = [10, 25, 50, 75, 90]
+
+DEFAULT_POLICY = {
+    "window": 20,            # blocks kept in the cache
+    "percentile": 50,        # starting tip percentile, escalates with each attempt
+    "base_mult": 2.0,        # maxFee = base_mult * next base fee + tip (survives ~6 full blocks on L1)
+    "min_tip": 0,            # wei
+    "block_time": 2.0,       # seconds, base fee TTL
+    "tip_ttl_blocks": 5,     # tips change slower than the base fee
+}
+
+# Per-chain overrides
+CHAIN_FEE_POLICY = {
+    1: {"percentile": 50, "base_mult": 2.0, "min_tip": GWEI // 10, "block_time": 12.0},
+    10: {"percentile": 50, "base_mult": 1.5, "min_tip": 1_000_000, "block_time": 2.0},
+    8453: {"percentile": 50, "base_mult": 1.5, "min_tip": 1_000_000, "block_time": 2.0},
+    # Arbitrum ignores the tip; base fee alone decides inclusion
+    42161: {"percentile": 10, "base_mult": 1.5, "min_tip": 0, "block_time": 0.25},
+    # Polygon PoS enforces a minimum tip (25-30 gwei)
+    137: {"percentile": 50, "base_mult": 2.0, "min_tip": 30 * GWEI, "block_time": 2.0},
+    43114: {"percentile": 50, "base_mult": 2.0, "min_tip": GWEI // 100, "block_time": 2.0},
+    2741: {"percentile": 50, "base_mult": 1.5, "min_tip": 0, "block_time": 1.0},
+    143: {"percentile": 50, "base_mult": 2.0, "min_tip": GWEI // 10, "block_time": 0.5},
+    80094: {"percentile": 50, "base_mult": 2.0, "min_tip": GWEI // 1000, "block_time": 2.0},
+    999: {"percentile": 50, "base_mult": 2.0, "min_tip": GWEI // 100, "block_time": 1.0},
+}
+
+LEGACY_MULT = 1.2            # node gas_price * 1.2, same as the original scripts
+ATTEMPT_BUMP = 0.125         # +12.5% per retry on top of the percentile escalation
+STALE_SECONDS = 30.0         # no base fee update for this long -> fees() refreshes once
+
+
+def policy_for(chain_id) -> dict:
+    p = dict(DEFAULT_POLICY)
+    p.update(CHAIN_FEE_POLICY.get(int(chain_id), {}))
+    return p
+
+
+def next_base_fee(block) -> int:
+    """
+    EIP-1559 base fee of the block after `block` (elasticity 2, denominator 8).
+    OP-stack chains use other constants; base_mult headroom absorbs the difference.
+    """
+    base = int(block["baseFeePerGas"])
+    target = int(block["gasLimit"]) // 2
+    used = int(block["gasUsed"])
+    if target == 0 or used == target:
+        return base
+    if used > target:
+        return base + max(1, base * (used - target) // target // 8)
+    return base - base * (target - used) // target // 8
+
+
+def max_fee_per_gas(fees: dict) -> int:
+    """Worst-case price per gas for balance checks, for either fee style."""
+    return int(fees.get("maxFeePerGas", fees.get("gasPrice", 0)))
+
+
+class FeeEngine:
+    """
+    fees(attempt)  -> {"maxFeePerGas", "maxPriorityFeePerGas"} or {"gasPrice"}, from the cache
+    refresh()      -> explicit catch-up read (e.g. after waiting for a drop)
+    fixed_gas_price: user typed gwei -> always legacy gasPrice with that value (old behaviour).
+    """
+
+    def __init__(self, w3, chain_id, fixed_gas_price=None, policy=None):
+        self.w3 = w3
+        self.chain_id = int(chain_id)
+        self.policy = policy or policy_for(chain_id)
+        self.fixed_gas_price = fixed_gas_price
+        self.supports_1559 = None
+        self.legacy_gas_price = None
+        self._lock = threading.Lock()
+        self._blocks = {}           # block number -> (base_fee, [reward per percentile])
+        self._next_base_fee = None
+        self._newest = None
+        self._updated_at = 0.0          # last feeHistory merge (tips + base fee)
+        self._base_updated_at = 0.0     # last base fee update from any source
+        self.rpc_calls = 0
+
+    # cache -------------------------------------------------------------------------
+    def prime(self, fee_history=None, base_fee=None, gas_price=None):
+        """
+        Seed from data the caller already has (preflight batch) so the first fees() is free.
+        base_fee None means the chain has no 1559 base fee.
+        """
+        if gas_price is not None:
+            self.legacy_gas_price = int(gas_price)
+        if fee_history is not None:
+            self._merge(fee_history)
+            self.supports_1559 = self._next_base_fee is not None and self._next_base_fee > 0
+        elif base_fee is not None:
+            self.supports_1559 = True
+            with self._lock:
+                self._next_base_fee = int(base_fee)
+                self._base_updated_at = time.time()
+        elif gas_price is not None:
+            self.supports_1559 = False
+
+    def _merge(self, fh):
+        oldest = int(fh["oldestBlock"])
+        base_fees = [int(b) for b in fh.get("baseFeePerGas") or []]
+        rewards = fh.get("reward") or []
+        n = len(fh.get("gasUsedRatio") or rewards)
+        with self._lock:
+            for i in range(n):
+                r = [int(x) for x in rewards[i]] if i < len(rewards) else []
+                bf = base_fees[i] if i < len(base_fees) else 0
+                self._blocks[oldest + i] = (bf, r)
+            if n:
+                newest = oldest + n - 1
+                if self._newest is None or newest >= self._newest:
+                    self._newest = newest
+                    # feeHistory returns n+1 base fees: the last one is the NEXT block's
+                    if len(base_fees) > n:
+                        self._next_base_fee = base_fees[n]
+                    elif base_fees:
+                        self._next_base_fee = base_fees[-1]
+            # trim to window
+            keep = self.policy["window"]
+            for b in sorted(self._blocks)[:-keep]:
+                del self._blocks[b]
+            self._updated_at = self._base_updated_at = time.time()
+
+    def observe_block(self, block):
+        """Block listener (receipt tracker): track the base fee without any RPC call."""
+        if block.get("baseFeePerGas") is None:
+            return
+        with self._lock:
+            number = int(block["number"])
+            if self._newest is not None and number <= self._newest:
+                return
+            self._next_base_fee = next_base_fee(block)
+            self._base_updated_at = time.time()
+
+    def refresh(self, force=False):
+        """
+        Fetch only the blocks produced since the last update (one eth_feeHistory call);
+        legacy chains read eth_gasPrice again when forced.
+        """
+        if self.fixed_gas_price is not None:
+            return
+        now = time.time()
+        age = now - self._updated_at
+        base_fresh = now - self._base_updated_at < self.policy["block_time"]
+        tips_fresh = age < self.policy["block_time"] * self.policy["tip_ttl_blocks"]
+        if not force and base_fresh and tips_fresh:
+            return
+        window = self.policy["window"]
+        if self._newest is None:
+            count = window
+        else:
+            count = max(1, min(window, int(age / self.policy["block_time"]) + 1))
+        try:
+            self.rpc_calls += 1
+            fh = self.w3.eth.fee_history(count, "latest", REWARD_PERCENTILES)
+            self._merge(fh)
+            self.supports_1559 = self._next_base_fee is not None and self._next_base_fee > 0
+        except Exception:
+            # no eth_feeHistory -> legacy chain (a transient error keeps the old cache)
+            if self._next_base_fee is None:
+                self.supports_1559 = False
+        if not self.supports_1559 and (force or self.legacy_gas_price is None):
+            self.rpc_calls += 1
+            self.legacy_gas_price = int(self.w3.eth.gas_price)
+
+    # fees --------------------------------------------------------------------------
+    def _tip(self, attempt):
+        pcts = REWARD_PERCENTILES
+        start = pcts.index(self.policy["percentile"]) if self.policy["percentile"] in pcts else 2
+        idx = min(start + attempt, len(pcts) - 1)
+        with self._lock:
+            samples = sorted(r[idx] for _, r in self._blocks.values() if len(r) > idx)
+        # median of the window at that percentile ignores one-block outliers
+        tip = samples[len(samples) // 2] if samples else 0
+        return max(tip, self.policy["min_tip"])
+
+    def fees(self, attempt: int = 0) -> dict:
+        if self.fixed_gas_price is not None:
+            return {"gasPrice": int(self.fixed_gas_price)}
+        if self.supports_1559 is None:
+            self.refresh(force=True)
+        elif self.supports_1559 and time.time() - self._base_updated_at > STALE_SECONDS:
+            # nothing observed lately (no tx in flight): one catch-up read
+            self.refresh()
+        bump = 1.0 + ATTEMPT_BUMP * attempt
+        if not self.supports_1559:
+            return {"gasPrice": int(self.legacy_gas_price * LEGACY_MULT * bump)}
+        tip = int(self._tip(attempt) * bump)
+        max_fee = int(self.policy["base_mult"] * self._next_base_fee * bump) + tip
+        return {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": tip}
+
+    def describe(self, fees: dict) -> str:
+        if "gasPrice" in fees:
+            return f"Legacy gasPrice {fees['gasPrice'] / GWEI:g} gwei"
+        return (f"EIP-1559 maxFee {fees['maxFeePerGas'] / GWEI:g} gwei / "
+                f"tip {fees['maxPriorityFeePerGas'] / GWEI:g} gwei (next base {self._next_base_fee / GWEI:g} gwei)")
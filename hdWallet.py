@@ -0,0 +1,134 @@
+from getpass import getpass
+from eth_account import Account
+from eth_account.hdaccount import seed_from_mnemonic
+from eth_account.hdaccount.deterministic import Node, derive_child_key
+from eth_utils import keccak
+from Crypto.Cipher import AES
+from Crypto.Util import Counter
+import os, json, hmac, hashlib
+
+from mintCommon import load_private_keys
+
+# HD wallet source + encrypted key cache ---------------------------------------------
+# N wallets from one mnemonic (BIP44 m/44'/60'/0'/0/i, same as MetaMask / Rabby).
+# The seed and the parent node are computed once, each wallet is one child step from
+# there. Derived keys are cached in one password-encrypted file (scrypt + AES-128-CTR +
+# keccak MAC, the keystore v3 scheme over the whole key list) so later runs only pay a
+# single scrypt instead of the derivation; addresses stay readable without the password.
+
+DEFAULT_BASE_PATH = "m/44'/60'/0'/0"
+HD_CACHE = "hdWallets.json"
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 1 << 18, 8, 1     # keystore v3 defaults (~256 MB, ~1s once per load)
+
+
+def parse_path(path: str) -> list:
+    """"m/44'/60'/0'/0" -> [Node, ...] (hardened with ' or H)."""
+    parts = path.strip().rstrip("/").split("/")
+    if parts[0] not in ("m", "M"):
+        raise ValueError(f"Derivation Path Must Start With m/ : {path}")
+    return [Node.decode(p) for p in parts[1:]]
+
+
+def derive_keys(mnemonic: str, count: int, start=0, base_path=DEFAULT_BASE_PATH, passphrase="") -> list:
+    """Private keys (0x hex) of base_path/start .. base_path/start+count-1."""
+    seed = seed_from_mnemonic(mnemonic.strip(), passphrase)
+    master = hmac.new(b"Bitcoin seed", seed, hashlib.sha512).digest()
+    key, chain_code = master[:32], master[32:]
+    for node in parse_path(base_path):
+        key, chain_code = derive_child_key(key, chain_code, node)
+    return ["0x" + derive_child_key(key, chain_code, Node.decode(str(i)))[0].hex() for i in range(start, start + count)]
+
+
+# encrypted cache ------------------------------------------------------------------
+def _kdf(password: str, salt: bytes, n, r, p) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=2 * 128 * r * (n + p + 2), dklen=32)
+
+
+def save_key_cache(path, keys, password, base_path=DEFAULT_BASE_PATH, start=0):
+    salt, iv = os.urandom(32), os.urandom(16)
+    dk = _kdf(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    plain = b"".join(bytes.fromhex(k[2:] if k.startswith("0x") else k) for k in keys)
+    cipher = AES.new(dk[:16], AES.MODE_CTR, counter=Counter.new(128, initial_value=int.from_bytes(iv, "big")))
+    ct = cipher.encrypt(plain)
+    doc = {
+        "version": 1,
+        "base_path": base_path,
+        "start": start,
+        "addresses": [Account.from_key(k).address for k in keys],
+        "crypto": {
+            "cipher": "aes-128-ctr", "iv": iv.hex(), "ciphertext": ct.hex(),
+            "kdf": "scrypt", "kdfparams": {"n": SCRYPT_N, "r": SCRYPT_R, "p": SCRYPT_P, "dklen": 32, "salt": salt.hex()},
+            "mac": keccak(dk[16:32] + ct).hex(),
+        },
+    }
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f)
+    os.replace(tmp, path)
+    return doc
+
+
+def read_key_cache(path) -> dict:
+    """Cache file without decrypting (addresses, path); None when there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_key_cache(path, password) -> list:
+    doc = read_key_cache(path)
+    if doc is None:
+        raise FileNotFoundError(path)
+    c = doc["crypto"]
+    kp = c["kdfparams"]
+    dk = _kdf(password, bytes.fromhex(kp["salt"]), kp["n"], kp["r"], kp["p"])
+    ct = bytes.fromhex(c["ciphertext"])
+    if not hmac.compare_digest(keccak(dk[16:32] + ct), bytes.fromhex(c["mac"])):
+        raise ValueError("Wrong Password Or Corrupt Key Cache")
+    cipher = AES.new(dk[:16], AES.MODE_CTR, counter=Counter.new(128, initial_value=int(c["iv"], 16)))
+    plain = cipher.decrypt(ct)
+    return ["0x" + plain[i:i + 32].hex() for i in range(0, len(plain), 32)]
+
+
+def load_hd_wallets(count, password, mnemonic=None, cache=HD_CACHE, base_path=DEFAULT_BASE_PATH) -> list:
+    """
+    First `count` keys of the HD wallet: from the cache when it holds enough, otherwise
+    derived from `mnemonic` (only the missing indices) and written back to the cache.
+    """
+    keys = []
+    doc = read_key_cache(cache)
+    if doc is not None:
+        if doc.get("base_path") != base_path or doc.get("start", 0) != 0:
+            raise ValueError(f"Key Cache Is For {doc.get('base_path')}, Not {base_path}")
+        keys = load_key_cache(cache, password)
+        if len(keys) >= count:
+            return keys[:count]
+    if not mnemonic:
+        raise ValueError(f"Key Cache Holds {len(keys)} Wallet(s), Mnemonic Needed To Derive {count}")
+    if keys and Account.from_key(derive_keys(mnemonic, 1, 0, base_path)[0]).address != doc["addresses"][0]:
+        raise ValueError("Mnemonic Does Not Match The Key Cache")
+    keys += derive_keys(mnemonic, count - len(keys), len(keys), base_path)
+    save_key_cache(cache, keys, password, base_path)
+    return keys
+
+
+def prompt_wallet_keys(default_file="keys.txt") -> list:
+    """Ask for a private keys file or the HD wallet (mnemonic / encrypted cache)."""
+    src = input("Wallet Source (1 = Private Keys File / 2 = Mnemonic HD Wallet) [1] : ").strip() or "1"
+    if src != "2":
+        path = input(f"Input Private Keys File (one per line) [{default_file}] : ").strip() or default_file
+        return load_private_keys(path)
+    doc = read_key_cache(HD_CACHE)
+    cached = len(doc["addresses"]) if doc else 0
+    count_inp = input(f"Number Of Wallets{f' [{cached} Cached]' if cached else ''} : ").strip()
+    count = int(count_inp) if count_inp else cached
+    mnemonic = None
+    if count > cached:
+        mnemonic = getpass("Input Mnemonic (Hidden) : ")
+    password = getpass("Key Cache Password : ")
+    if doc is None and getpass("Repeat Password : ") != password:
+        raise ValueError("Passwords Do Not Match")
+    keys = load_hd_wallets(count, password, mnemonic)
+    print(f"HD Wallets : {len(keys)} ({DEFAULT_BASE_PATH}/0..{len(keys) - 1}, Cache {HD_CACHE})")
+    return keys
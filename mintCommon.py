@@ -0,0 +1,114 @@
+from web3 import Web3
+import json
+
+# Shared constants & minimal ABIs for the helper modules.
+# Unlike multiMint.py / multiMintV2.py this file has no side effects on import,
+# so the engines can be imported from other scripts.
+
+SEA_DROP_ADDR = "0x00005EA00Ac477B1030CE78506496e8C2dE24bf5"
+MULTIMINT_ADDR = "0x0000436623460303688165dF6a00466B507d0259"     # V1 (manual withdraw)
+MULTIMINT_V2_ADDR = "0x0000419B4B6132e05DfBd89F65B165DFD6fA126F"  # V2 (auto withdraw)
+
+SUPPORTED_CHAIN_IDS = {1, 10, 42161, 8453, 143, 137, 2741, 43114, 80094, 999}
+
+# Symbol map for native token display
+SYMBOLS = {
+    1: "ETH", 10: "ETH", 42161: "ETH", 8453: "ETH",
+    137: "POL", 43114: "AVAX", 143: "MON", 2741: "ETH",
+    80094: "BERA", 999: "HYPE"
+}
+
+# Minimal ABIs (only what's needed) -------------------------------------------
+# One raw JSON fragment per function/event; parsed on first use and cached, so
+# importing this module never pays for ABI parsing.
+ABI_FRAGMENTS = {
+    "getPublicDrop": '{"inputs":[{"internalType":"address","name":"nftContract","type":"address"}],"name":"getPublicDrop","outputs":[{"components":[{"internalType":"uint80","name":"mintPrice","type":"uint80"},{"internalType":"uint48","name":"startTime","type":"uint48"},{"internalType":"uint48","name":"endTime","type":"uint48"},{"internalType":"uint16","name":"maxTotalMintableByWallet","type":"uint16"},{"internalType":"uint16","name":"feeBps","type":"uint16"},{"internalType":"bool","name":"restrictFeeRecipients","type":"bool"}],"internalType":"struct PublicDrop","name":"","type":"tuple"}],"stateMutability":"view","type":"function"}',
+    "mintMulti": '{"inputs":[{"internalType":"uint256","name":"total","type":"uint256"},{"internalType":"address","name":"nftaddress","type":"address"}],"name":"mintMulti","outputs":[],"stateMutability":"payable","type":"function"}',
+    "withdrawAllForNft": '{"inputs":[{"internalType":"address","name":"nftAddress","type":"address"},{"internalType":"uint256[]","name":"tokenIds","type":"uint256[]"}],"name":"withdrawAllForNft","outputs":[],"stateMutability":"nonpayable","type":"function"}',
+    "getMintCount": '{"inputs":[{"internalType":"address","name":"deployer","type":"address"},{"internalType":"address","name":"nftAddress","type":"address"}],"name":"getMintCount","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"}',
+    "getMints": '{"inputs":[{"internalType":"address","name":"deployer","type":"address"},{"internalType":"address","name":"nftAddress","type":"address"}],"name":"getMints","outputs":[{"internalType":"address[]","name":"","type":"address[]"}],"stateMutability":"view","type":"function"}',
+    "MintDeployed": '{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"deployer","type":"address"},{"indexed":true,"internalType":"address","name":"nftAddress","type":"address"},{"indexed":false,"internalType":"address","name":"mintContract","type":"address"}],"name":"MintDeployed","type":"event"}',
+    "MintWithdrawSuccess": '{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"deployer","type":"address"},{"indexed":true,"internalType":"address","name":"nftAddress","type":"address"},{"indexed":false,"internalType":"address","name":"mintContract","type":"address"},{"indexed":false,"internalType":"uint256","name":"tokenId","type":"uint256"}],"name":"MintWithdrawSuccess","type":"event"}',
+    "MintWithdrawFailed": '{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"deployer","type":"address"},{"indexed":true,"internalType":"address","name":"nftAddress","type":"address"},{"indexed":false,"internalType":"address","name":"mintContract","type":"address"},{"indexed":false,"internalType":"uint256","name":"tokenId","type":"uint256"}],"name":"MintWithdrawFailed","type":"event"}',
+    "MultiWithdrawSummary": '{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"deployer","type":"address"},{"indexed":true,"internalType":"address","name":"nftAddress","type":"address"},{"indexed":false,"internalType":"uint256","name":"attempted","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"succeeded","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"failed","type":"uint256"}],"name":"MultiWithdrawSummary","type":"event"}',
+    "Transfer": '{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"from","type":"address"},{"indexed":true,"internalType":"address","name":"to","type":"address"},{"indexed":true,"internalType":"uint256","name":"tokenId","type":"uint256"}],"name":"Transfer","type":"event"}',
+}
+
+SEA_FRAGMENTS = ("getPublicDrop",)
+MULTI_FRAGMENTS = ("mintMulti", "withdrawAllForNft")
+
+_ABI_CACHE = {}
+_CONTRACT_CACHE = {}
+
+
+def abi_for(*names) -> list:
+    """ABI list with only the named fragments (parsed once per combination)."""
+    abi = _ABI_CACHE.get(names)
+    if abi is None:
+        abi = [json.loads(ABI_FRAGMENTS[n]) for n in names]
+        _ABI_CACHE[names] = abi
+    return abi
+
+
+def get_contract(w3, address, *names):
+    """
+    Contract object for `address` with only the named fragments, built once per
+    (w3, address) and reused; one w3 talks to one chain.
+    """
+    key = (id(w3), address.lower(), names)
+    c = _CONTRACT_CACHE.get(key)
+    if c is None or c.w3 is not w3:
+        c = w3.eth.contract(address=Web3.to_checksum_address(address), abi=abi_for(*names))
+        _CONTRACT_CACHE[key] = c
+    return c
+
+
+def __getattr__(name):
+    # SEA_ABI / MULTI_ABI kept for callers that still build their own contracts
+    if name == "SEA_ABI":
+        return abi_for(*SEA_FRAGMENTS)
+    if name == "MULTI_ABI":
+        return abi_for(*MULTI_FRAGMENTS)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Helpers ---------------------------------------------------------------------
+
+def to_checksum(addr: str) -> str:
+    return Web3.to_checksum_address(addr)
+
+def parse_gwei_input(inp: str):
+    """
+    Interpret input as GWEI decimal (e.g. '0.0001', '0.01', '1').
+    Returns gas price in wei (int), or None when blank so the caller can use node gas price * 1.2.
+    """
+    if inp is None:
+        return None
+    s = inp.strip().lower().replace("gwei", "").strip()
+    if s == "":
+        return None
+    return int(float(s) * 1_000_000_000)
+
+def wei_to_native_str(wei: int) -> str:
+    return f"{wei / 1e18:.18g}"
+
+def gwei_from_wei(wei: int) -> float:
+    return wei / 1e9
+
+def load_private_keys(path: str) -> list:
+    """
+    Read private keys from a text file, one per line.
+    Blank lines and lines starting with '#' are ignored; duplicates are dropped.
+    """
+    keys = []
+    seen = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            k = line.strip()
+            if not k or k.startswith("#"):
+                continue
+            if k in seen:
+                continue
+            seen.add(k)
+            keys.append(k)
+    return keys
@@ -0,0 +1,271 @@
+import sqlite3, threading, time
+
+from receiptDecoder import mint_receipt_tokens, withdraw_receipt_tokens
+
+# Crash-safe mint journal -----------------------------------------------------------
+# Local SQLite (WAL) record of every broadcast tx (hash, nonce, fees, status), every
+# mint decoded from its receipt (child contracts, tokenIds) and every withdraw. After a
+# crash, reconcile() only looks up the txs still marked 'sent' and pending_withdrawals()
+# lists the tokens not withdrawn yet - no chain rescan, no tx hash copied out of the terminal.
+
+DEFAULT_JOURNAL = "mintJournal.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS txs (
+    hash TEXT PRIMARY KEY,
+    chain_id INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    nonce INTEGER NOT NULL,
+    kind TEXT NOT NULL,             -- mint / mint_v2 / withdraw / tx
+    nft TEXT,
+    units INTEGER,
+    token_ids TEXT,                 -- withdraw txs: comma separated tokenIds
+    fees TEXT,
+    status TEXT NOT NULL,           -- sent / landed / failed / replaced / dropped
+    block_number INTEGER,
+    gas_used INTEGER,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS txs_open ON txs (chain_id, address, status);
+CREATE INDEX IF NOT EXISTS txs_nonce ON txs (chain_id, address, nonce);
+
+CREATE TABLE IF NOT EXISTS mints (
+    tx_hash TEXT PRIMARY KEY,
+    chain_id INTEGER NOT NULL,
+    deployer TEXT NOT NULL,
+    nft TEXT,
+    block_number INTEGER,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS children (
+    chain_id INTEGER NOT NULL,
+    child TEXT NOT NULL,
+    deployer TEXT NOT NULL,
+    nft TEXT NOT NULL,
+    mint_tx TEXT NOT NULL,
+    PRIMARY KEY (chain_id, child)
+);
+
+CREATE TABLE IF NOT EXISTS tokens (
+    chain_id INTEGER NOT NULL,
+    nft TEXT NOT NULL,
+    token_id TEXT NOT NULL,         -- uint256 as decimal text
+    child TEXT,
+    deployer TEXT NOT NULL,
+    mint_tx TEXT NOT NULL,
+    withdraw_tx TEXT,
+    PRIMARY KEY (chain_id, nft, token_id)
+);
+-- pending withdrawals only: stays small however many mints are journaled
+CREATE INDEX IF NOT EXISTS tokens_pending ON tokens (chain_id, deployer, nft) WHERE withdraw_tx IS NULL;
+"""
+
+
+def _addr(a):
+    return a.lower() if a else a
+
+
+class MintJournal:
+    """
+    record_sent / record_receipt   -> every broadcast hash and how it ended
+    record_mint                    -> children + tokenIds decoded from a mint receipt
+    record_withdraw                -> tokens leave the pending set once their withdraw succeeded
+    open_txs / pending_withdrawals -> what resume() still has to do
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL):
+        self.path = path
+        self._lock = threading.Lock()
+        # shared by the pipelined sender threads; every access goes through _lock
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _exec(self, sql, args=()):
+        with self._lock:
+            return self._db.execute(sql, args).fetchall()
+
+    def _exec_many(self, statements):
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                for sql, rows in statements:
+                    self._db.executemany(sql, rows)
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    # txs ---------------------------------------------------------------------------
+    def record_sent(self, chain_id, address, nonce, tx_hash, kind="tx", nft=None, units=None, fees=None,
+                    token_ids=None):
+        now = time.time()
+        ids = ",".join(str(int(t)) for t in token_ids) if token_ids else None
+        self._exec(
+            "INSERT OR IGNORE INTO txs (hash, chain_id, address, nonce, kind, nft, units, token_ids, fees, status, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'sent', ?, ?)",
+            (tx_hash.lower(), int(chain_id), _addr(address), int(nonce), kind, _addr(nft), units, ids,
+             str(fees) if fees else None, now, now))
+
+    def record_receipt(self, tx_hash, receipt):
+        """Landed (status 1) or failed (status 0); other hashes on the same nonce become 'replaced'."""
+        h = tx_hash.lower()
+        status = "landed" if receipt["status"] == 1 else "failed"
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT chain_id, address, nonce FROM txs WHERE hash = ?", (h,)).fetchone()
+            self._db.execute("UPDATE txs SET status = ?, block_number = ?, gas_used = ?, updated_at = ? WHERE hash = ?",
+                             (status, int(receipt["blockNumber"]), int(receipt["gasUsed"]), now, h))
+            if row is not None:
+                self._db.execute("UPDATE txs SET status = 'replaced', updated_at = ? WHERE chain_id = ? AND address = ? "
+                                 "AND nonce = ? AND hash != ? AND status = 'sent'", (now, row[0], row[1], row[2], h))
+
+    def mark_dropped(self, tx_hash) -> str:
+        """
+        No receipt and its nonce is used: 'replaced' when another hash on that nonce was
+        mined (a fee bump that landed), else 'dropped'. Returns the status set.
+        """
+        h = tx_hash.lower()
+        with self._lock:
+            row = self._db.execute("SELECT chain_id, address, nonce FROM txs WHERE hash = ?", (h,)).fetchone()
+            mined = row is not None and self._db.execute(
+                "SELECT 1 FROM txs WHERE chain_id = ? AND address = ? AND nonce = ? AND hash != ? "
+                "AND status IN ('landed', 'failed')", (row[0], row[1], row[2], h)).fetchone() is not None
+            status = "replaced" if mined else "dropped"
+            self._db.execute("UPDATE txs SET status = ?, updated_at = ? WHERE hash = ?", (status, time.time(), h))
+        return status
+
+    def open_txs(self, chain_id, address, kind=None) -> list:
+        """[(hash, kind, nft, nonce, token_ids)] still marked 'sent'; token_ids is a list for withdraw txs."""
+        sql = "SELECT hash, kind, nft, nonce, token_ids FROM txs WHERE chain_id = ? AND address = ? AND status = 'sent'"
+        args = [int(chain_id), _addr(address)]
+        if kind:
+            sql += " AND kind = ?"
+            args.append(kind)
+        return [(h, k, n, nonce, [int(t) for t in ids.split(",")] if ids else None)
+                for h, k, n, nonce, ids in self._exec(sql + " ORDER BY nonce", args)]
+
+    # mints / withdrawals -------------------------------------------------------------
+    def record_mint(self, chain_id, deployer, tx_hash, nft, children, pairs, block_number=None):
+        """children: [child addr]; pairs: [(child, tokenId)] from receiptDecoder.mint_receipt_tokens."""
+        cid, dep, h, n = int(chain_id), _addr(deployer), tx_hash.lower(), _addr(nft)
+        self._exec_many([
+            ("INSERT OR IGNORE INTO mints (tx_hash, chain_id, deployer, nft, block_number, created_at) "
+             "VALUES (?, ?, ?, ?, ?, ?)", [(h, cid, dep, n, block_number, time.time())]),
+            ("INSERT OR IGNORE INTO children (chain_id, child, deployer, nft, mint_tx) VALUES (?, ?, ?, ?, ?)",
+             [(cid, _addr(c), dep, n, h) for c in children]),
+            ("INSERT OR IGNORE INTO tokens (chain_id, nft, token_id, child, deployer, mint_tx) VALUES (?, ?, ?, ?, ?, ?)",
+             [(cid, n, str(int(tid)), _addr(c), dep, h) for c, tid in pairs]),
+        ])
+
+    def record_withdraw(self, chain_id, nft, token_ids, tx_hash):
+        """token_ids: only the tokens the tx actually withdrew (see record_withdraw_receipt)."""
+        self._exec_many([
+            ("UPDATE tokens SET withdraw_tx = ? WHERE chain_id = ? AND nft = ? AND token_id = ?",
+             [(tx_hash.lower(), int(chain_id), _addr(nft), str(int(t))) for t in token_ids]),
+        ])
+
+    def pending_withdrawals(self, chain_id, deployer) -> dict:
+        """
+        {nft (lowercase): [tokenIds]} minted by deployer and not withdrawn yet. Tokens of a
+        withdraw tx still marked 'sent' are left out: reconcile() settles them first.
+        """
+        cid, dep = int(chain_id), _addr(deployer)
+        in_flight = set()
+        for nft, ids in self._exec("SELECT nft, token_ids FROM txs WHERE chain_id = ? AND address = ? "
+                                   "AND status = 'sent' AND kind = 'withdraw' AND token_ids IS NOT NULL", (cid, dep)):
+            in_flight.update((nft, int(t)) for t in ids.split(","))
+        out = {}
+        for nft, tid in self._exec("SELECT nft, token_id FROM tokens WHERE chain_id = ? AND deployer = ? "
+                                   "AND withdraw_tx IS NULL", (cid, dep)):
+            if (nft, int(tid)) not in in_flight:
+                out.setdefault(nft, []).append(int(tid))
+        for ids in out.values():
+            ids.sort()
+        return out
+
+    def summary(self, chain_id, deployer) -> dict:
+        cid, dep = int(chain_id), _addr(deployer)
+        open_n = self._exec("SELECT COUNT(*) FROM txs WHERE chain_id = ? AND address = ? AND status = 'sent'",
+                            (cid, dep))[0][0]
+        pending = self._exec("SELECT COUNT(*) FROM tokens WHERE chain_id = ? AND deployer = ? AND withdraw_tx IS NULL",
+                             (cid, dep))[0][0]
+        return {"open_txs": open_n, "pending_tokens": pending}
+
+
+def record_mint_receipt(journal, chain_id, deployer, receipt, multimint_addr):
+    """Decode a landed mint receipt into the journal; returns (nft, children, tokenIds)."""
+    nft, children, pairs = mint_receipt_tokens(receipt, multimint_addr)
+    tx_hash = receipt["transactionHash"]
+    tx_hash = tx_hash if isinstance(tx_hash, str) else "0x" + bytes(tx_hash).hex()
+    if nft is not None:
+        journal.record_mint(chain_id, deployer, tx_hash, nft, children, pairs, int(receipt["blockNumber"]))
+    return nft, children, [tid for _, tid in pairs]
+
+
+def record_withdraw_receipt(journal, chain_id, nft, token_ids, receipt, multimint_addr):
+    """Landed withdraw receipt -> journal; returns (withdrawn, not withdrawn) tokenIds."""
+    withdrawn, failed = withdraw_receipt_tokens(receipt, multimint_addr, token_ids)
+    if withdrawn:
+        tx_hash = receipt["transactionHash"]
+        tx_hash = tx_hash if isinstance(tx_hash, str) else "0x" + bytes(tx_hash).hex()
+        journal.record_withdraw(chain_id, nft, withdrawn, tx_hash)
+    return withdrawn, failed
+
+
+def reconcile(w3, journal, chain_id, address, multimint_addr, kind=None) -> dict:
+    """
+    One receipt lookup per tx still marked 'sent'. Landed mints are decoded into the
+    journal, tokens a landed withdraw actually withdrew leave the pending list; a hash
+    without receipt whose nonce is already used on chain is 'dropped' (or 'replaced'
+    when another hash on that nonce was mined).
+    kind: only txs of that kind (multiMintV2 leaves V1 mints to multiMint menu 6).
+    Returns {"landed", "failed", "dropped", "pending"} counts.
+    """
+    counts = {"landed": 0, "failed": 0, "dropped": 0, "pending": 0}
+    open_rows = journal.open_txs(chain_id, address, kind)
+    if not open_rows:
+        return counts
+    mined_nonce = w3.eth.get_transaction_count(address, "latest")
+    missing = []
+    for tx_hash, kind, nft, nonce, token_ids in open_rows:
+        try:
+            receipt = w3.eth.get_transaction_receipt(tx_hash)
+        except Exception:
+            receipt = None
+        if receipt is None:
+            missing.append((tx_hash, nonce))
+            continue
+        journal.record_receipt(tx_hash, receipt)
+        if receipt["status"] != 1:
+            counts["failed"] += 1
+            continue
+        counts["landed"] += 1
+        if kind == "mint":
+            record_mint_receipt(journal, chain_id, address, receipt, multimint_addr)
+        elif kind == "withdraw" and token_ids:
+            record_withdraw_receipt(journal, chain_id, nft, token_ids, receipt, multimint_addr)
+    # after every receipt is in: a hash replaced by a landed bump is not counted as dropped
+    for tx_hash, nonce in missing:
+        if nonce >= mined_nonce:
+            counts["pending"] += 1
+        elif journal.mark_dropped(tx_hash) == "dropped":
+            counts["dropped"] += 1
+    return counts
+
+
+_JOURNAL = None
+
+
+def get_journal(path=DEFAULT_JOURNAL) -> MintJournal:
+    global _JOURNAL
+    if _JOURNAL is None or _JOURNAL.path != path:
+        _JOURNAL = MintJournal(path)
+    return _JOURNAL
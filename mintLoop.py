@@ -0,0 +1,144 @@
+from web3.exceptions import TransactionNotFound
+import time
+
+from feeEngine import max_fee_per_gas
+from mintMetrics import METRICS
+from nonceManager import NONCES
+from retryPolicy import RetryScheduler
+from replacementManager import send_with_replacement, StuckTransactionError, bump_fees, fee_fields, is_bumpable, \
+    FEE_CAP_MULT
+
+# Single-wallet mint loop -----------------------------------------------------------
+# One mintMulti retried until it lands or the retry policy gives up. A mint that timed
+# out unmined keeps its nonce and is bumped from the fees it was last sent with; when
+# that nonce turns out to be used, the hashes already sent are looked up first, so a
+# mint that landed late is the result and never gets minted a second time.
+
+
+def find_landed(w3, hashes, tries=3, delay=1.0):
+    """Receipt of whichever of `hashes` was mined (a node may lag a block behind), or None."""
+    for i in range(tries):
+        for hx in hashes:
+            try:
+                return w3.eth.get_transaction_receipt(hx)
+            except TransactionNotFound:
+                continue
+        if i + 1 < tries:
+            time.sleep(delay)
+    return None
+
+
+def mint_until_landed(w3, acct, func, value, chain_id, fee_engine, retry=None, timeout=600, on_sent=None,
+                      on_receipt=None):
+    """
+    func: contract function to mint with (e.g. mintMulti(total, nft)), sent with `value`.
+    on_sent(tx_hash, nonce, fees): every hash broadcast. on_receipt(tx_hash, receipt): every tx mined.
+    Returns the status 1 receipt, or None when the retry policy gave up.
+    """
+    retry = retry or RetryScheduler()
+    attempt = 0
+    fee_level = 0   # bumped when a mint tx is underpriced / times out
+    fee_cap = None  # fixed from the first tx: replacements never go past it
+    stuck = None    # mint that timed out unmined: {"tx", "hashes", "used"}
+    while True:
+        attempt += 1
+        retry.begin_attempt()
+        try:
+            receipt = None
+            if stuck is not None and stuck["used"]:
+                # its nonce was taken: by one of our own hashes, or by another tx of this wallet
+                receipt = find_landed(w3, stuck["hashes"])
+                if receipt is not None:
+                    print("Stuck Mint Landed : ", receipt.transactionHash.to_0x_hex())
+                    if on_receipt is not None:
+                        on_receipt(receipt.transactionHash.to_0x_hex(), receipt)
+                else:
+                    print(f"Nonce {stuck['tx']['nonce']} Was Used By Another Tx, Minting On A New Nonce")
+                    NONCES.invalidate(chain_id, acct.address)
+                stuck = None
+
+            if receipt is None:
+                if stuck is not None:
+                    # same nonce, bumped from the last fees actually sent
+                    print(f"Attempt #{attempt}: Replacing Stuck Mint (nonce {stuck['tx']['nonce']})...")
+                    tx = dict(stuck["tx"])
+                    old = fee_fields(tx)
+                    new = bump_fees(old, fee_engine.fees(fee_level), fee_cap)
+                    if is_bumpable(old, new):
+                        for k in old:
+                            tx.pop(k)
+                        tx.update(new)
+                    # else: fee cap reached, the identical tx is resent ("already known" counts as sent)
+                    resend = True
+                else:
+                    print(f"Attempt #{attempt}: Building Mint TX...")
+                    # estimate gas: if this fails, error out (no fallback)
+                    with METRICS.stage("mint.estimate_gas"):
+                        estimated_gas = func.estimate_gas({"from": acct.address, "value": value})
+                    print("Estimated Gas : ", estimated_gas)
+
+                    with METRICS.stage("mint.build_tx"):
+                        tx = func.build_transaction({
+                            "chainId": chain_id,
+                            "from": acct.address,
+                            "value": value,
+                            "gas": int(estimated_gas * 1.2),
+                            **fee_engine.fees(fee_level),
+                            "nonce": 0
+                        })
+                    # nonce from local allocator (synced once from pending block), taken once the tx is built
+                    tx["nonce"] = NONCES.next_nonce(w3, acct.address, chain_id)
+                    resend = False
+                if fee_cap is None:
+                    fee_cap = int(max_fee_per_gas(fee_fields(tx)) * FEE_CAP_MULT)
+
+                def sent(tx_hash, fees, nonce=tx["nonce"]):
+                    if on_sent is not None:
+                        on_sent(tx_hash, nonce, fees)
+
+                # sign & send, wait for receipt (stuck tx -> same-nonce fee bump)
+                result = send_with_replacement(w3, acct, tx, fee_engine, fee_cap=fee_cap, timeout=timeout,
+                                               on_sent=sent, kind="mint", resend=resend)
+                stuck = None
+                if result["replacements"]:
+                    print(f"Landed Tx : {result['landed_hash']} ({result['replacements']} Replacement(s) Sent)")
+                receipt = result["receipt"]
+                if on_receipt is not None:
+                    on_receipt(result["landed_hash"], receipt)
+
+            print("Mint Receipt Status : ", receipt.status)
+            if receipt.status == 1:
+                retry.end_attempt()
+                print("Mint TX Succeeded : ", receipt.transactionHash.to_0x_hex())
+                print(retry.summary())
+                return receipt
+            print("Mint TX Failed Retrying...")
+            decision = retry.on_error("revert")
+            if decision.abort:
+                print("Retry Budget Exhausted : ", decision)
+                print(retry.summary())
+                return None
+            retry.wait(decision)
+
+        except Exception as e:
+            # surface estimate_gas errors and any other errors
+            print("Mint Attempt Exception : ", e)
+            decision = retry.on_error(e)
+            if isinstance(e, StuckTransactionError):
+                hashes = (stuck["hashes"] if stuck is not None else []) + [h for h in e.hashes]
+                stuck = {"tx": {**tx, **(e.fees or {})}, "hashes": list(dict.fromkeys(hashes)), "used": False}
+            if decision.abort:
+                print("Giving Up : ", decision)
+                if stuck is not None:
+                    print(f"Mint Txs Still Pending On Nonce {stuck['tx']['nonce']} : ", stuck["hashes"])
+                print(retry.summary())
+                return None
+            if decision.cls == "nonce_too_low":
+                if stuck is not None:
+                    stuck["used"] = True
+                else:
+                    NONCES.invalidate(chain_id, acct.address)
+            elif decision.cls in ("underpriced", "timeout"):
+                fee_level += 1
+            print("Retrying... ", decision)
+            retry.wait(decision)
@@ -0,0 +1,334 @@
+from bisect import bisect_left
+from web3.middleware import Web3Middleware
+import os, json, time, atexit, threading
+
+from retryPolicy import classify
+
+# RPC & pipeline metrics ------------------------------------------------------------
+# Every JSON-RPC request (count, latency histogram, error class, request/response bytes
+# per method) and every mint / withdraw stage (estimate_gas, sign, send, receipt wait,
+# decode, withdraw) lands in one in-process registry. Recording is a dict lookup and a
+# few adds under a lock; nothing is formatted until someone reads the metrics.
+# Optional outputs:
+#   METRICS_PORT=9464         -> Prometheus text format on http://127.0.0.1:9464/metrics
+#   METRICS_LOG=events.jsonl  -> one JSON line per RPC request / stage
+
+# seconds; shared by RPC and stage histograms (receipt waits can take minutes)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+PREFIX = "mint"
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last slot = +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+
+class _Series:
+    __slots__ = ("hist", "errors", "bytes_out", "bytes_in")
+
+    def __init__(self):
+        self.hist = Histogram()
+        self.errors = {}
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+
+class _Stage:
+    __slots__ = ("metrics", "name", "fields", "t0")
+
+    def __init__(self, metrics, name, fields):
+        self.metrics = metrics
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe_stage(self.name, time.perf_counter() - self.t0,
+                                   None if exc is None else classify(exc), self.fields)
+        return False
+
+
+class Metrics:
+    """
+    rpc(method, seconds, error_class)           -> one JSON-RPC request
+    stage(name, **fields)                       -> context manager timing one pipeline stage
+    observe_stage(name, seconds, error_class)   -> same, for stages that don't fit a `with`
+    prometheus() / report()                     -> read side
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rpc_series = {}
+        self.stage_series = {}
+        self._log = None
+        self._server = None
+
+    # recording ------------------------------------------------------------------
+    def _series(self, table, key) -> _Series:
+        s = table.get(key)
+        if s is None:
+            s = table.setdefault(key, _Series())
+        return s
+
+    def rpc(self, method, seconds, error=None):
+        with self._lock:
+            s = self._series(self.rpc_series, method)
+            s.hist.observe(seconds)
+            if error is not None:
+                s.errors[error] = s.errors.get(error, 0) + 1
+        if self._log is not None:
+            self.event("rpc", method=method, ms=round(seconds * 1000, 3), error=error)
+
+    def rpc_error(self, method, error):
+        # failed entry inside a batch: counted, no latency of its own
+        with self._lock:
+            s = self._series(self.rpc_series, method)
+            s.errors[error] = s.errors.get(error, 0) + 1
+
+    def rpc_bytes(self, method, sent=0, received=0):
+        with self._lock:
+            s = self._series(self.rpc_series, method)
+            s.bytes_out += sent
+            s.bytes_in += received
+
+    def stage(self, name, **fields) -> _Stage:
+        return _Stage(self, name, fields)
+
+    def observe_stage(self, name, seconds, error=None, fields=None):
+        with self._lock:
+            s = self._series(self.stage_series, name)
+            s.hist.observe(seconds)
+            if error is not None:
+                s.errors[error] = s.errors.get(error, 0) + 1
+        if self._log is not None:
+            self.event("stage", stage=name, ms=round(seconds * 1000, 3), error=error, **(fields or {}))
+
+    # event log ------------------------------------------------------------------
+    def open_log(self, path):
+        self._log = open(path, "a", encoding="utf-8", buffering=1 << 16)
+        atexit.register(self.close)
+        return self
+
+    def event(self, kind, **fields):
+        log = self._log
+        if log is None:
+            return
+        line = json.dumps({"ts": round(time.time(), 6), "event": kind, **fields}, default=str)
+        with self._lock:
+            log.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            log, self._log = self._log, None
+        if log is not None:
+            log.close()
+
+    # read side ------------------------------------------------------------------
+    def _snapshot(self):
+        with self._lock:
+            def copy(table):
+                out = {}
+                for key, s in table.items():
+                    c = _Series()
+                    c.hist.counts, c.hist.sum, c.hist.count, c.hist.max = list(s.hist.counts), s.hist.sum, \
+                        s.hist.count, s.hist.max
+                    c.errors, c.bytes_out, c.bytes_in = dict(s.errors), s.bytes_out, s.bytes_in
+                    out[key] = c
+                return out
+            return copy(self.rpc_series), copy(self.stage_series)
+
+    def prometheus(self) -> str:
+        rpc, stages = self._snapshot()
+        lines = []
+
+        def histogram(name, help_text, label, table):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, s in sorted(table.items()):
+                cum = 0
+                for bound, n in zip(BUCKETS + ("+Inf",), s.hist.counts):
+                    cum += n
+                    lines.append(f'{name}_bucket{{{label}="{key}",le="{bound}"}} {cum}')
+                lines.append(f'{name}_sum{{{label}="{key}"}} {s.hist.sum:.6f}')
+                lines.append(f'{name}_count{{{label}="{key}"}} {s.hist.count}')
+
+        def counter(name, help_text, rows):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in rows:
+                lines.append(f"{name}{{{labels}}} {value}")
+
+        histogram(f"{PREFIX}_rpc_latency_seconds", "JSON-RPC request latency by method", "method", rpc)
+        counter(f"{PREFIX}_rpc_errors_total", "JSON-RPC errors by method and retry class",
+                [(f'method="{m}",class="{c}"', n) for m, s in sorted(rpc.items()) for c, n in sorted(s.errors.items())])
+        counter(f"{PREFIX}_rpc_request_bytes_total", "JSON-RPC request body bytes by method",
+                [(f'method="{m}"', s.bytes_out) for m, s in sorted(rpc.items())])
+        counter(f"{PREFIX}_rpc_response_bytes_total", "JSON-RPC response body bytes by method",
+                [(f'method="{m}"', s.bytes_in) for m, s in sorted(rpc.items())])
+        histogram(f"{PREFIX}_stage_latency_seconds", "Mint / withdraw pipeline stage latency", "stage", stages)
+        counter(f"{PREFIX}_stage_errors_total", "Pipeline stage errors by retry class",
+                [(f'stage="{st}",class="{c}"', n) for st, s in sorted(stages.items()) for c, n in sorted(s.errors.items())])
+        return "\n".join(lines) + "\n"
+
+    def report(self):
+        rpc, stages = self._snapshot()
+        if not rpc and not stages:
+            return
+        for title, table in (("Stage", stages), ("RPC", rpc)):
+            for key, s in sorted(table.items(), key=lambda kv: -kv[1].hist.sum):
+                if not s.hist.count and not s.errors:
+                    continue
+                avg = s.hist.sum / s.hist.count * 1000 if s.hist.count else 0.0
+                line = f"{title} {key} : {s.hist.count}x avg {avg:.1f} ms max {s.hist.max * 1000:.1f} ms"
+                if s.bytes_out or s.bytes_in:
+                    line += f" | {s.bytes_out} B Out {s.bytes_in} B In"
+                if s.errors:
+                    line += " | Errors " + ", ".join(f"{c} {n}" for c, n in sorted(s.errors.items()))
+                print(line)
+
+    # Prometheus endpoint ----------------------------------------------------------
+    def serve(self, port, host="127.0.0.1"):
+        # only with METRICS_PORT set: http.server stays out of the normal startup
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                data = metrics.prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        return self._server.server_address[1]
+
+
+METRICS = Metrics()
+
+
+# Web3 hooks ---------------------------------------------------------------------
+class RpcMetrics(Web3Middleware):
+    """Latency + error class of every request (batches count as method "batch")."""
+
+    def wrap_make_request(self, make_request):
+        def middleware(method, params):
+            t0 = time.perf_counter()
+            try:
+                resp = make_request(method, params)
+            except Exception as e:
+                METRICS.rpc(method, time.perf_counter() - t0, classify(e))
+                raise
+            err = resp.get("error") if isinstance(resp, dict) else None
+            METRICS.rpc(method, time.perf_counter() - t0, _error_class(err) if err else None)
+            return resp
+        return middleware
+
+    def wrap_make_batch_request(self, make_batch_request):
+        def middleware(requests_info):
+            t0 = time.perf_counter()
+            try:
+                resp = make_batch_request(requests_info)
+            except Exception as e:
+                METRICS.rpc("batch", time.perf_counter() - t0, classify(e))
+                raise
+            if isinstance(resp, list):
+                METRICS.rpc("batch", time.perf_counter() - t0)
+                for (method, _), r in zip(requests_info, resp):
+                    err = r.get("error") if isinstance(r, dict) else None
+                    if err:
+                        METRICS.rpc_error(method, _error_class(err))
+            else:
+                err = resp.get("error") if isinstance(resp, dict) else None
+                METRICS.rpc("batch", time.perf_counter() - t0, _error_class(err) if err else None)
+            return resp
+        return middleware
+
+
+def _error_class(err) -> str:
+    return classify(str(err.get("message", err)) if isinstance(err, dict) else str(err))
+
+
+_local = threading.local()
+
+
+def _hook_bytes(provider):
+    """Count body sizes where the provider encodes / decodes them (same thread, so the
+    method set by encode is the one the next decode belongs to)."""
+    if getattr(provider, "_metrics_hooked", False) or not hasattr(provider, "encode_rpc_request"):
+        return
+    encode, encode_batch, decode = provider.encode_rpc_request, provider.encode_batch_rpc_request, \
+        provider.decode_rpc_response
+
+    def encode_rpc_request(method, params):
+        data = encode(method, params)
+        if not getattr(_local, "in_batch", False):
+            _local.method = method
+            METRICS.rpc_bytes(method, sent=len(data))
+        return data
+
+    def encode_batch_rpc_request(requests):
+        # the batch encoder calls encode_rpc_request per entry: count the body once, as "batch"
+        _local.in_batch = True
+        try:
+            data = encode_batch(requests)
+        finally:
+            _local.in_batch = False
+        _local.method = "batch"
+        METRICS.rpc_bytes("batch", sent=len(data))
+        return data
+
+    def decode_rpc_response(raw):
+        METRICS.rpc_bytes(getattr(_local, "method", "unknown"), received=len(raw))
+        return decode(raw)
+
+    provider.encode_rpc_request = encode_rpc_request
+    provider.encode_batch_rpc_request = encode_batch_rpc_request
+    provider.decode_rpc_response = decode_rpc_response
+    provider._metrics_hooked = True
+
+
+def install_metrics(w3):
+    """
+    Hook `w3` into METRICS (middleware + body size counting on every HTTP provider behind it)
+    and start the optional outputs from METRICS_PORT / METRICS_LOG.
+    """
+    if "metrics" not in [name for _, name in w3.middleware_onion.middleware]:
+        w3.middleware_onion.add(RpcMetrics, name="metrics")
+    for ep in getattr(w3.provider, "endpoints", None) or [w3.provider]:
+        _hook_bytes(getattr(ep, "provider", ep))
+    log_path = os.environ.get("METRICS_LOG")
+    if log_path and METRICS._log is None:
+        METRICS.open_log(log_path)
+        print("Metrics Event Log : ", log_path)
+    port = os.environ.get("METRICS_PORT")
+    if port and METRICS._server is None:
+        try:
+            bound = METRICS.serve(int(port))
+            print(f"Metrics Endpoint : http://127.0.0.1:{bound}/metrics")
+        except (OSError, ValueError) as e:
+            print("Metrics Endpoint Failed : ", e)
+    return METRICS
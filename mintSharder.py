@@ -0,0 +1,193 @@
+import math
+
+from feeEngine import max_fee_per_gas
+from replacementManager import send_pipelined, StuckTransactionError, bump_fees, fee_fields, FEE_CAP_MULT
+from retryPolicy import RetryScheduler
+from mintMetrics import METRICS
+from nonceManager import NONCES, is_nonce_error
+from mintLoop import find_landed
+
+# Mint sharding ---------------------------------------------------------------------
+# A mintMulti(total) too big for one tx (gas estimate fails / above the block gas
+# ceiling / above maxTotalMintableByWallet) is split into the fewest equal-sized
+# mintMulti shards that fit, sent at once on consecutive nonces. Each round only the
+# shards that failed are rebuilt and resent, paced by the retry policy. A shard that
+# timed out unmined is bumped on its own nonce, and looked up before it is ever rebuilt;
+# its replacements never go past the fee cap fixed from the shard's first tx.
+
+BLOCK_GAS_SHARE = 0.5       # one shard may use at most half a block
+GAS_HEADROOM = 1.2          # estimate * 1.2, as everywhere else
+PROBE_UNITS = 4
+FALLBACK_GAS_PER_UNIT = 250_000     # drop not live yet -> can't estimate, assume this
+
+
+def measure_mint_gas(multi, sender, nft, price, total):
+    """
+    (base gas, gas per minted unit, measured) from estimate_gas on 1 and PROBE_UNITS units.
+    Falls back to FALLBACK_GAS_PER_UNIT when the estimate reverts (e.g. drop not started).
+    """
+    try:
+        one = multi.functions.mintMulti(1, nft).estimate_gas({"from": sender, "value": price})
+        k = min(total, PROBE_UNITS)
+        if k < 2:
+            return 0, one, True
+        many = multi.functions.mintMulti(k, nft).estimate_gas({"from": sender, "value": price * k})
+        per_unit = max(1, (many - one) // (k - 1))
+        return max(0, one - per_unit), per_unit, True
+    except Exception:
+        return 0, FALLBACK_GAS_PER_UNIT, False
+
+
+def shard_sizes(total, max_per_wallet, base, per_unit, block_gas_limit) -> list:
+    """Fewest shards under every cap, sizes as even as possible (largest first)."""
+    cap = max(1, (int(block_gas_limit * BLOCK_GAS_SHARE / GAS_HEADROOM) - base) // per_unit)
+    if max_per_wallet:
+        cap = min(cap, int(max_per_wallet))
+    n = math.ceil(total / cap)
+    size, extra = divmod(total, n)
+    return [size + 1] * extra + [size] * (n - extra)
+
+
+def plan_mint(multi, sender, nft, price, total, max_per_wallet, block_gas_limit) -> dict:
+    """
+    {"sizes", "base_gas", "gas_per_unit", "measured"}. No RPC call when even the
+    pessimistic FALLBACK_GAS_PER_UNIT fits one tx (the usual case stays a single mintMulti).
+    """
+    sizes = shard_sizes(total, max_per_wallet, 0, FALLBACK_GAS_PER_UNIT, block_gas_limit)
+    if len(sizes) == 1:
+        return {"sizes": sizes, "base_gas": 0, "gas_per_unit": FALLBACK_GAS_PER_UNIT, "measured": False}
+    base, per_unit, measured = measure_mint_gas(multi, sender, nft, price, total)
+    sizes = shard_sizes(total, max_per_wallet, base, per_unit, block_gas_limit)
+    return {"sizes": sizes, "base_gas": base, "gas_per_unit": per_unit, "measured": measured}
+
+
+def _row(label, units):
+    return {"shard": label, "units": units, "attempts": 0, "tx_hash": None, "status": None,
+            "gas_used": None, "error": None, "receipt": None, "stuck": None, "fee_cap": None}
+
+
+def run_shards(w3, acct, multi, chain_id, nft, price, sizes, fee_engine=None, retry=None, timeout=600,
+               journal=None, kind="mint") -> list:
+    """
+    Send every shard pipelined; then resend only the failed ones until they land or the
+    retry policy gives up. journal: optional MintJournal, gets every hash sent (as `kind`)
+    and how it ended (the caller records the decoded mints). Returns one row per shard:
+    {"shard", "units", "attempts", "tx_hash", "status", "gas_used", "error", "receipt"}
+    """
+    retry = retry or RetryScheduler()
+    rows = [_row(str(i + 1), units) for i, units in enumerate(sizes)]
+    todo = list(rows)
+    fee_level = 0
+    while todo:
+        retry.begin_attempt()
+        sending, failed, first_err = [], [], None
+        for row in todo:
+            row["attempts"] += 1
+            value = price * row["units"]
+            stuck = row["stuck"]
+            try:
+                if stuck is not None and stuck["used"]:
+                    receipt = find_landed(w3, stuck["hashes"])
+                    if receipt is not None:
+                        _landed(row, receipt.transactionHash.to_0x_hex(), receipt, journal)
+                        if row["status"] != 1:
+                            first_err = first_err or "revert"
+                            failed.append(row)
+                        continue
+                    # nonce taken by another tx of this wallet: this shard never minted
+                    NONCES.invalidate(chain_id, acct.address)
+                    row["stuck"] = stuck = None
+                if stuck is not None:
+                    # same nonce, bumped from the last fees actually sent
+                    tx = dict(stuck["tx"])
+                    old = fee_fields(tx)
+                    for k in old:
+                        tx.pop(k)
+                    tx.update(bump_fees(old, fee_engine.fees(fee_level) if fee_engine is not None else {},
+                                        row["fee_cap"]))
+                    sending.append((row, tx))
+                    continue
+                func = multi.functions.mintMulti(row["units"], nft)
+                with METRICS.stage("mint.estimate_gas"):
+                    gas = func.estimate_gas({"from": acct.address, "value": value})
+                tx = func.build_transaction({
+                    # placeholder nonce keeps build_transaction offline; send_pipelined assigns the real ones
+                    "chainId": chain_id, "from": acct.address, "value": value, "gas": int(gas * GAS_HEADROOM),
+                    "nonce": 0, **(fee_engine.fees(fee_level) if fee_engine is not None else
+                                   {"gasPrice": int(w3.eth.gas_price)}),
+                })
+                tx.pop("nonce")
+                if row["fee_cap"] is None:
+                    row["fee_cap"] = int(max_fee_per_gas(fee_fields(tx)) * FEE_CAP_MULT)
+                sending.append((row, tx))
+            except Exception as e:
+                row["error"] = str(e)
+                first_err = first_err or e
+                failed.append(row)
+
+        def on_sent(i, tx_hash, fees):
+            r = sending[i][0]
+            print(f"Sent Mint Shard {r['shard']} ({r['units']} Units) : ", tx_hash)
+            if journal is not None:
+                journal.record_sent(chain_id, acct.address, sending[i][1]["nonce"], tx_hash, kind, nft,
+                                    r["units"], fees)
+
+        results = send_pipelined(w3, acct, [tx for _, tx in sending], fee_engine, timeout=timeout, on_sent=on_sent,
+                                 kind="mint", resend={i for i, (row, _) in enumerate(sending) if row["stuck"]},
+                                 fee_caps=[row["fee_cap"] for row, _ in sending])
+        for (row, tx), res in zip(sending, results):
+            if isinstance(res, Exception):
+                row["error"] = str(res)
+                first_err = first_err or res
+                failed.append(row)
+                stuck = row["stuck"]
+                if isinstance(res, StuckTransactionError):
+                    hashes = (stuck["hashes"] if stuck is not None else []) + list(res.hashes)
+                    row["stuck"] = {"tx": {**tx, **(res.fees or {})}, "hashes": list(dict.fromkeys(hashes)),
+                                    "used": False}
+                elif stuck is not None and is_nonce_error(res):
+                    stuck["used"] = True
+                continue
+            _landed(row, res["landed_hash"], res["receipt"], journal)
+            if row["status"] != 1:
+                first_err = first_err or "revert"
+                failed.append(row)
+
+        done = sum(1 for r in rows if r["status"] == 1)
+        print(f"Shards Landed : {done}/{len(rows)} | Units Minted : {sum(r['units'] for r in rows if r['status'] == 1)}")
+        todo = failed
+        if not todo:
+            retry.end_attempt()
+            break
+        decision = retry.on_error(first_err)
+        if decision.abort:
+            print("Giving Up On Failed Shards : ", decision)
+            break
+        if decision.cls in ("underpriced", "timeout"):
+            fee_level += 1
+        print(f"Retrying {len(todo)} Failed Shard(s)... ", decision)
+        retry.wait(decision)
+    return rows
+
+
+def _landed(row, tx_hash, receipt, journal):
+    row["stuck"] = None
+    row["tx_hash"] = tx_hash
+    row["receipt"] = receipt
+    row["status"] = receipt.status
+    row["gas_used"] = receipt.gasUsed
+    row["error"] = None if receipt.status == 1 else "Reverted"
+    if journal is not None:
+        journal.record_receipt(tx_hash, receipt)
+
+
+def print_shard_report(rows):
+    for row in rows:
+        state = "OK" if row["status"] == 1 else ("FAILED" if row["status"] == 0 else "ERROR")
+        retried = f" (Attempts {row['attempts']})" if row["attempts"] > 1 else ""
+        print(f"Shard {row['shard']:<4}{state:<7}Units : {row['units']:<5} Gas Used : {row['gas_used'] or '-':<10}"
+              f"Tx : {row['tx_hash'] or '-'}{retried}")
+        if row["error"]:
+            print("       Error : ", row["error"])
+        if row["stuck"]:
+            print(f"       Still Pending On Nonce {row['stuck']['tx']['nonce']} : ", row["stuck"]["hashes"])
@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
-from web3 import Web3, HTTPProvider
+from web3 import Web3
 from web3 import __version__ as web3_version
 from packaging.version import Version
 from eth_account import Account
-import time, sys, json
+import time, sys
+
+from nonceManager import NONCES
+from rpcPool import connect_multi
+from preflight import run_preflight, TIMER
+from feeEngine import FeeEngine
+from retryPolicy import install_rpc_counter
+from mintMetrics import METRICS, install_metrics
+from receiptTracker import get_tracker
+from mintCommon import get_contract, SEA_FRAGMENTS
+import mintSharder
+import mintLoop
 
 # Require exact Web3.py 7.12.0
 REQUIRED_WEB3 = "7.12.0"
@@ -20,10 +31,6 @@ SEA_DROP_ADDR = "0x00005EA00Ac477B1030CE78506496e8C2dE24bf5"
 MULTIMINT_ADDR = "0x0000419B4B6132e05DfBd89F65B165DFD6fA126F"
 SUPPORTED_CHAIN_IDS = {1, 10, 42161, 8453, 143, 137, 2741, 43114, 80094, 999}
 
-# Minimal ABIs (only what's needed)
-SEA_ABI = json.loads('[{"inputs":[{"internalType":"address","name":"nftContract","type":"address"}],"name":"getPublicDrop","outputs":[{"components":[{"internalType":"uint80","name":"mintPrice","type":"uint80"},{"internalType":"uint48","name":"startTime","type":"uint48"},{"internalType":"uint48","name":"endTime","type":"uint48"},{"internalType":"uint16","name":"maxTotalMintableByWallet","type":"uint16"},{"internalType":"uint16","name":"feeBps","type":"uint16"},{"internalType":"bool","name":"restrictFeeRecipients","type":"bool"}],"internalType":"struct PublicDrop","name":"","type":"tuple"}],"stateMutability":"view","type":"function"}]')
-MULTI_ABI = json.loads('[{"inputs":[{"internalType":"uint256","name":"total","type":"uint256"},{"internalType":"address","name":"nftaddress","type":"address"}],"name":"mintMulti","outputs":[],"stateMutability":"payable","type":"function"}]')
-
 # Symbol map for native token display
 SYMBOLS = {
     1: "ETH", 10: "ETH", 42161: "ETH", 8453: "ETH",
@@ -35,58 +42,46 @@ SYMBOLS = {
 def to_checksum(addr: str) -> str:
     return Web3.to_checksum_address(addr)
 
-def parse_gas_price_gwei_input(inp: str, w3: Web3) -> int:
+def parse_gas_price_gwei_input(inp: str, w3: Web3, node_gas_price: int = None) -> int:
+    # node_gas_price: already fetched by the preflight batch -> no extra RPC call
     try:
-        if inp is None:
-            base = w3.eth.gas_price
+        if inp is None or inp.strip() == "":
+            base = w3.eth.gas_price if node_gas_price is None else node_gas_price
             return int(base * 1.2)
         s = inp.strip()
-        if s == "":
-            base = w3.eth.gas_price
-            return int(base * 1.2)
         s_norm = s.lower().replace("gwei", "").strip()
         gwei_value = float(s_norm)
         wei = int(gwei_value * 1_000_000_000)
         return wei
     except Exception as e:
         print("Invalid gas price input; falling back to node gas price * 1.2. (e)", e)
-        base = w3.eth.gas_price
+        base = w3.eth.gas_price if node_gas_price is None else node_gas_price
         return int(base * 1.2)
 
 def gwei_from_wei(wei: int) -> float:
     return wei / 1e9
 
-def sign_send_wait(w3: Web3, acct: Account, tx: dict, timeout=600):
-    try:
-        if "nonce" not in tx:
-            tx["nonce"] = w3.eth.get_transaction_count(acct.address)
-        if "chainId" not in tx:
-            tx["chainId"] = w3.eth.chain_id
-        signed = acct.sign_transaction(tx)
-        tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-        print("Sent Tx :", tx_hash.hex())
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
-        return receipt
-    except Exception as e:
-        raise
-
 # Main - Mint Loop Only
 print(f'Auto SeaDrop MultiMint V2 By ADFMIDN Team')
 print(f'')
 def main():
     try:
-        rpc = input("Input RPC URL : ").strip()
+        rpc = input("Input RPC URL (Comma Separated For Multi RPC) : ").strip()
         if not rpc:
             print("RPC URL Required.")
             return
-        w3 = Web3(HTTPProvider(rpc, request_kwargs={"timeout": 60}))
-        connected = w3.is_connected()
+        # health probe across every RPC; reads use the fastest, raw txs go to all
+        w3, probe = connect_multi(rpc)
+        connected = w3 is not None
         print("Connected : ", connected)
         if not connected:
             print("Unable To Connect To RPC! Exiting...")
             return
+        install_rpc_counter(w3)
+        install_metrics(w3)
 
-        chain_id = w3.eth.chain_id
+        # chainId already known from the health probe
+        chain_id = next(r["chain_id"] for r in probe if r["ok"])
         print("chainId =", chain_id)
         if chain_id not in SUPPORTED_CHAIN_IDS:
             print("Chain Not Supported. Supported : ", SUPPORTED_CHAIN_IDS)
@@ -96,31 +91,48 @@ def main():
         # Contracts
         sea_drop = to_checksum(SEA_DROP_ADDR)
         multimint = to_checksum(MULTIMINT_ADDR)
-        sea_contract = w3.eth.contract(address=sea_drop, abi=SEA_ABI)
-        multi_contract = w3.eth.contract(address=multimint, abi=MULTI_ABI)
+        sea_contract = get_contract(w3, sea_drop, *SEA_FRAGMENTS)
+        multi_contract = get_contract(w3, multimint, "mintMulti")
 
         # Wallet
         pk = input("Input Private Key EVM : ").strip()
         acct = Account.from_key(pk)
         print("Using Address : ", acct.address)
 
+        # local journal of every mint tx hash (V2 withdraws in the mint tx: nothing left to resume)
+        import mintJournal
+        journal = mintJournal.get_journal()
+        open_txs = journal.open_txs(chain_id, acct.address, "mint_v2")
+
         # Gas price
         gas_inp = input("Input Custom GWEI/Gas Price ( 0.01/1/10/100 ) Or Leave Blank [Default] : ")
-        gas_price = parse_gas_price_gwei_input(gas_inp, w3)
-        print(f"Using Gas Price : {gwei_from_wei(gas_price)}")
 
         # Mint inputs
         nft_raw = input("Input NFT Contract Address : ").strip()
         nft_addr = to_checksum(nft_raw)
         total = int(input("Total Mint NFT : ").strip())
+        TIMER.mark("inputs_done")
 
-        # read price
+        # Preflight: gas price, block, balance, pending nonce, getPublicDrop in one JSON-RPC batch
         try:
-            tup = sea_contract.functions.getPublicDrop(nft_addr).call()
-            price = int(tup[0])
+            with METRICS.stage("preflight"):
+                snap = run_preflight(w3, sea_contract, acct.address, nft_addr)
         except Exception as e:
             print("Failed Read Price From SeaDrop : ", e)
             return
+        print(f"Preflight : {snap.rpc_requests} Request(s) In {snap.seconds * 1000:.0f} ms")
+        NONCES.seed(chain_id, acct.address, snap.nonce)
+        if open_txs:
+            counts = mintJournal.reconcile(w3, journal, chain_id, acct.address, multimint, "mint_v2")
+            print(f"Journal : {len(open_txs)} Unconfirmed Mint Tx(s) From Last Run : {counts['landed']} Landed, "
+                  f"{counts['failed']} Failed, {counts['dropped']} Dropped, {counts['pending']} Still Pending")
+        # custom GWEI keeps the old fixed legacy gasPrice; blank -> EIP-1559 fee engine
+        fixed_gas_price = parse_gas_price_gwei_input(gas_inp, w3, snap.gas_price) if gas_inp.strip() else None
+        fee_engine = FeeEngine(w3, chain_id, fixed_gas_price)
+        fee_engine.prime(snap.fee_history, snap.base_fee, snap.gas_price)
+        get_tracker(w3).add_block_listener(fee_engine.observe_block)
+        print(f"Using Gas Price : {fee_engine.describe(fee_engine.fees())}")
+        price = snap.drop.mint_price
 
         required_total_cost = price * total
         price_native = float(price) / 1e18
@@ -128,53 +140,39 @@ def main():
         print(f"Price Per Token : {price_native:g} {native_symbol}")
         print(f"Total Cost For {total} : {total_native:g} {native_symbol}")
 
-        bal = w3.eth.get_balance(acct.address)
+        bal = snap.balance
         bal_native = float(bal) / 1e18
         print(f"Wallet Native Balance: {bal_native:g} {native_symbol}")
         if bal < required_total_cost:
             print("Not Enought Native Balance! Exiting...")
             return
 
-        attempt = 0
-        while True:
-            attempt += 1
-            try:
-                print(f"Attempt #{attempt}: Building Mint TX...")
-                value = required_total_cost
-                nonce = w3.eth.get_transaction_count(acct.address)
-                func = multi_contract.functions.mintMulti(total, nft_addr)
-
-                # estimate gas (no fallback)
-                estimated_gas = func.estimate_gas({"from": acct.address, "value": value})
-                print("Estimated gas:", estimated_gas)
-
-                tx = func.build_transaction({
-                    "chainId": chain_id,
-                    "from": acct.address,
-                    "value": value,
-                    "gas": int(estimated_gas * 1.2),
-                    "gasPrice": gas_price,
-                    "nonce": nonce
-                })
-
-                receipt = sign_send_wait(w3, acct, tx)
-                print("Mint Receipt Status : ", receipt.status)
-                if receipt.status == 1:
-                    print("Mint TX Succeeded : ", receipt.transactionHash.hex())
-                    break
-                else:
-                    print("Mint TX Failed Retrying...")
-                    # time.sleep(3)
-                    continue
-
-            except Exception as e:
-                print("Mint Attempt Exception : ", e)
-                print("Retrying...")
-                # time.sleep(3)
-                continue
+        # too big for one mintMulti (block gas / max per wallet) -> parallel shards
+        plan = mintSharder.plan_mint(multi_contract, acct.address, nft_addr, price, total,
+                                     snap.drop.max_total_mintable_by_wallet, snap.block_gas_limit)
+        if len(plan["sizes"]) > 1:
+            print(f"Sharding {total} Into {len(plan['sizes'])} mintMulti Txs : {plan['sizes']} "
+                  f"(~{plan['gas_per_unit']} Gas/Unit{'' if plan['measured'] else ' Assumed'})")
+            rows = mintSharder.run_shards(w3, acct, multi_contract, chain_id, nft_addr, price, plan["sizes"],
+                                          fee_engine, journal=journal, kind="mint_v2")
+            mintSharder.print_shard_report(rows)
+            TIMER.report()
+            return
+
+        def on_sent(tx_hash, nonce, fees):
+            TIMER.mark("first_broadcast")
+            print("Sent Tx : ", tx_hash)
+            journal.record_sent(chain_id, acct.address, nonce, tx_hash, "mint_v2", nft_addr, total, fees)
+
+        receipt = mintLoop.mint_until_landed(w3, acct, multi_contract.functions.mintMulti(total, nft_addr),
+                                             required_total_cost, chain_id, fee_engine, on_sent=on_sent,
+                                             on_receipt=journal.record_receipt)
+        if receipt is not None:
+            TIMER.report()
 
     except Exception as e:
         print("Fatal Error : ", e)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
+    METRICS.report()
\ No newline at end of file
@@ -0,0 +1,357 @@
+from dataclasses import dataclass, field
+from typing import Optional
+import time
+
+from eth_abi import encode, decode
+from eth_account import Account
+from web3 import Web3
+
+from rpcPool import connect_multi
+from mintCommon import SEA_DROP_ADDR, MULTIMINT_ADDR, MULTIMINT_V2_ADDR, to_checksum, load_private_keys
+from preflight import DropConfig
+
+# Multicall3-aggregated preflight ---------------------------------------------------
+# Balance + drop price for many wallets and many drops without one HTTP request per
+# wallet per NFT: getPublicDrop(nft), Multicall3.getEthBalance(wallet) and
+# MultiMint.getMintCount(wallet, nft) are packed into aggregate3 eth_calls (sized to a
+# gas / calldata budget), and all those eth_calls go out as ONE JSON-RPC batch.
+# A chunk the RPC refuses (gas cap, body size) is halved and resent. No Multicall3 on
+# the chain -> the same reads as plain JSON-RPC batches.
+
+MULTICALL3_ADDR = "0xcA11bde05977b3631167028862bE2a173976CA11"     # same address on every chain
+
+CHUNK_GAS = 10_000_000          # eth_call gas caps start around 10M on public RPCs
+MAX_CHUNK_CALLDATA = 64_000     # bytes per aggregate3 call (hex doubles it on the wire)
+FALLBACK_BATCH = 200            # plain requests per JSON-RPC batch without Multicall3
+
+# rough gas per sub-call (cold account / slot reads + ABI overhead)
+CALL_GAS = {"drop": 20_000, "balance": 6_000, "mint_count": 10_000, "timestamp": 1_000, "block": 1_000}
+
+
+def _selector(sig: str) -> bytes:
+    return bytes(Web3.keccak(text=sig))[:4]
+
+
+AGGREGATE3 = _selector("aggregate3((address,bool,bytes)[])")
+GET_ETH_BALANCE = _selector("getEthBalance(address)")
+GET_BLOCK_TIMESTAMP = _selector("getCurrentBlockTimestamp()")
+GET_BLOCK_NUMBER = _selector("getBlockNumber()")
+GET_PUBLIC_DROP = _selector("getPublicDrop(address)")
+GET_MINT_COUNT = _selector("getMintCount(address,address)")
+
+DROP_TYPES = ["(uint80,uint48,uint48,uint16,uint16,bool)"]
+
+
+class MulticallUnavailable(Exception):
+    pass
+
+
+@dataclass
+class SubCall:
+    kind: str                   # drop / balance / mint_count / timestamp / block
+    key: object                 # nft / wallet / (wallet, nft) / None
+    target: str
+    data: bytes
+
+    def size(self) -> int:
+        # target + allowFailure + offset + length words, calldata padded to 32
+        return 4 * 32 + (len(self.data) + 31) // 32 * 32
+
+
+def _decode(kind, raw: bytes):
+    if kind == "drop":
+        drop = DropConfig.from_tuple(decode(DROP_TYPES, raw)[0])
+        # SeaDrop answers all zeros for an NFT it has no public drop for
+        return None if drop.start_time == 0 and drop.end_time == 0 else drop
+    return decode(["uint256"], raw)[0]
+
+
+def _qty(x) -> int:
+    return int(x, 16) if isinstance(x, str) else int(x)
+
+
+def build_calls(wallets, nfts, sea_addr=SEA_DROP_ADDR, multimint_addr=None, multicall_addr=MULTICALL3_ADDR) -> list:
+    calls = [SubCall("timestamp", None, multicall_addr, GET_BLOCK_TIMESTAMP),
+             SubCall("block", None, multicall_addr, GET_BLOCK_NUMBER)]
+    for nft in nfts:
+        calls.append(SubCall("drop", nft, sea_addr, GET_PUBLIC_DROP + encode(["address"], [nft])))
+    for w in wallets:
+        calls.append(SubCall("balance", w, multicall_addr, GET_ETH_BALANCE + encode(["address"], [w])))
+        if multimint_addr:
+            for nft in nfts:
+                calls.append(SubCall("mint_count", (w, nft), multimint_addr,
+                                     GET_MINT_COUNT + encode(["address", "address"], [w, nft])))
+    return calls
+
+
+def chunk_calls(calls, gas_budget=CHUNK_GAS, size_budget=MAX_CHUNK_CALLDATA) -> list:
+    """Consecutive sub-calls grouped so each aggregate3 stays under both budgets."""
+    chunks, cur, gas, size = [], [], 0, 0
+    for c in calls:
+        g, s = CALL_GAS[c.kind], c.size()
+        if cur and (gas + g > gas_budget or size + s > size_budget):
+            chunks.append(cur)
+            cur, gas, size = [], 0, 0
+        cur.append(c)
+        gas += g
+        size += s
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+
+def _aggregate_request(chunk, multicall_addr, block):
+    payload = AGGREGATE3 + encode(["(address,bool,bytes)[]"], [[(c.target, True, c.data) for c in chunk]])
+    return "eth_call", [{"to": multicall_addr, "data": "0x" + payload.hex()}, block]
+
+
+def _send_batch(w3, requests, stats) -> list:
+    """[(method, params)] -> [response dict] in request order; sequential if the RPC refuses batches."""
+    if len(requests) > 1:
+        stats["rpc_requests"] += 1
+        try:
+            resp = w3.provider.make_batch_request(requests)
+            if isinstance(resp, list) and len(resp) == len(requests):
+                return sorted(resp, key=lambda r: r.get("id", 0))
+        except Exception:
+            pass
+        stats["batched"] = False
+    out = []
+    for method, params in requests:
+        stats["rpc_requests"] += 1
+        try:
+            out.append(w3.provider.make_request(method, params))
+        except Exception as e:
+            out.append({"error": {"message": str(e)}})
+    return out
+
+
+def _unpack(chunk, resp) -> list:
+    if resp.get("error") is not None or resp.get("result") is None:
+        raise ValueError(str(resp.get("error")))
+    raw = bytes.fromhex(resp["result"][2:])
+    if not raw:
+        raise MulticallUnavailable("No Multicall3 Contract")
+    results = decode(["(bool,bytes)[]"], raw)[0]
+    if len(results) != len(chunk):
+        raise ValueError("Multicall3 Result Size Mismatch")
+    return results
+
+
+def aggregate(w3, calls, multicall_addr=MULTICALL3_ADDR, block="latest", stats=None) -> list:
+    """
+    [SubCall] -> [(ok, value)] in order. All chunks in one JSON-RPC batch; chunks that
+    error are halved and retried together until single calls fail for real.
+    stats: optional dict, counts "rpc_requests", "chunks", "splits".
+    """
+    stats = stats if stats is not None else {}
+    for k in ("rpc_requests", "chunks", "splits"):
+        stats.setdefault(k, 0)
+    stats.setdefault("batched", True)
+    results = [None] * len(calls)
+    index = {id(c): i for i, c in enumerate(calls)}
+    todo = chunk_calls(calls)
+    while todo:
+        stats["chunks"] += len(todo)
+        responses = _send_batch(w3, [_aggregate_request(ch, multicall_addr, block) for ch in todo], stats)
+        retry = []
+        for chunk, resp in zip(todo, responses):
+            try:
+                decoded = _unpack(chunk, resp)
+            except MulticallUnavailable:
+                raise
+            except Exception as e:
+                if len(chunk) == 1:
+                    results[index[id(chunk[0])]] = (False, str(e))
+                    continue
+                half = len(chunk) // 2
+                retry += [chunk[:half], chunk[half:]]
+                stats["splits"] += 1
+                continue
+            for c, (ok, raw) in zip(chunk, decoded):
+                try:
+                    results[index[id(c)]] = (True, _decode(c.kind, raw)) if ok else (False, "Reverted")
+                except Exception as e:
+                    results[index[id(c)]] = (False, str(e))
+        todo = retry
+    return results
+
+
+def plain_calls(w3, calls, block="latest", stats=None) -> list:
+    """Same reads without Multicall3: eth_getBalance / eth_call / eth_getBlockByNumber in JSON-RPC batches."""
+    stats = stats if stats is not None else {}
+    stats.setdefault("rpc_requests", 0)
+    stats.setdefault("batched", True)
+    requests = []
+    for c in calls:
+        if c.kind == "balance":
+            requests.append(("eth_getBalance", [c.key, block]))
+        elif c.kind in ("timestamp", "block"):
+            requests.append(("eth_getBlockByNumber", [block, False]))
+        else:
+            requests.append(("eth_call", [{"to": c.target, "data": "0x" + c.data.hex()}, block]))
+    results = []
+    for i in range(0, len(requests), FALLBACK_BATCH):
+        part = calls[i:i + FALLBACK_BATCH]
+        for c, resp in zip(part, _send_batch(w3, requests[i:i + FALLBACK_BATCH], stats)):
+            res = resp.get("result")
+            if resp.get("error") is not None or res is None:
+                results.append((False, str(resp.get("error"))))
+            elif c.kind == "balance":
+                results.append((True, _qty(res)))
+            elif c.kind == "timestamp":
+                results.append((True, _qty(res["timestamp"])))
+            elif c.kind == "block":
+                results.append((True, _qty(res["number"])))
+            else:
+                try:
+                    results.append((True, _decode(c.kind, bytes.fromhex(res[2:]))))
+                except Exception as e:
+                    results.append((False, str(e)))
+    return results
+
+
+def pending_nonces(w3, wallets, stats=None) -> dict:
+    """{wallet: pending nonce} (None on error); no Multicall3 equivalent, so plain JSON-RPC batches."""
+    stats = stats if stats is not None else {}
+    stats.setdefault("rpc_requests", 0)
+    stats.setdefault("batched", True)
+    out = {}
+    for i in range(0, len(wallets), FALLBACK_BATCH):
+        part = wallets[i:i + FALLBACK_BATCH]
+        requests = [("eth_getTransactionCount", [w, "pending"]) for w in part]
+        for w, resp in zip(part, _send_batch(w3, requests, stats)):
+            res = resp.get("result")
+            out[w] = None if resp.get("error") is not None or res is None else _qty(res)
+    return out
+
+
+@dataclass
+class WalletMatrix:
+    wallets: list
+    nfts: list
+    total: int                                          # units per wallet per drop
+    timestamp: Optional[int]
+    block_number: Optional[int] = None                  # block the reads were made at
+    drops: dict = field(default_factory=dict)           # nft -> DropConfig / None (not a SeaDrop NFT)
+    balances: dict = field(default_factory=dict)        # wallet -> wei / None
+    mint_counts: dict = field(default_factory=dict)     # (wallet, nft) -> child mints already deployed
+    multicall: bool = True
+    rpc_requests: int = 0
+    sub_calls: int = 0
+    seconds: float = 0.0
+
+    def cost(self, nft, gas_reserve=0) -> Optional[int]:
+        drop = self.drops.get(nft)
+        return None if drop is None else drop.mint_price * self.total + gas_reserve
+
+    def live(self, nft) -> bool:
+        drop = self.drops.get(nft)
+        if drop is None or self.timestamp is None:
+            return False
+        return drop.start_time <= self.timestamp <= drop.end_time
+
+    def can_afford(self, wallet, nft, gas_reserve=0) -> bool:
+        cost, bal = self.cost(nft, gas_reserve), self.balances.get(wallet)
+        return cost is not None and bal is not None and bal >= cost
+
+    def affordable(self, gas_reserve=0) -> dict:
+        """{wallet: [nfts it can pay `total` units of]}"""
+        return {w: [n for n in self.nfts if self.can_afford(w, n, gas_reserve)] for w in self.wallets}
+
+
+def wallet_matrix(w3, wallets, nfts, total=1, sea_addr=SEA_DROP_ADDR, multimint_addr=None,
+                  multicall_addr=MULTICALL3_ADDR, block="latest") -> WalletMatrix:
+    """
+    Balances of every wallet, getPublicDrop of every NFT (and getMintCount per wallet/NFT
+    when multimint_addr is given) in a handful of HTTP requests.
+    """
+    t0 = time.perf_counter()
+    wallets = [to_checksum(w) for w in wallets]
+    nfts = [to_checksum(n) for n in nfts]
+    calls = build_calls(wallets, nfts, to_checksum(sea_addr), to_checksum(multimint_addr) if multimint_addr else None,
+                        to_checksum(multicall_addr))
+    stats = {}
+    multicall = True
+    try:
+        results = aggregate(w3, calls, to_checksum(multicall_addr), block, stats)
+    except MulticallUnavailable:
+        multicall = False
+        results = plain_calls(w3, calls, block, stats)
+
+    m = WalletMatrix(wallets, nfts, int(total), None, multicall=multicall, sub_calls=len(calls))
+    for c, (ok, value) in zip(calls, results):
+        if c.kind == "timestamp":
+            m.timestamp = value if ok else None
+        elif c.kind == "block":
+            m.block_number = value if ok else None
+        elif c.kind == "drop":
+            m.drops[c.key] = value if ok else None
+        elif c.kind == "balance":
+            m.balances[c.key] = value if ok else None
+        elif c.kind == "mint_count":
+            m.mint_counts[c.key] = value if ok else None
+    m.rpc_requests = stats.get("rpc_requests", 0)
+    m.seconds = time.perf_counter() - t0
+    return m
+
+
+def _cell(x) -> str:
+    return "-" if x is None else str(x)
+
+
+def print_matrix(m: WalletMatrix, gas_reserve=0):
+    for i, nft in enumerate(m.nfts):
+        drop = m.drops.get(nft)
+        if drop is None:
+            print(f"[{i + 1}] {nft} : No Public Drop")
+            continue
+        state = "Live" if m.live(nft) else "Not Live"
+        print(f"[{i + 1}] {nft} : {drop.mint_price / 1e18:g} Per Token | Cost For {m.total} : "
+              f"{m.cost(nft, gas_reserve) / 1e18:g} | Max Per Wallet : {drop.max_total_mintable_by_wallet} | {state}")
+    header = "".join(f"{f'[{i + 1}]':>6}" for i in range(len(m.nfts)))
+    if m.mint_counts:
+        # child mints each wallet already deployed through MultiMint, per drop
+        header += "".join(f"{f'M[{i + 1}]':>7}" for i in range(len(m.nfts)))
+    print(f"{'Wallet':<44}{'Balance':>14}{header}")
+    for w in m.wallets:
+        bal = m.balances.get(w)
+        cells = "".join(f"{('YES' if m.can_afford(w, n, gas_reserve) else 'no'):>6}" for n in m.nfts)
+        if m.mint_counts:
+            cells += "".join(f"{_cell(m.mint_counts.get((w, n))):>7}" for n in m.nfts)
+        print(f"{w:<44}{('-' if bal is None else f'{bal / 1e18:.6g}'):>14}{cells}")
+    ok = sum(1 for nfts in m.affordable(gas_reserve).values() if nfts)
+    print(f"Wallets Able To Mint : {ok}/{len(m.wallets)} | {m.sub_calls} Reads In {m.rpc_requests} Request(s) "
+          f"{'(Multicall3)' if m.multicall else '(No Multicall3, Plain Batch)'} | {m.seconds * 1000:.0f} ms")
+
+
+# MAIN -----------------------------------------------------------------------
+def main():
+    try:
+        print('SeaDrop Wallet / Drop Preflight By ADFMIDN Team')
+        print('')
+        rpc = input("Input RPC URL (Comma Separated For Multi RPC) : ").strip()
+        if not rpc:
+            print("RPC URL Required!")
+            return
+        w3, _ = connect_multi(rpc)
+        if w3 is None:
+            print("Unable To Connect To RPC. Exiting...")
+            return
+        keys_path = input("Input Private Keys File (one per line) [keys.txt] : ").strip() or "keys.txt"
+        wallets = [Account.from_key(pk).address for pk in load_private_keys(keys_path)]
+        if not wallets:
+            print("No Private Keys Found! Exiting...")
+            return
+        nfts = [to_checksum(a.strip()) for a in input("NFT Contract Address(es) Comma Separated : ").split(",")
+                if a.strip()]
+        total = int(input("Total Mint NFT Per Wallet [1] : ").strip() or "1")
+        version = input("MultiMint Contract (1 = V1 Manual Withdraw / 2 = V2 Auto Withdraw) [2] : ").strip() or "2"
+        multimint = MULTIMINT_ADDR if version == "1" else MULTIMINT_V2_ADDR
+        print_matrix(wallet_matrix(w3, wallets, nfts, total, multimint_addr=multimint))
+    except Exception as e:
+        print("Fatal Error : ", e)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import threading
+
+# Local nonce allocator -----------------------------------------------------------
+# Syncs once per (chainId, address) from the 'pending' block, then hands out
+# consecutive nonces locally so txs can be sent back to back without one
+# get_transaction_count per send.
+
+NONCE_ERRORS = ("nonce too low", "already known", "known transaction", "replacement transaction underpriced",
+                "nonce has already been used", "invalid nonce", "invalid transaction nonce")
+
+
+def is_nonce_error(err) -> bool:
+    msg = str(err).lower()
+    return any(s in msg for s in NONCE_ERRORS)
+
+
+class NonceManager:
+    """
+    Per (chainId, address) nonce allocator.
+      - next_nonce(w3, address)        -> sync Web3
+      - async_next_nonce(w3, address)  -> AsyncWeb3
+      - release(chain_id, address, nonce): tx was never accepted, nonce can be reused
+      - invalidate(chain_id, address): forget local state, next call resyncs from 'pending'
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next = {}     # (chainId, address) -> next fresh nonce
+        self._free = {}     # (chainId, address) -> set of released nonces below _next
+
+    @staticmethod
+    def _key(chain_id, address):
+        return (int(chain_id), address.lower())
+
+    def _take(self, key):
+        # lowest released nonce first so gaps get filled before going higher
+        free = self._free.get(key)
+        if free:
+            n = min(free)
+            free.discard(n)
+            return n
+        n = self._next[key]
+        self._next[key] = n + 1
+        return n
+
+    def _seed(self, key, pending_count):
+        # keep local state if another caller synced while we were waiting on the RPC
+        if key not in self._next:
+            self._next[key] = int(pending_count)
+            self._free[key] = set()
+
+    def next_nonce(self, w3, address, chain_id=None) -> int:
+        if chain_id is None:
+            chain_id = w3.eth.chain_id
+        key = self._key(chain_id, address)
+        with self._lock:
+            if key in self._next:
+                return self._take(key)
+        pending = w3.eth.get_transaction_count(address, "pending")
+        with self._lock:
+            self._seed(key, pending)
+            return self._take(key)
+
+    async def async_next_nonce(self, w3, address, chain_id=None) -> int:
+        if chain_id is None:
+            chain_id = await w3.eth.chain_id
+        key = self._key(chain_id, address)
+        with self._lock:
+            if key in self._next:
+                return self._take(key)
+        pending = await w3.eth.get_transaction_count(address, "pending")
+        with self._lock:
+            self._seed(key, pending)
+            return self._take(key)
+
+    def seed(self, chain_id, address, pending_count):
+        """Use an already fetched 'pending' count (e.g. from the preflight batch) as the sync point."""
+        if pending_count is None:
+            return
+        with self._lock:
+            self._seed(self._key(chain_id, address), pending_count)
+
+    def release(self, chain_id, address, nonce):
+        """Give back a nonce whose tx was rejected before reaching the mempool."""
+        key = self._key(chain_id, address)
+        with self._lock:
+            if key not in self._next:
+                return
+            nonce = int(nonce)
+            if nonce == self._next[key] - 1:
+                self._next[key] = nonce
+                # collapse any released nonces now sitting at the top
+                free = self._free[key]
+                while self._next[key] - 1 in free:
+                    free.discard(self._next[key] - 1)
+                    self._next[key] -= 1
+            elif nonce < self._next[key]:
+                self._free[key].add(nonce)
+
+    def invalidate(self, chain_id, address):
+        """Drop local state (nonce too low / dropped tx); next allocation resyncs from 'pending'."""
+        key = self._key(chain_id, address)
+        with self._lock:
+            self._next.pop(key, None)
+            self._free.pop(key, None)
+
+    def on_send_error(self, chain_id, address, nonce, err):
+        """Release or resync after send_raw_transaction failed."""
+        if is_nonce_error(err):
+            self.invalidate(chain_id, address)
+        else:
+            self.release(chain_id, address, nonce)
+
+
+# Shared default instance for the scripts
+NONCES = NonceManager()
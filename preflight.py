@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from typing import Optional
+import time
+
+from eth_abi import decode
+
+from feeEngine import REWARD_PERCENTILES
+
+# Batched startup preflight ---------------------------------------------------------
+# All independent startup reads (chainId, gas price, latest block, getPublicDrop,
+# balance, pending nonce) go out as ONE JSON-RPC batch instead of ~7 sequential
+# round-trips. Falls back to sequential calls if the RPC rejects batches; a single read
+# the batch answered with an error (no eth_feeHistory on the chain) is handled on its own.
+
+LAUNCH_TIME = time.perf_counter()
+DROP_TYPES = ["(uint80,uint48,uint48,uint16,uint16,bool)"]
+
+
+@dataclass
+class DropConfig:
+    mint_price: int
+    start_time: int
+    end_time: int
+    max_total_mintable_by_wallet: int
+    fee_bps: int
+    restrict_fee_recipients: bool
+
+    @classmethod
+    def from_tuple(cls, tup) -> "DropConfig":
+        return cls(int(tup[0]), int(tup[1]), int(tup[2]), int(tup[3]), int(tup[4]), bool(tup[5]))
+
+
+@dataclass
+class PreflightSnapshot:
+    chain_id: int
+    gas_price: int                  # node gas price (wei)
+    block_number: int
+    block_timestamp: int
+    block_gas_limit: int
+    base_fee: Optional[int]         # None on non-1559 chains
+    fee_history: Optional[dict] = None
+    balance: Optional[int] = None
+    nonce: Optional[int] = None     # 'pending' transaction count
+    drop: Optional[DropConfig] = None
+    batched: bool = True
+    rpc_requests: int = 1           # HTTP round-trips spent
+    seconds: float = 0.0
+
+
+def _qty(x) -> int:
+    return int(x, 16) if isinstance(x, str) else int(x)
+
+
+def _parse(name, res):
+    """Raw JSON-RPC result -> what the snapshot keeps."""
+    if name == "block":
+        base = res.get("baseFeePerGas")
+        return {"number": _qty(res["number"]), "timestamp": _qty(res["timestamp"]), "gasLimit": _qty(res["gasLimit"]),
+                "baseFeePerGas": _qty(base) if base is not None else None}
+    if name == "fee_history":
+        return {"oldestBlock": _qty(res["oldestBlock"]),
+                "baseFeePerGas": [_qty(b) for b in res.get("baseFeePerGas") or []],
+                "gasUsedRatio": list(res.get("gasUsedRatio") or []),
+                "reward": [[_qty(x) for x in r] for r in res.get("reward") or []]}
+    if name == "drop":
+        return DropConfig.from_tuple(decode(DROP_TYPES, bytes.fromhex(res[2:]))[0])
+    return _qty(res)
+
+
+def run_preflight(w3, sea_contract=None, address=None, nft_addr=None, fee_history_blocks=20) -> PreflightSnapshot:
+    """
+    One batch request for every independent startup read.
+    sea_contract/nft_addr and address are optional; their reads are skipped when missing.
+    fee_history_blocks: eth_feeHistory window to prime the fee engine with (0 = skip).
+    """
+    t0 = time.perf_counter()
+    requests = [
+        ("chain_id", "eth_chainId", []),
+        ("gas_price", "eth_gasPrice", []),
+        ("block", "eth_getBlockByNumber", ["latest", False]),
+    ]
+    if fee_history_blocks:
+        requests.append(("fee_history", "eth_feeHistory", [hex(fee_history_blocks), "latest", list(REWARD_PERCENTILES)]))
+    if address is not None:
+        requests.append(("balance", "eth_getBalance", [address, "latest"]))
+        requests.append(("nonce", "eth_getTransactionCount", [address, "pending"]))
+    if sea_contract is not None and nft_addr is not None:
+        data = sea_contract.encode_abi("getPublicDrop", [nft_addr])
+        requests.append(("drop", "eth_call", [{"to": sea_contract.address, "data": data}, "latest"]))
+
+    batched, rpc_requests = True, 1
+    try:
+        responses = w3.provider.make_batch_request([(method, params) for _, method, params in requests])
+        if not isinstance(responses, list) or len(responses) != len(requests):
+            raise ValueError("Batch Response Size Mismatch")
+        responses = sorted(responses, key=lambda r: r.get("id", 0))
+    except Exception:
+        # RPC without batch support: the same reads one by one
+        batched, rpc_requests = False, 0
+        responses = [{} for _ in requests]
+
+    got = {}
+    for (name, method, params), resp in zip(requests, responses):
+        if resp.get("error") is None and resp.get("result") is not None:
+            got[name] = _parse(name, resp["result"])
+            continue
+        if name == "fee_history" and batched:
+            # chain without eth_feeHistory: fee engine falls back to legacy, the other reads stand
+            got[name] = None
+            continue
+        # only the read that failed goes out again on its own
+        rpc_requests += 1
+        resp = w3.provider.make_request(method, params)
+        if resp.get("error") is not None or resp.get("result") is None:
+            if name == "fee_history":
+                got[name] = None
+                continue
+            raise ValueError(f"Preflight {method} Failed : {resp.get('error')}")
+        got[name] = _parse(name, resp["result"])
+
+    block = got["block"]
+    return PreflightSnapshot(
+        chain_id=got["chain_id"],
+        gas_price=got["gas_price"],
+        block_number=block["number"],
+        block_timestamp=block["timestamp"],
+        block_gas_limit=block["gasLimit"],
+        base_fee=block["baseFeePerGas"],
+        fee_history=got.get("fee_history"),
+        balance=got.get("balance"),
+        nonce=got.get("nonce"),
+        drop=got.get("drop"),
+        batched=batched,
+        rpc_requests=rpc_requests,
+        seconds=time.perf_counter() - t0,
+    )
+
+
+class LaunchTimer:
+    """Launch -> inputs done -> preflight -> first broadcast."""
+
+    def __init__(self):
+        self.marks = {}
+
+    def mark(self, name):
+        # first mark wins (e.g. only the first broadcast counts)
+        self.marks.setdefault(name, time.perf_counter())
+
+    def report(self):
+        inputs = self.marks.get("inputs_done")
+        first = self.marks.get("first_broadcast")
+        if first is None:
+            return
+        print(f"Time From Launch To First Broadcast : {first - LAUNCH_TIME:.3f}s")
+        if inputs is not None:
+            print(f"Time From Last Input To First Broadcast : {first - inputs:.3f}s")
+
+
+TIMER = LaunchTimer()
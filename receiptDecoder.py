@@ -0,0 +1,112 @@
+from web3 import Web3
+
+# Fast mint receipt decoder ---------------------------------------------------------
+# Precompiled topic0 lookup instead of building contracts + get_event_data per log.
+# One pass over receipt.logs: MintDeployed data and indexed Transfer tokenIds are read
+# straight from topics/data, addresses compared as lowercase bytes. Withdraw receipts
+# are read the same way: MintWithdrawSuccess / MintWithdrawFailed per tokenId.
+
+MINT_DEPLOYED_TOPIC = bytes(Web3.keccak(text="MintDeployed(address,address,address)"))
+TRANSFER_TOPIC = bytes(Web3.keccak(text="Transfer(address,address,uint256)"))
+WITHDRAW_SUCCESS_TOPIC = bytes(Web3.keccak(text="MintWithdrawSuccess(address,address,address,uint256)"))
+WITHDRAW_FAILED_TOPIC = bytes(Web3.keccak(text="MintWithdrawFailed(address,address,address,uint256)"))
+
+
+def as_bytes(x) -> bytes:
+    """HexBytes / bytes / '0x..' str -> bytes"""
+    if isinstance(x, (bytes, bytearray)):
+        return bytes(x)
+    s = str(x)
+    return bytes.fromhex(s[2:] if s[:2] in ("0x", "0X") else s)
+
+
+def _addr_bytes(addr) -> bytes:
+    return as_bytes(addr)[-20:]
+
+
+def decode_mint_logs(logs, multimint_addr):
+    """
+    Returns (nft_addr_bytes_or_None, [child address bytes], [(to bytes, tokenId)]).
+    Transfers are kept unfiltered because a child's MintDeployed may come after its Transfer.
+    """
+    mm = _addr_bytes(multimint_addr)
+    nft = None
+    children = []
+    transfers = []
+    for log in logs:
+        topics = log["topics"]
+        if not topics:
+            continue
+        t0 = as_bytes(topics[0])
+        if t0 == TRANSFER_TOPIC:
+            # ERC721 Transfer has tokenId indexed (4 topics); ERC20 Transfer (3 topics) is skipped
+            if len(topics) == 4:
+                transfers.append((as_bytes(topics[2])[-20:], int.from_bytes(as_bytes(topics[3]), "big")))
+        elif t0 == MINT_DEPLOYED_TOPIC and len(topics) == 3:
+            if _addr_bytes(log["address"]) != mm:
+                continue
+            data = as_bytes(log["data"])
+            if len(data) < 32:
+                continue
+            children.append(data[12:32])
+            if nft is None:
+                nft = as_bytes(topics[2])[-20:]
+    return nft, children, transfers
+
+
+def mint_receipt_tokens(receipt, multimint_addr):
+    """
+    (nftAddress_or_None, [child mint addrs], [(child, tokenId)]) - tokenIds with the child
+    that received them (for the journal); addresses checksummed.
+    """
+    nft, children, transfers = decode_mint_logs(receipt["logs"], multimint_addr)
+    cs = {c: Web3.to_checksum_address(c) for c in children}
+    pairs = [(cs[to], tid) for to, tid in transfers if to in cs]
+    nft_addr = Web3.to_checksum_address(nft) if nft is not None else None
+    return nft_addr, list(cs.values()), pairs
+
+
+def parse_mint_receipt_fast(receipt, multimint_addr):
+    """
+    Drop-in for parse_mint_receipt: (nftAddress_or_None, list_of_child_mint_addrs, list_of_tokenIds)
+    Only the returned addresses are checksummed.
+    """
+    nft_addr, child_addrs, pairs = mint_receipt_tokens(receipt, multimint_addr)
+    return nft_addr, child_addrs, [tid for _, tid in pairs]
+
+
+def decode_withdraw_logs(logs, multimint_addr):
+    """
+    Returns ([tokenIds withdrawn], [tokenIds failed], [tokenIds transferred]) from a
+    withdrawAllForNft receipt: MintWithdrawSuccess / MintWithdrawFailed of multimint_addr
+    (data: mintContract, tokenId) and every ERC721 Transfer as a fallback.
+    """
+    mm = _addr_bytes(multimint_addr)
+    ok, failed, transfers = [], [], []
+    for log in logs:
+        topics = log["topics"]
+        if not topics:
+            continue
+        t0 = as_bytes(topics[0])
+        if t0 == TRANSFER_TOPIC:
+            if len(topics) == 4:
+                transfers.append(int.from_bytes(as_bytes(topics[3]), "big"))
+        elif t0 in (WITHDRAW_SUCCESS_TOPIC, WITHDRAW_FAILED_TOPIC):
+            if _addr_bytes(log["address"]) != mm:
+                continue
+            data = as_bytes(log["data"])
+            if len(data) < 64:
+                continue
+            (ok if t0 == WITHDRAW_SUCCESS_TOPIC else failed).append(int.from_bytes(data[32:64], "big"))
+    return ok, failed, transfers
+
+
+def withdraw_receipt_tokens(receipt, multimint_addr, token_ids):
+    """
+    (withdrawn, not withdrawn) split of the token_ids a landed withdraw tx asked for.
+    Without per-token events (older MultiMint) the tokens transferred in the tx count as withdrawn.
+    """
+    ok, _, transfers = decode_withdraw_logs(receipt["logs"], multimint_addr)
+    done = set(ok) if ok else set(transfers)
+    withdrawn = [t for t in token_ids if int(t) in done]
+    return withdrawn, [t for t in token_ids if int(t) not in done]
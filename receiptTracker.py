@@ -0,0 +1,202 @@
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+import threading, time, asyncio
+
+# Event-driven receipt tracker ------------------------------------------------------
+# One background thread follows new blocks (block number polling) and resolves every outstanding tx hash found in each block in one
+# batch (eth_getBlockReceipts). RPC load is O(blocks), not O(txs x polls).
+
+POLL_INTERVAL = 1.0
+RECHECK_BLOCKS = 5      # hashes not seen after this many blocks get one direct receipt lookup
+
+
+def _norm(tx_hash) -> str:
+    if isinstance(tx_hash, (bytes, bytearray)):
+        return "0x" + bytes(tx_hash).hex()
+    h = str(tx_hash).lower()
+    return h if h.startswith("0x") else "0x" + h
+
+
+class ReceiptTracker:
+    """
+    track(tx_hash)  -> concurrent.futures.Future resolving to the receipt
+    wait(tx_hash)   -> blocking helper (same signature as wait_for_transaction_receipt)
+    async_wait(..)  -> awaitable for asyncio code
+    Register the hash (signed.hash) BEFORE send_raw_transaction so a fast block is never missed.
+    """
+
+    def __init__(self, w3, poll_interval=POLL_INTERVAL):
+        self.w3 = w3
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._pending = {}          # hash -> [future, deadline, registered_block, rechecked]
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._last_block = None
+        self._resync_to = None      # block the idle tracker may skip to (a newly tracked tx can't be in it)
+        self._block_receipts_ok = True
+        self.blocks_processed = 0
+        self.rpc_calls = 0
+        self.block_listeners = []   # fn(block) for every block fetched (e.g. fee engine base fee)
+
+    # public ---------------------------------------------------------------------
+    def start(self):
+        if self._thread is not None:
+            return self
+        self._last_block = self._call(self.w3.eth.get_block_number)
+        self._thread = threading.Thread(target=self._run, name="receipt-tracker", daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def head(self):
+        """Last block number the tracker has processed (no RPC call)."""
+        return self._last_block
+
+    def add_block_listener(self, fn):
+        self.block_listeners.append(fn)
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def track(self, tx_hash, timeout=600, callback=None) -> Future:
+        h = _norm(tx_hash)
+        fresh = self._thread is None
+        if fresh:
+            # seeds the head from eth_blockNumber, so the tx is registered at the real block
+            # and the recheck lookup doesn't fire on the first poll
+            self.start()
+        with self._lock:
+            idle = not self._pending
+            entry = self._pending.get(h)
+            if entry is None:
+                fut = Future()
+                entry = [fut, time.time() + timeout, self._last_block, False]
+                self._pending[h] = entry
+        if callback is not None:
+            entry[0].add_done_callback(callback)
+        if idle and not fresh:
+            # tracker was idle: the tx is not sent yet, so it can only land after the
+            # current head -> skip the blocks nobody was waiting for (one RPC call)
+            try:
+                head = self._call(self.w3.eth.get_block_number)
+                with self._lock:
+                    self._resync_to = max(self._resync_to or 0, head)
+            except Exception:
+                pass
+        return entry[0]
+
+    def untrack(self, tx_hash):
+        with self._lock:
+            self._pending.pop(_norm(tx_hash), None)
+
+    def wait(self, tx_hash, timeout=600):
+        fut = self.track(tx_hash, timeout)
+        try:
+            return fut.result(timeout=timeout + self.poll_interval * 2)
+        except FutureTimeout:
+            raise TimeoutError(f"Transaction {_norm(tx_hash)} not mined after {timeout}s")
+
+    async def async_wait(self, tx_hash, timeout=600):
+        return await asyncio.wrap_future(self.track(tx_hash, timeout))
+
+    # internals ------------------------------------------------------------------
+    def _call(self, fn, *args):
+        self.rpc_calls += 1
+        return fn(*args)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            with self._lock:
+                idle = not self._pending
+            if idle:
+                continue
+            try:
+                head = self._call(self.w3.eth.get_block_number)
+                with self._lock:
+                    resync_to, self._resync_to = self._resync_to, None
+                if resync_to is not None:
+                    self._last_block = max(self._last_block, min(resync_to, head))
+                while self._last_block < head and not self._stop.is_set():
+                    self._process_block(self._last_block + 1)
+                    self._last_block += 1
+                self._expire_and_recheck(head)
+            except Exception:
+                # transient RPC error: keep cursor, retry next tick
+                continue
+
+    def _process_block(self, number):
+        self.blocks_processed += 1
+        with self._lock:
+            if not self._pending:
+                return
+        block = self._call(self.w3.eth.get_block, number, False)
+        for fn in self.block_listeners:
+            try:
+                fn(block)
+            except Exception:
+                pass
+        in_block = {_norm(h) for h in block.transactions}
+        with self._lock:
+            hits = [h for h in in_block if h in self._pending]
+        if not hits:
+            return
+        receipts = {}
+        if self._block_receipts_ok:
+            try:
+                for r in self._call(self.w3.eth.get_block_receipts, number):
+                    receipts[_norm(r.transactionHash)] = r
+            except Exception:
+                # node without eth_getBlockReceipts: fall back to per-hit lookups
+                self._block_receipts_ok = False
+        for h in hits:
+            r = receipts.get(h)
+            if r is None:
+                r = self._call(self.w3.eth.get_transaction_receipt, h)
+            self._resolve(h, r)
+
+    def _expire_and_recheck(self, head):
+        now = time.time()
+        with self._lock:
+            items = list(self._pending.items())
+        for h, (fut, deadline, reg_block, rechecked) in items:
+            if now > deadline:
+                with self._lock:
+                    self._pending.pop(h, None)
+                if not fut.done():
+                    fut.set_exception(TimeoutError(f"Transaction {h} not mined before deadline"))
+                continue
+            if not rechecked and head - reg_block >= RECHECK_BLOCKS:
+                # registered after its block was processed (or a reorg): one direct lookup
+                with self._lock:
+                    if h in self._pending:
+                        self._pending[h][3] = True
+                try:
+                    r = self._call(self.w3.eth.get_transaction_receipt, h)
+                except Exception:
+                    r = None
+                if r is not None:
+                    self._resolve(h, r)
+
+    def _resolve(self, h, receipt):
+        with self._lock:
+            entry = self._pending.pop(h, None)
+        if entry is not None and not entry[0].done():
+            entry[0].set_result(receipt)
+
+
+# one tracker per Web3 instance
+_TRACKERS = {}
+_TRACKERS_LOCK = threading.Lock()
+
+
+def get_tracker(w3) -> ReceiptTracker:
+    with _TRACKERS_LOCK:
+        t = _TRACKERS.get(id(w3))
+        if t is None or t.w3 is not w3:
+            t = ReceiptTracker(w3)
+            _TRACKERS[id(w3)] = t
+        return t
@@ -0,0 +1,220 @@
+from concurrent.futures import wait as wait_futures, FIRST_COMPLETED, ThreadPoolExecutor
+import threading, time
+
+from feeEngine import max_fee_per_gas
+from mintMetrics import METRICS
+from nonceManager import NONCES, is_nonce_error
+from receiptTracker import get_tracker
+from retryPolicy import is_already_known
+
+# Stuck-transaction replacement -----------------------------------------------------
+# Sends a tx and, if it isn't included after N blocks, re-signs the SAME nonce with a
+# bumped fee (>= +10% on every fee field, node replacement rule) up to a fee cap.
+# Every hash sent for that nonce is tracked; whichever lands is reported, so one
+# logical mint can never turn into two txs on chain.
+
+STUCK_BLOCKS = 3
+MIN_BUMP = 1.125            # nodes require +10%; 12.5% leaves room for rounding
+FEE_CAP_MULT = 5            # default cap: 5x the first max price per gas
+POLL_INTERVAL = 1.0
+MAX_PIPELINE = 64           # txs in flight at once for send_pipelined
+
+
+class StuckTransactionError(TimeoutError):
+    """
+    No replacement for `nonce` landed before the deadline; reuse the nonce on retry and
+    bump from `fees` (the last fee fields actually broadcast), never from a lower level.
+    """
+
+    def __init__(self, nonce, hashes, timeout, fees=None):
+        super().__init__(f"Nonce {nonce} not mined after {timeout}s ({len(hashes)} tx(s) sent)")
+        self.nonce = nonce
+        self.hashes = hashes
+        self.fees = fees
+
+
+def bump_fees(old: dict, suggested: dict, cap: int = None) -> dict:
+    """
+    New fee fields for a replacement: at least MIN_BUMP x old on every field, or the
+    fee engine suggestion if higher, clipped to cap (max price per gas).
+    """
+    if "gasPrice" in old:
+        price = max(int(old["gasPrice"] * MIN_BUMP), max_fee_per_gas(suggested))
+        if cap:
+            price = min(price, cap)
+        return {"gasPrice": price}
+    tip = max(int(old["maxPriorityFeePerGas"] * MIN_BUMP), int(suggested.get("maxPriorityFeePerGas", 0)))
+    fee = max(int(old["maxFeePerGas"] * MIN_BUMP), int(suggested.get("maxFeePerGas", 0)))
+    if cap:
+        fee = min(fee, cap)
+        tip = min(tip, fee)
+    return {"maxFeePerGas": fee, "maxPriorityFeePerGas": tip}
+
+
+def fee_fields(tx: dict) -> dict:
+    if "gasPrice" in tx:
+        return {"gasPrice": tx["gasPrice"]}
+    return {"maxFeePerGas": tx["maxFeePerGas"], "maxPriorityFeePerGas": tx["maxPriorityFeePerGas"]}
+
+
+def is_bumpable(old: dict, new: dict) -> bool:
+    return all(new[k] >= int(old[k] * 1.1) for k in old)
+
+
+def send_with_replacement(w3, acct, tx: dict, fee_engine=None, stuck_blocks=STUCK_BLOCKS,
+                          fee_cap=None, timeout=600, on_sent=None, kind="tx", resend=False, signed=None) -> dict:
+    """
+    tx must already carry chainId, nonce and fee fields.
+    on_sent(tx_hash_hex, fees): optional callback for every hash broadcast.
+    kind: metrics stage prefix (kind.sign / kind.send / kind.receipt_wait).
+    fee_cap: max price per gas for replacements (default FEE_CAP_MULT x the first one).
+    resend: the nonce was already broadcast by an earlier call, a failed send never releases it.
+    signed: `tx` signed ahead of time (e.g. before a drop), broadcast as is the first time.
+    Returns {"receipt", "landed_hash", "hashes", "replacements"}.
+    Raises StuckTransactionError when nothing landed before `timeout`.
+    """
+    tracker = get_tracker(w3)
+    chain_id, nonce = tx["chainId"], tx["nonce"]
+    hashes = []
+    futures = {}
+    sent_fees = {}
+    deadline = time.time() + timeout
+    level = 0
+    if fee_cap is None:
+        fee_cap = int(max_fee_per_gas(fee_fields(tx)) * FEE_CAP_MULT)
+
+    def broadcast(t, signed=None):
+        if signed is None:
+            with METRICS.stage(kind + ".sign"):
+                signed = acct.sign_transaction(t)
+        fut = tracker.track(signed.hash, timeout=timeout)
+        try:
+            with METRICS.stage(kind + ".send", nonce=nonce):
+                h = w3.eth.send_raw_transaction(signed.raw_transaction)
+        except Exception as e:
+            if not is_already_known(e):
+                tracker.untrack(signed.hash)
+                raise
+            # this exact tx is already in the mempool (resend / another endpoint): it was sent
+            h = signed.hash
+        hx = h.to_0x_hex() if hasattr(h, "to_0x_hex") else str(h)
+        if hx not in hashes:
+            hashes.append(hx)
+        futures[fut] = hx
+        sent_fees.update(fee_fields(t))
+        if on_sent is not None:
+            on_sent(hx, fee_fields(t))
+        return hx
+
+    try:
+        broadcast(tx, signed)
+    except Exception as e:
+        if not resend:
+            NONCES.on_send_error(chain_id, acct.address, nonce, e)
+        raise
+    t_sent = time.perf_counter()
+    tracker.start()
+    sent_block = tracker.head
+
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            for hx in hashes:
+                tracker.untrack(hx)
+            METRICS.observe_stage(kind + ".receipt_wait", time.perf_counter() - t_sent, "timeout")
+            raise StuckTransactionError(nonce, hashes, timeout, dict(sent_fees))
+        done, _ = wait_futures(list(futures), timeout=min(POLL_INTERVAL, remaining), return_when=FIRST_COMPLETED)
+        for fut in done:
+            if fut.exception() is None:
+                landed = futures[fut]
+                # same nonce: the other hashes can never be mined now
+                for hx in hashes:
+                    if hx != landed:
+                        tracker.untrack(hx)
+                METRICS.observe_stage(kind + ".receipt_wait", time.perf_counter() - t_sent, None,
+                                      {"hash": landed, "replacements": len(hashes) - 1})
+                return {
+                    "receipt": fut.result(),
+                    "landed_hash": landed,
+                    "hashes": list(hashes),
+                    "replacements": len(hashes) - 1,
+                }
+            futures.pop(fut)
+        if not futures:
+            METRICS.observe_stage(kind + ".receipt_wait", time.perf_counter() - t_sent, "timeout")
+            raise StuckTransactionError(nonce, hashes, timeout, dict(sent_fees))
+
+        head = tracker.head
+        if head is None or sent_block is None or head - sent_block < stuck_blocks:
+            continue
+
+        # stuck: re-sign the same nonce with bumped fees
+        level += 1
+        old = fee_fields(tx)
+        suggested = fee_engine.fees(level) if fee_engine is not None else {}
+        new = bump_fees(old, suggested, fee_cap)
+        if not is_bumpable(old, new):
+            # fee cap reached: keep waiting on what we already sent
+            sent_block = head
+            continue
+        candidate = dict(tx)
+        for k in old:
+            candidate.pop(k, None)
+        candidate.update(new)
+        try:
+            hx = broadcast(candidate)
+            tx = candidate
+            print(f"Replaced Stuck Tx (nonce {nonce}) : ", hx, fee_fields(tx))
+        except Exception as e:
+            if "underpriced" in str(e).lower():
+                # node wants more: bump from the rejected fees next round
+                tx = candidate
+                print("Replacement Rejected : ", e)
+            elif not is_nonce_error(e):
+                print("Replacement Rejected : ", e)
+            # nonce too low -> one of our hashes got mined, the tracker will resolve it
+        sent_block = head
+
+
+def send_pipelined(w3, acct, txs, fee_engine=None, stuck_blocks=STUCK_BLOCKS, timeout=600, on_sent=None,
+                   kind="tx", resend=(), fee_caps=None) -> list:
+    """
+    Send several txs on consecutive nonces without waiting for each one to land.
+    tx i+1 is broadcast right after tx i (the node never sees a nonce gap); every tx
+    keeps its own stuck-replacement loop. Txs without a nonce get the next one from NONCES.
+    on_sent(index, tx_hash_hex, fees): optional callback for every hash broadcast.
+    resend: indexes of txs whose nonce was already broadcast (see send_with_replacement).
+    fee_caps: optional max price per gas per tx (None -> FEE_CAP_MULT x its own fees).
+    Returns one entry per tx, in order: the send_with_replacement dict or the exception raised.
+    """
+    results = [None] * len(txs)
+    if not txs:
+        return results
+    futures = []
+    with ThreadPoolExecutor(max_workers=min(len(txs), MAX_PIPELINE)) as pool:
+        for i, tx in enumerate(txs):
+            if "nonce" not in tx:
+                tx["nonce"] = NONCES.next_nonce(w3, acct.address, tx["chainId"])
+            gate = threading.Event()
+
+            def run(i=i, tx=tx, gate=gate):
+                def sent(hx, fees):
+                    gate.set()
+                    if on_sent is not None:
+                        on_sent(i, hx, fees)
+                try:
+                    return send_with_replacement(w3, acct, tx, fee_engine, stuck_blocks,
+                                                 fee_cap=fee_caps[i] if fee_caps else None, timeout=timeout,
+                                                 on_sent=sent, kind=kind, resend=i in resend)
+                finally:
+                    gate.set()
+
+            futures.append(pool.submit(run))
+            # first broadcast (or failure) of this nonce before the next one goes out
+            gate.wait()
+        for i, fut in enumerate(futures):
+            try:
+                results[i] = fut.result()
+            except Exception as e:
+                results[i] = e
+    return results
@@ -0,0 +1,149 @@
+from web3.middleware import Web3Middleware
+import random, time, threading
+
+from rpcPool import KNOWN_TX_ERRORS
+
+# Classified retry policy -----------------------------------------------------------
+# Sorts mint-loop errors into classes, each with its own backoff, jitter, attempt
+# budget and abort rule, and counts how many RPC calls every attempt cost, so a drop
+# that isn't live (or an empty wallet) no longer hammers the RPC as fast as it answers.
+
+# class -> (base delay s, max delay s, jitter fraction, attempt budget, abort immediately)
+RETRY_RULES = {
+    "already_known":      (0.0, 0.0, 0.0, 5, False),       # this exact tx is in the mempool: it was sent
+    "revert":             (1.0, 10.0, 0.25, 600, False),   # drop not live yet / sold out / wrong price
+    "insufficient_funds": (0.0, 0.0, 0.0, 0, True),
+    "nonce_too_low":      (0.0, 0.5, 0.0, 5, False),       # resync nonce, retry right away
+    "underpriced":        (0.5, 5.0, 0.25, 10, False),     # bump fee level
+    "timeout":            (1.0, 10.0, 0.25, 5, False),     # bump fee level
+    "rate_limited":       (2.0, 60.0, 0.5, 50, False),
+    "network":            (1.0, 30.0, 0.5, 30, False),
+    "unknown":            (1.0, 30.0, 0.5, 20, False),
+}
+
+_PATTERNS = [
+    ("already_known", KNOWN_TX_ERRORS),
+    ("insufficient_funds", ("insufficient funds", "insufficient balance", "not enough native balance")),
+    ("nonce_too_low", ("nonce too low", "invalid nonce", "invalid transaction nonce", "nonce has already been used")),
+    ("underpriced", ("underpriced", "fee too low", "max fee per gas less than block base fee",
+                     "maxfeepergas", "gas price too low", "tip too low")),
+    ("rate_limited", ("429", "too many requests", "rate limit", "exceeded", "capacity", "-32005")),
+    ("timeout", ("timeout", "timed out", "not mined", "not in the chain after")),
+    ("revert", ("execution reverted", "revert", "out of gas", "gas required exceeds")),
+    ("network", ("connection", "remote end closed", "temporarily unavailable", "502", "503", "504",
+                 "bad gateway", "service unavailable")),
+]
+
+
+def classify(err) -> str:
+    """Error (exception, message or failed receipt marker) -> retry class name."""
+    if isinstance(err, str) and err in RETRY_RULES:
+        return err
+    if isinstance(err, TimeoutError):
+        return "timeout"
+    name = type(err).__name__.lower()
+    if "contractlogicerror" in name or "contractcustomerror" in name or "contractpanicerror" in name:
+        return "revert"
+    if "timeexhausted" in name:
+        return "timeout"
+    msg = f"{name} {err}".lower()
+    for cls, needles in _PATTERNS:
+        if any(n in msg for n in needles):
+            return cls
+    return "unknown"
+
+
+def is_already_known(err) -> bool:
+    """send_raw_transaction error meaning the node already has this exact tx: treat it as sent."""
+    return classify(err) == "already_known"
+
+
+class RpcCounter(Web3Middleware):
+    """Counts every JSON-RPC request that goes through a Web3 instance (sender / tracker threads included)."""
+    total = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def count(cls):
+        with cls._lock:
+            cls.total += 1
+
+    def wrap_make_request(self, make_request):
+        def middleware(method, params):
+            RpcCounter.count()
+            return make_request(method, params)
+        return middleware
+
+    def wrap_make_batch_request(self, make_batch_request):
+        def middleware(requests_info):
+            RpcCounter.count()
+            return make_batch_request(requests_info)
+        return middleware
+
+
+def install_rpc_counter(w3):
+    if "rpc_counter" not in [name for _, name in w3.middleware_onion.middleware]:
+        w3.middleware_onion.add(RpcCounter, name="rpc_counter")
+
+
+class RetryDecision:
+    def __init__(self, cls, delay, abort, used, budget, error):
+        self.cls = cls
+        self.delay = delay
+        self.abort = abort
+        self.used = used
+        self.budget = budget
+        self.error = error
+
+    def __str__(self):
+        if self.abort:
+            return f"{self.cls} (abort after {self.used}/{self.budget})"
+        return f"{self.cls} #{self.used}/{self.budget}, retry in {self.delay:.1f}s"
+
+
+class RetryScheduler:
+    """
+    begin_attempt() / end_attempt(ok) bracket each attempt for the RPC call counters;
+    on_error(err) returns a RetryDecision; wait(decision) sleeps the backoff.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = dict(RETRY_RULES)
+        if rules:
+            self.rules.update(rules)
+        self.counts = {}
+        self.attempts = 0
+        self.rpc_per_attempt = []
+        self._rpc_start = None
+
+    def begin_attempt(self):
+        self.attempts += 1
+        self._rpc_start = RpcCounter.total
+
+    def end_attempt(self):
+        if self._rpc_start is not None:
+            self.rpc_per_attempt.append(RpcCounter.total - self._rpc_start)
+            self._rpc_start = None
+
+    def on_error(self, err) -> RetryDecision:
+        self.end_attempt()
+        cls = classify(err)
+        base, cap, jitter, budget, abort = self.rules[cls]
+        used = self.counts.get(cls, 0) + 1
+        self.counts[cls] = used
+        if abort or used > budget:
+            return RetryDecision(cls, 0.0, True, used, budget, err)
+        delay = min(cap, base * (2 ** (used - 1))) if base else 0.0
+        if jitter and delay:
+            delay *= 1.0 + random.uniform(-jitter, jitter)
+        return RetryDecision(cls, delay, False, used, budget, err)
+
+    def wait(self, decision: RetryDecision):
+        if decision.delay > 0:
+            time.sleep(decision.delay)
+
+    def summary(self) -> str:
+        calls = self.rpc_per_attempt
+        avg = sum(calls) / len(calls) if calls else 0.0
+        classes = ", ".join(f"{k}={v}" for k, v in sorted(self.counts.items())) or "none"
+        return f"Attempts : {self.attempts} | RPC Calls : {sum(calls)} ({avg:.1f}/attempt) | Errors : {classes}"
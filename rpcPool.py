@@ -0,0 +1,328 @@
+from web3 import Web3, HTTPProvider, AsyncHTTPProvider
+from web3.providers.base import JSONBaseProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio, threading, time, re
+
+# Multi-RPC provider ----------------------------------------------------------------
+# Several RPC URLs behind one web3 provider:
+#   - eth_sendRawTransaction is broadcast to every healthy endpoint in parallel
+#   - reads go to the endpoint with the best rolling latency / error-rate score
+#   - endpoints that keep failing are ejected for a cooldown, then retried
+# AsyncMultiRPCProvider is the same pool for AsyncWeb3: it shares the endpoints, their
+# scores and ejections with the sync provider, over one aiohttp session per endpoint.
+
+EWMA_ALPHA = 0.3
+EJECT_AFTER_ERRORS = 3          # consecutive transport errors
+EJECT_ERROR_RATE = 0.5          # rolling error rate
+EJECT_COOLDOWN = 30.0           # seconds
+KNOWN_TX_ERRORS = ("already known", "known transaction", "already imported", "alreadyknown")
+RATE_LIMIT_ERRORS = ("rate limit", "too many requests", "429", "exceeded", "capacity")
+
+
+def split_rpc_urls(inp: str) -> list:
+    """'url1, url2 url3' -> ['url1', 'url2', 'url3'] (order kept, duplicates dropped)"""
+    urls = []
+    for u in re.split(r"[,\s]+", inp or ""):
+        u = u.strip()
+        if u and u not in urls:
+            urls.append(u)
+    return urls
+
+
+class Endpoint:
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.provider = HTTPProvider(url, request_kwargs={"timeout": timeout})
+        self.latency = None         # EWMA seconds
+        self.error_rate = 0.0       # EWMA 0..1
+        self.consecutive_errors = 0
+        self.ejected_until = 0.0
+        self.chain_id = None
+        self.calls = 0
+        self.errors = 0
+
+    def healthy(self, now=None) -> bool:
+        return (now or time.time()) >= self.ejected_until
+
+    def score(self) -> float:
+        # unknown latency sorts after measured ones but before ejected ones
+        lat = self.latency if self.latency is not None else 1.0
+        return lat * (1.0 + 4.0 * self.error_rate)
+
+
+class MultiRPCProvider(JSONBaseProvider):
+
+    def __init__(self, urls, timeout=60, **kwargs):
+        super().__init__(**kwargs)
+        if isinstance(urls, str):
+            urls = split_rpc_urls(urls)
+        if not urls:
+            raise ValueError("At Least One RPC URL Required")
+        self.endpoints = [Endpoint(u, timeout) for u in urls]
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max(2, len(self.endpoints)), thread_name_prefix="rpc")
+
+    def __str__(self):
+        return f"Multi RPC ({len(self.endpoints)} endpoints)"
+
+    # scoring ----------------------------------------------------------------------
+    def _record(self, ep, seconds, ok):
+        with self._lock:
+            ep.calls += 1
+            if ok:
+                ep.latency = seconds if ep.latency is None else (1 - EWMA_ALPHA) * ep.latency + EWMA_ALPHA * seconds
+                ep.error_rate *= (1 - EWMA_ALPHA)
+                ep.consecutive_errors = 0
+            else:
+                ep.errors += 1
+                ep.error_rate = (1 - EWMA_ALPHA) * ep.error_rate + EWMA_ALPHA
+                ep.consecutive_errors += 1
+                if ep.consecutive_errors >= EJECT_AFTER_ERRORS or ep.error_rate >= EJECT_ERROR_RATE:
+                    ep.ejected_until = time.time() + EJECT_COOLDOWN
+
+    def ranked(self) -> list:
+        """Healthy endpoints fastest first; ejected ones last (used only if nothing else is left)."""
+        now = time.time()
+        with self._lock:
+            eps = list(self.endpoints)
+        healthy = sorted((e for e in eps if e.healthy(now)), key=Endpoint.score)
+        ejected = sorted((e for e in eps if not e.healthy(now)), key=lambda e: e.ejected_until)
+        return healthy + ejected
+
+    def best_url(self) -> str:
+        return self.ranked()[0].url
+
+    @staticmethod
+    def _is_endpoint_error(response) -> bool:
+        # execution reverts etc. are valid answers; only rate limits count against the endpoint
+        err = response.get("error") if isinstance(response, dict) else None
+        if not err:
+            return False
+        msg = str(err.get("message", err) if isinstance(err, dict) else err).lower()
+        code = err.get("code") if isinstance(err, dict) else None
+        return code in (-32005, 429) or any(s in msg for s in RATE_LIMIT_ERRORS)
+
+    def _timed_request(self, ep, method, params):
+        t0 = time.perf_counter()
+        try:
+            resp = ep.provider.make_request(method, params)
+        except Exception:
+            self._record(ep, time.perf_counter() - t0, False)
+            raise
+        self._record(ep, time.perf_counter() - t0, not self._is_endpoint_error(resp))
+        return resp
+
+    # provider API -----------------------------------------------------------------
+    def make_request(self, method, params):
+        if method == "eth_sendRawTransaction":
+            return self._broadcast(method, params)
+        last_exc = None
+        last_resp = None
+        # fail over down the ranking on transport errors / rate limits
+        for ep in self.ranked():
+            try:
+                resp = self._timed_request(ep, method, params)
+            except Exception as e:
+                last_exc = e
+                continue
+            if self._is_endpoint_error(resp):
+                last_resp = resp
+                continue
+            return resp
+        if last_resp is not None:
+            return last_resp
+        raise last_exc
+
+    def make_batch_request(self, requests):
+        last_exc = None
+        for ep in self.ranked():
+            t0 = time.perf_counter()
+            try:
+                resp = ep.provider.make_batch_request(requests)
+            except Exception as e:
+                self._record(ep, time.perf_counter() - t0, False)
+                last_exc = e
+                continue
+            self._record(ep, time.perf_counter() - t0, isinstance(resp, list))
+            return resp
+        raise last_exc
+
+    def _broadcast(self, method, params):
+        """Send the same raw tx to every healthy endpoint, return the first accepted response."""
+        now = time.time()
+        targets = [e for e in self.endpoints if e.healthy(now)] or list(self.endpoints)
+        futs = {self._pool.submit(self._timed_request, ep, method, params): ep for ep in targets}
+        first_error = None
+        last_exc = None
+        for fut in as_completed(futs):
+            try:
+                resp = fut.result()
+            except Exception as e:
+                last_exc = e
+                continue
+            accepted = _accepted(resp, params)
+            if accepted is not None:
+                return accepted
+            if first_error is None:
+                first_error = resp
+        if first_error is not None:
+            return first_error
+        raise last_exc
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(r["ok"] for r in self.probe())
+
+    def probe(self) -> list:
+        """
+        Startup health probe: eth_chainId on every endpoint in parallel.
+        Endpoints that fail or disagree with the majority chainId are ejected.
+        """
+        def one(ep):
+            try:
+                resp = self._timed_request(ep, "eth_chainId", [])
+                if "error" in resp:
+                    return {"url": ep.url, "ok": False, "chain_id": None, "latency": None, "error": str(resp["error"])}
+                cid = resp["result"]
+                ep.chain_id = int(cid, 16) if isinstance(cid, str) else int(cid)
+                return {"url": ep.url, "ok": True, "chain_id": ep.chain_id, "latency": ep.latency, "error": None}
+            except Exception as e:
+                return {"url": ep.url, "ok": False, "chain_id": None, "latency": None, "error": str(e)}
+
+        results = list(self._pool.map(one, self.endpoints))
+        ids = [r["chain_id"] for r in results if r["ok"]]
+        majority = max(set(ids), key=ids.count) if ids else None
+        for ep, r in zip(self.endpoints, results):
+            if r["ok"] and r["chain_id"] != majority:
+                r["ok"] = False
+                r["error"] = f"chainId {r['chain_id']} != {majority}"
+            if not r["ok"]:
+                with self._lock:
+                    ep.ejected_until = time.time() + EJECT_COOLDOWN
+        return results
+
+    def stats(self) -> list:
+        now = time.time()
+        with self._lock:
+            return [{
+                "url": e.url, "healthy": e.healthy(now), "latency": e.latency,
+                "error_rate": e.error_rate, "calls": e.calls, "errors": e.errors,
+            } for e in self.endpoints]
+
+
+def _accepted(resp, params):
+    """Broadcast response -> the response to return when the raw tx was accepted, else None."""
+    if "error" not in resp:
+        return resp
+    if any(s in str(resp["error"]).lower() for s in KNOWN_TX_ERRORS):
+        # another endpoint (or an earlier attempt) already delivered it
+        return {"jsonrpc": "2.0", "id": resp.get("id"), "result": Web3.keccak(hexstr=params[0]).to_0x_hex()}
+    return None
+
+
+class AsyncMultiRPCProvider(AsyncJSONBaseProvider):
+    """Async reads / broadcasts over the endpoints of a MultiRPCProvider (same ranking and ejection)."""
+
+    def __init__(self, pool: MultiRPCProvider, **kwargs):
+        super().__init__(**kwargs)
+        self.pool = pool
+        self._providers = {}        # url -> AsyncHTTPProvider
+
+    def __str__(self):
+        return f"Async Multi RPC ({len(self.pool.endpoints)} endpoints)"
+
+    def _provider(self, ep):
+        p = self._providers.get(ep.url)
+        if p is None:
+            p = self._providers[ep.url] = AsyncHTTPProvider(ep.url, request_kwargs={"timeout": ep.timeout})
+        return p
+
+    async def _timed_request(self, ep, method, params):
+        t0 = time.perf_counter()
+        try:
+            resp = await self._provider(ep).make_request(method, params)
+        except Exception:
+            self.pool._record(ep, time.perf_counter() - t0, False)
+            raise
+        self.pool._record(ep, time.perf_counter() - t0, not self.pool._is_endpoint_error(resp))
+        return resp
+
+    async def make_request(self, method, params):
+        if method == "eth_sendRawTransaction":
+            return await self._broadcast(method, params)
+        last_exc = None
+        last_resp = None
+        # ranked again on every call: latency changes and ejections apply mid-run
+        for ep in self.pool.ranked():
+            try:
+                resp = await self._timed_request(ep, method, params)
+            except Exception as e:
+                last_exc = e
+                continue
+            if self.pool._is_endpoint_error(resp):
+                last_resp = resp
+                continue
+            return resp
+        if last_resp is not None:
+            return last_resp
+        raise last_exc
+
+    async def make_batch_request(self, requests):
+        last_exc = None
+        for ep in self.pool.ranked():
+            t0 = time.perf_counter()
+            try:
+                resp = await self._provider(ep).make_batch_request(requests)
+            except Exception as e:
+                self.pool._record(ep, time.perf_counter() - t0, False)
+                last_exc = e
+                continue
+            self.pool._record(ep, time.perf_counter() - t0, isinstance(resp, list))
+            return resp
+        raise last_exc
+
+    async def _broadcast(self, method, params):
+        now = time.time()
+        targets = [e for e in self.pool.endpoints if e.healthy(now)] or list(self.pool.endpoints)
+        first_error = None
+        last_exc = None
+        for fut in asyncio.as_completed([self._timed_request(ep, method, params) for ep in targets]):
+            try:
+                resp = await fut
+            except Exception as e:
+                last_exc = e
+                continue
+            accepted = _accepted(resp, params)
+            if accepted is not None:
+                return accepted
+            if first_error is None:
+                first_error = resp
+        if first_error is not None:
+            return first_error
+        raise last_exc
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(e.healthy() for e in self.pool.endpoints)
+
+    async def disconnect(self):
+        for p in self._providers.values():
+            await p.disconnect()
+        self._providers.clear()
+
+
+def connect_multi(rpc_input: str, timeout=60):
+    """
+    Build Web3 over every URL in rpc_input and run the startup health probe.
+    Returns (w3, probe_results); w3 is None when no endpoint is usable.
+    """
+    provider = MultiRPCProvider(split_rpc_urls(rpc_input), timeout=timeout)
+    results = provider.probe()
+    for r in results:
+        if r["ok"]:
+            print(f"RPC OK   : {r['url']} ({r['latency'] * 1000:.0f} ms)")
+        else:
+            print(f"RPC FAIL : {r['url']} {r['error']}")
+    if not any(r["ok"] for r in results):
+        return None, results
+    return Web3(provider), results
@@ -0,0 +1,208 @@
+from feeEngine import max_fee_per_gas
+from replacementManager import send_pipelined, StuckTransactionError, bump_fees, fee_fields, FEE_CAP_MULT
+from mintMetrics import METRICS
+from nonceManager import NONCES, is_nonce_error
+from receiptDecoder import withdraw_receipt_tokens
+from mintLoop import find_landed
+
+# Gas-aware withdraw batching -------------------------------------------------------
+# withdrawAllForNft(nft, tokenIds) with every tokenId of a big mint eventually needs
+# more gas than a block holds (or a bigger request body than the RPC accepts). Per-token
+# gas is measured with two estimate_gas probes, the list is split into batches that fit
+# a share of the block gas limit, and the batches go out on consecutive nonces at once.
+# Failed batches are re-estimated and resent; a batch whose estimate fails is halved.
+# A landed batch counts only the tokenIds its MintWithdrawSuccess events report; the
+# rest go out again as a smaller batch. A stuck batch is bumped on its own nonce, as in
+# mintSharder, so its tokenIds are never withdrawn by two txs.
+
+BLOCK_GAS_SHARE = 0.5       # a batch may use at most half a block (still gets included next to others)
+MAX_TOKENS_PER_TX = 1000    # 32 bytes calldata per tokenId, stays far below RPC body limits
+GAS_HEADROOM = 1.2          # same margin as the rest of the scripts (estimate * 1.2)
+PROBE_TOKENS = 8
+WITHDRAW_RETRIES = 2
+
+
+def measure_withdraw_gas(multi, sender, nft, token_ids):
+    """(base gas, gas per tokenId) from estimate_gas on 1 and up to PROBE_TOKENS tokens."""
+    one = multi.functions.withdrawAllForNft(nft, token_ids[:1]).estimate_gas({"from": sender})
+    k = min(len(token_ids), PROBE_TOKENS)
+    if k < 2:
+        return 0, one
+    many = multi.functions.withdrawAllForNft(nft, token_ids[:k]).estimate_gas({"from": sender})
+    per_token = max(1, (many - one) // (k - 1))
+    return max(0, one - per_token), per_token
+
+
+def batch_size(base, per_token, block_gas_limit) -> int:
+    budget = int(block_gas_limit * BLOCK_GAS_SHARE / GAS_HEADROOM) - base
+    return max(1, min(MAX_TOKENS_PER_TX, budget // per_token))
+
+
+def split_withdraw(multi, sender, nft, token_ids, block_gas_limit) -> list:
+    """token_ids -> [[tokenIds], ...] each sized to fit the gas budget."""
+    token_ids = list(token_ids)
+    if len(token_ids) <= 1:
+        return [token_ids] if token_ids else []
+    base, per_token = measure_withdraw_gas(multi, sender, nft, token_ids)
+    n = batch_size(base, per_token, block_gas_limit)
+    return [token_ids[i:i + n] for i in range(0, len(token_ids), n)]
+
+
+def _row(label, nft, token_ids):
+    return {"batch": label, "nft": nft, "token_ids": token_ids, "attempts": 0, "split": False,
+            "tx_hash": None, "status": None, "gas_used": None, "error": None, "withdrawn": [],
+            "stuck": None, "fee_cap": None}
+
+
+def send_withdraw_batches(w3, acct, multi, chain_id, batches, fee_engine=None, timeout=600,
+                          retries=WITHDRAW_RETRIES, journal=None) -> list:
+    """
+    batches: [(nft, [tokenIds]), ...]. Every round sends all pending batches pipelined
+    on consecutive nonces; failed ones (send error / revert) are retried up to `retries`
+    times, halved when their gas estimate fails. A batch that timed out unmined keeps its
+    nonce: it is looked up once that nonce is used, otherwise bumped on it, never rebuilt
+    while it can still land. Tokens a landed batch did not withdraw are retried as a new
+    batch. journal: optional MintJournal, gets every hash sent and the tokenIds actually
+    withdrawn.
+    Returns one row per batch actually tried (a halved batch keeps its row with split=True):
+    {"batch", "nft", "token_ids", "attempts", "split", "tx_hash", "status", "gas_used", "error", "withdrawn"}
+    """
+    rows = [_row(str(i + 1), nft, ids) for i, (nft, ids) in enumerate(batches)]
+    todo = list(rows)
+
+    def landed(row, tx_hash, receipt, round_no):
+        """Fills the row; returns the child batch of tokens it missed (or None), appends failures."""
+        row["stuck"] = None
+        row["tx_hash"] = tx_hash
+        row["status"] = receipt.status
+        row["gas_used"] = receipt.gasUsed
+        if journal is not None:
+            journal.record_receipt(tx_hash, receipt)
+        if row["status"] != 1:
+            row["error"] = "Reverted"
+            failed.append(row)
+            return
+        withdrawn, missed = withdraw_receipt_tokens(receipt, multi.address, row["token_ids"])
+        row["withdrawn"] = withdrawn
+        row["error"] = f"{len(missed)} Token(s) Not Withdrawn : {missed}" if missed else None
+        if journal is not None and withdrawn:
+            journal.record_withdraw(chain_id, row["nft"], withdrawn, tx_hash)
+        if missed and round_no < retries:
+            child = _row(f"{row['batch']}.1", row["nft"], missed)
+            rows.append(child)
+            todo_next.append(child)
+
+    for round_no in range(retries + 1):
+        if not todo:
+            break
+        sending, failed, todo_next = [], [], []
+        for row in todo:
+            row["attempts"] += 1
+            stuck = row["stuck"]
+            try:
+                if stuck is not None and stuck["used"]:
+                    receipt = find_landed(w3, stuck["hashes"])
+                    if receipt is not None:
+                        landed(row, receipt.transactionHash.to_0x_hex(), receipt, round_no)
+                        continue
+                    # nonce taken by another tx of this wallet: this batch never withdrew
+                    NONCES.invalidate(chain_id, acct.address)
+                    row["stuck"] = stuck = None
+                if stuck is not None:
+                    # same nonce, bumped from the last fees actually sent
+                    tx = dict(stuck["tx"])
+                    old = fee_fields(tx)
+                    for k in old:
+                        tx.pop(k)
+                    tx.update(bump_fees(old, fee_engine.fees(round_no) if fee_engine is not None else {},
+                                        row["fee_cap"]))
+                    sending.append((row, tx))
+                    continue
+                func = multi.functions.withdrawAllForNft(row["nft"], row["token_ids"])
+                with METRICS.stage("withdraw.estimate_gas"):
+                    gas = func.estimate_gas({"from": acct.address})
+                fees = fee_engine.fees(round_no) if fee_engine is not None else {"gasPrice": int(w3.eth.gas_price)}
+                tx = func.build_transaction({
+                    # placeholder nonce keeps build_transaction offline; send_pipelined assigns the real ones
+                    "chainId": chain_id, "from": acct.address, "gas": int(gas * GAS_HEADROOM), "nonce": 0, **fees,
+                })
+                tx.pop("nonce")
+                if row["fee_cap"] is None:
+                    row["fee_cap"] = int(max_fee_per_gas(fee_fields(tx)) * FEE_CAP_MULT)
+                sending.append((row, tx))
+            except Exception as e:
+                row["error"] = str(e)
+                if len(row["token_ids"]) > 1 and round_no < retries:
+                    # too big for one tx after all: split it, the halves go out next round
+                    half = len(row["token_ids"]) // 2
+                    row["split"] = True
+                    for j, part in enumerate((row["token_ids"][:half], row["token_ids"][half:])):
+                        child = _row(f"{row['batch']}.{j + 1}", row["nft"], part)
+                        rows.append(child)
+                        todo_next.append(child)
+                else:
+                    failed.append(row)
+
+        def on_sent(i, tx_hash, fees):
+            r = sending[i][0]
+            print(f"Sent Withdraw Batch {r['batch']} ({len(r['token_ids'])} Tokens) : ", tx_hash)
+            if journal is not None:
+                journal.record_sent(chain_id, acct.address, sending[i][1]["nonce"], tx_hash, "withdraw", r["nft"],
+                                    len(r["token_ids"]), fees, r["token_ids"])
+
+        results = send_pipelined(w3, acct, [tx for _, tx in sending], fee_engine, timeout=timeout, on_sent=on_sent,
+                                 kind="withdraw", resend={i for i, (row, _) in enumerate(sending) if row["stuck"]},
+                                 fee_caps=[row["fee_cap"] for row, _ in sending])
+        for (row, tx), res in zip(sending, results):
+            if isinstance(res, Exception):
+                row["error"] = str(res)
+                failed.append(row)
+                stuck = row["stuck"]
+                if isinstance(res, StuckTransactionError):
+                    hashes = (stuck["hashes"] if stuck is not None else []) + list(res.hashes)
+                    row["stuck"] = {"tx": {**tx, **(res.fees or {})}, "hashes": list(dict.fromkeys(hashes)),
+                                    "used": False}
+                elif stuck is not None and is_nonce_error(res):
+                    stuck["used"] = True
+                continue
+            landed(row, res["landed_hash"], res["receipt"], round_no)
+        todo = failed + todo_next
+        if todo and round_no < retries:
+            print(f"Retrying {len(todo)} Failed Withdraw Batch(es)...")
+    return rows
+
+
+def withdraw_all(w3, acct, multi, chain_id, nft, token_ids, block_gas_limit, fee_engine=None, timeout=600,
+                 journal=None) -> list:
+    """Split + send for one NFT; returns the batch rows."""
+    batches = [(nft, ids) for ids in split_withdraw(multi, acct.address, nft, token_ids, block_gas_limit)]
+    if len(batches) > 1:
+        print(f"Withdraw Split Into {len(batches)} Batches Of <= {len(batches[0][1])} Tokens")
+    return send_withdraw_batches(w3, acct, multi, chain_id, batches, fee_engine, timeout, journal=journal)
+
+
+def print_batch_report(rows):
+    for row in rows:
+        if row["status"] == 1:
+            state = "OK" if not row["error"] else ("PARTIAL" if row["withdrawn"] else "FAILED")
+        elif row["split"]:
+            state = "SPLIT"
+        elif row["status"] == 0:
+            state = "FAILED"
+        else:
+            state = "ERROR"
+        retried = f" (Attempts {row['attempts']})" if row["attempts"] > 1 else ""
+        print(f"Batch {row['batch']:<6}{state:<8}Tokens : {len(row['token_ids']):<5} "
+              f"Gas Used : {row['gas_used'] or '-':<10}Tx : {row['tx_hash'] or '-'}{retried}")
+        if row["error"] and state != "SPLIT":
+            print("       Error : ", row["error"])
+        if row["stuck"]:
+            print(f"       Still Pending On Nonce {row['stuck']['tx']['nonce']} : ", row["stuck"]["hashes"])
+    done = [r for r in rows if r["status"] == 1]
+    tried = [r for r in rows if not r["split"]]
+    withdrawn = {t for r in done for t in r["withdrawn"]}
+    left = {t for r in tried for t in r["token_ids"]} - withdrawn
+    print(f"Withdraw Batches Landed : {len(done)}/{len(tried)} | Tokens Withdrawn : {len(withdrawn)} | "
+          f"Not Withdrawn : {len(left)} | Gas Used : {sum(r['gas_used'] for r in done)}")
+    if left:
+        print("Tokens Not Withdrawn : ", sorted(left))
@@ -0,0 +1,203 @@
+from web3 import Web3
+import time
+
+from feeEngine import policy_for
+from mintCommon import get_contract, MULTI_FRAGMENTS
+from receiptDecoder import MINT_DEPLOYED_TOPIC, TRANSFER_TOPIC
+from withdrawBatcher import split_withdraw, send_withdraw_batches, print_batch_report
+
+# Bulk withdraw sweeper -------------------------------------------------------------
+# Instead of one pasted mint tx hash per withdraw, scan a block range for every
+# MintDeployed(deployer = us) with chunked eth_getLogs, find which tokenIds each child
+# mint contract still holds (Transfer in minus Transfer out), and withdraw them with
+# as few withdrawAllForNft txs as the block gas allows, sent back to back on
+# consecutive nonces. The default scan window covers the same time span on every
+# chain (block count from the feeEngine block times).
+
+LOG_CHUNK = 2_000           # starting eth_getLogs block span
+MAX_LOG_CHUNK = 100_000
+GROW_BELOW = 1_000          # double the span while responses stay under this many logs
+TOPIC_OR_LIMIT = 100        # child addresses per topic OR-list
+DEFAULT_SCAN_SECONDS = 14 * 24 * 3600   # default look-back: 2 weeks
+
+
+def default_scan_blocks(chain_id) -> int:
+    """Blocks in DEFAULT_SCAN_SECONDS on this chain (100,800 on Ethereum, 4,838,400 on Arbitrum)."""
+    return int(DEFAULT_SCAN_SECONDS / policy_for(chain_id)["block_time"])
+
+
+def _topic_addr(addr) -> str:
+    return "0x" + "00" * 12 + Web3.to_checksum_address(addr)[2:].lower()
+
+
+def _hex(b: bytes) -> str:
+    return "0x" + bytes(b).hex()
+
+
+def get_logs_chunked(w3, flt: dict, from_block: int, to_block: int, chunk=LOG_CHUNK, stats=None) -> list:
+    """
+    eth_getLogs over [from_block, to_block] in adaptive spans: halves the span when the
+    RPC refuses (range / result-size limits), doubles it while responses stay small,
+    never back up to a span that was already refused.
+    stats: optional dict, counts "requests" and "shrinks".
+    """
+    logs = []
+    start, size = int(from_block), int(chunk)
+    ceiling = MAX_LOG_CHUNK     # smallest span the RPC refused, minus one
+    while start <= to_block:
+        end = min(int(to_block), start + size - 1)
+        try:
+            if stats is not None:
+                stats["requests"] = stats.get("requests", 0) + 1
+            part = w3.eth.get_logs({**flt, "fromBlock": start, "toBlock": end})
+        except Exception:
+            if size == 1:
+                raise
+            ceiling = size - 1
+            size = max(1, size // 2)
+            if stats is not None:
+                stats["shrinks"] = stats.get("shrinks", 0) + 1
+            continue
+        logs.extend(part)
+        start = end + 1
+        if len(part) < GROW_BELOW:
+            size = min(ceiling, size * 2)
+    return logs
+
+
+def scan_mint_contracts(w3, multimint_addr, deployer, from_block, to_block, nft_filter=None, stats=None) -> dict:
+    """{nftAddress: [child mint contract, ...]} from MintDeployed logs of `deployer`."""
+    topics = [_hex(MINT_DEPLOYED_TOPIC), _topic_addr(deployer)]
+    if nft_filter:
+        topics.append([_topic_addr(n) for n in nft_filter])
+    logs = get_logs_chunked(w3, {"address": Web3.to_checksum_address(multimint_addr), "topics": topics},
+                            from_block, to_block, stats=stats)
+    found = {}
+    for log in logs:
+        data = bytes(log["data"])
+        if len(log["topics"]) != 3 or len(data) < 32:
+            continue
+        nft = Web3.to_checksum_address(bytes(log["topics"][2])[-20:])
+        child = Web3.to_checksum_address(data[12:32])
+        kids = found.setdefault(nft, [])
+        if child not in kids:
+            kids.append(child)
+    return found
+
+
+def mint_contracts_from_view(w3, multimint_addr, deployer, nft_addrs) -> dict:
+    """Same shape as scan_mint_contracts, from the getMints view (no block range needed)."""
+    c = get_contract(w3, multimint_addr, "getMints")
+    found = {}
+    for nft in nft_addrs:
+        nft = Web3.to_checksum_address(nft)
+        kids = c.functions.getMints(Web3.to_checksum_address(deployer), nft).call()
+        if kids:
+            found[nft] = [Web3.to_checksum_address(k) for k in kids]
+    return found
+
+
+def held_token_ids(w3, nft_addr, children, from_block, to_block, stats=None, touched=None) -> dict:
+    """
+    {tokenId: child} for tokens whose last Transfer in the range moved them INTO a child
+    (already withdrawn tokens drop out).
+    touched: optional set, filled with the children that appear in any Transfer of the range.
+    """
+    child_set = {c.lower() for c in children}
+    events = []
+    for i in range(0, len(children), TOPIC_OR_LIMIT):
+        group = [_topic_addr(c) for c in children[i:i + TOPIC_OR_LIMIT]]
+        for topics in ([_hex(TRANSFER_TOPIC), None, group], [_hex(TRANSFER_TOPIC), group]):
+            events += get_logs_chunked(w3, {"address": Web3.to_checksum_address(nft_addr), "topics": topics},
+                                       from_block, to_block, stats=stats)
+    owner = {}
+    seen = set()
+    for log in sorted(events, key=lambda l: (int(l["blockNumber"]), int(l["logIndex"]))):
+        key = (int(log["blockNumber"]), int(log["logIndex"]))
+        if key in seen or len(log["topics"]) != 4:
+            continue
+        seen.add(key)
+        to = "0x" + bytes(log["topics"][2])[-20:].hex()
+        if touched is not None:
+            for a in (to, "0x" + bytes(log["topics"][1])[-20:].hex()):
+                if a in child_set:
+                    touched.add(a)
+        owner[int.from_bytes(bytes(log["topics"][3]), "big")] = to if to in child_set else None
+    return {tid: Web3.to_checksum_address(o) for tid, o in owner.items() if o is not None}
+
+
+def plan_sweep(w3, multimint_addr, deployer, from_block, to_block=None, nft_filter=None, use_view=False) -> dict:
+    """
+    {"to_block", "mints": {nft: [children]}, "tokens": {nft: [tokenIds]}, "unseen": {nft: [children]},
+     "log_requests"}
+    use_view: enumerate children with getMints (needs nft_filter) instead of a MintDeployed scan.
+    getMints also returns children deployed before from_block; those with no Transfer in the
+    range land in "unseen" (their tokens can only be found by scanning from an earlier block).
+    """
+    if to_block is None:
+        to_block = w3.eth.block_number
+    stats = {}
+    if use_view and nft_filter:
+        mints = mint_contracts_from_view(w3, multimint_addr, deployer, nft_filter)
+    else:
+        mints = scan_mint_contracts(w3, multimint_addr, deployer, from_block, to_block, nft_filter, stats)
+    tokens, unseen = {}, {}
+    for nft, kids in mints.items():
+        touched = set()
+        held = held_token_ids(w3, nft, kids, from_block, to_block, stats, touched)
+        if held:
+            tokens[nft] = sorted(held)
+        missed = [k for k in kids if k.lower() not in touched]
+        if missed:
+            unseen[nft] = missed
+    return {"to_block": to_block, "mints": mints, "tokens": tokens, "unseen": unseen,
+            "log_requests": stats.get("requests", 0), "log_shrinks": stats.get("shrinks", 0)}
+
+
+def sweep(w3, acct, multimint_addr, chain_id, plan: dict, fee_engine=None, block_gas_limit=None, timeout=600,
+          journal=None) -> list:
+    """
+    withdrawAllForNft for every NFT in plan["tokens"]: as few txs as the block gas limit
+    allows, all pipelined on consecutive nonces. Returns the withdrawBatcher rows.
+    """
+    multi = get_contract(w3, multimint_addr, *MULTI_FRAGMENTS)
+    if block_gas_limit is None:
+        block_gas_limit = int(w3.eth.get_block("latest")["gasLimit"])
+    batches, rows = [], []
+    for nft, token_ids in plan["tokens"].items():
+        try:
+            batches += [(nft, ids) for ids in split_withdraw(multi, acct.address, nft, token_ids, block_gas_limit)]
+        except Exception as e:
+            rows.append({"batch": "-", "nft": nft, "token_ids": token_ids, "attempts": 1, "split": False,
+                         "tx_hash": None, "status": None, "gas_used": None, "error": str(e),
+                         "withdrawn": [], "stuck": None})
+    return rows + send_withdraw_batches(w3, acct, multi, chain_id, batches, fee_engine, timeout, journal=journal)
+
+
+def print_sweep_report(plan, rows, seconds=None):
+    minted = sum(len(k) for k in plan["mints"].values())
+    print(f"Mint Contracts Found : {minted} Across {len(plan['mints'])} NFT(s) "
+          f"({plan['log_requests']} eth_getLogs Request(s), {plan['log_shrinks']} Range Shrink(s))")
+    for nft in sorted({r["nft"] for r in rows}):
+        print("NFT : ", nft)
+        print_batch_report([r for r in rows if r["nft"] == nft])
+    for nft, kids in plan.get("unseen", {}).items():
+        print(f"{nft} : {len(kids)} Mint Contract(s) With No Transfer Since The Scan Start Block "
+              f"(Minted Earlier? Scan From An Older Block) : ", kids)
+    if seconds is not None:
+        print(f"Sweep Time : {seconds:.2f}s")
+
+
+def run_sweep(w3, acct, multimint_addr, chain_id, from_block, nft_filter=None, fee_engine=None, use_view=False,
+              block_gas_limit=None, journal=None):
+    t0 = time.time()
+    plan = plan_sweep(w3, multimint_addr, acct.address, from_block, nft_filter=nft_filter, use_view=use_view)
+    if not plan["tokens"]:
+        print_sweep_report(plan, [])
+        print("Nothing To Withdraw.")
+        return plan, []
+    for nft, token_ids in plan["tokens"].items():
+        print(f"Withdrawable : {nft} -> {len(token_ids)} Token(s)")
+    rows = sweep(w3, acct, multimint_addr, chain_id, plan, fee_engine, block_gas_limit, journal=journal)
+    print_sweep_report(plan, rows, time.time() - t0)
+    return plan, rows